@@ -2,22 +2,70 @@ import { Handler, HandlerEvent, HandlerContext } from '@netlify/functions';
 import Database from 'better-sqlite3';
 import path from 'path';
 
-// Haversine distance calculation in SQL
+const MILES_PER_DEGREE_LAT = 69.05;
+const MAX_RESULTS = 100;
+
+// Haversine distance calculation in SQL, limited to the bounding box
+// candidates found through the parish_rtree spatial index
 const SEARCH_QUERY = `
-  SELECT *,
+  SELECT parishes.*,
+    (3959 * acos(
+      cos(radians(?)) * cos(radians(latitude)) *
+      cos(radians(longitude) - radians(?)) +
+      sin(radians(?)) * sin(radians(latitude))
+    )) AS distance
+  FROM parish_rtree
+  JOIN parishes ON parishes.id = parish_rtree.id
+  WHERE parish_rtree.max_lat >= ? AND parish_rtree.min_lat <= ?
+    AND parish_rtree.max_lon >= ? AND parish_rtree.min_lon <= ?
+  HAVING distance < ?
+  ORDER BY distance
+  LIMIT ${MAX_RESULTS}
+`;
+
+// Same search for databases built before parish_rtree existed
+const FALLBACK_QUERY = `
+  SELECT parishes.*,
     (3959 * acos(
       cos(radians(?)) * cos(radians(latitude)) *
       cos(radians(longitude) - radians(?)) +
       sin(radians(?)) * sin(radians(latitude))
     )) AS distance
   FROM parishes
-  WHERE latitude IS NOT NULL
-    AND longitude IS NOT NULL
+  WHERE latitude >= ? AND latitude <= ?
+    AND longitude >= ? AND longitude <= ?
   HAVING distance < ?
   ORDER BY distance
-  LIMIT 100
+  LIMIT ${MAX_RESULTS}
 `;
 
+type Box = [south: number, north: number, west: number, east: number];
+
+// (south, north, west, east) boxes covering a radius around a point, as in
+// the scraper's database.bounding_boxes: usually one box, two when the
+// circle crosses the antimeridian, and every longitude near the poles
+function boundingBoxes(latitude: number, longitude: number, radiusMiles: number): Box[] {
+  const dLat = radiusMiles / MILES_PER_DEGREE_LAT;
+  const south = Math.max(-90, latitude - dLat);
+  const north = Math.min(90, latitude + dLat);
+
+  const cosLat = Math.cos(Math.max(Math.abs(south), Math.abs(north)) * Math.PI / 180);
+  if (cosLat < 1e-6 || radiusMiles / (MILES_PER_DEGREE_LAT * cosLat) >= 180) {
+    return [[south, north, -180, 180]];
+  }
+
+  const dLon = radiusMiles / (MILES_PER_DEGREE_LAT * cosLat);
+  const west = longitude - dLon;
+  const east = longitude + dLon;
+  if (west < -180) {
+    return [[south, north, west + 360, 180], [south, north, -180, east]];
+  }
+  if (east > 180) {
+    return [[south, north, west, 180], [south, north, -180, east - 360]];
+  }
+  return [[south, north, west, east]];
+}
+
 const handler: Handler = async (event: HandlerEvent, context: HandlerContext) => {
   // CORS headers
   const headers = {
@@ -62,9 +110,20 @@ const handler: Handler = async (event: HandlerEvent, context: HandlerContext) =>
     const dbPath = path.join(__dirname, 'parishes.db');
     const db = new Database(dbPath, { readonly: true, fileMustExist: true });
 
-    // Query parishes
-    const stmt = db.prepare(SEARCH_QUERY);
-    const results = stmt.all(latitude, longitude, latitude, searchRadius);
+    // Query parishes box by box; a parish on the antimeridian can match both
+    const hasRtree = db.prepare(
+      "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'parish_rtree'"
+    ).get();
+    const stmt = db.prepare(hasRtree ? SEARCH_QUERY : FALLBACK_QUERY);
+    const found = new Map<number, any>();
+    for (const [south, north, west, east] of boundingBoxes(latitude, longitude, searchRadius)) {
+      for (const row of stmt.all(latitude, longitude, latitude, south, north, west, east, searchRadius) as any[]) {
+        found.set(row.id, row);
+      }
+    }
+    const results = [...found.values()]
+      .sort((a, b) => a.distance - b.distance)
+      .slice(0, MAX_RESULTS);
 
     db.close();
 
@@ -0,0 +1,5 @@
+"""Offline benchmarks for the scraper pipeline.
+
+Run ``python benchmarks/suite.py`` for all of them (see its docstring for
+comparing branches), or any ``bench_*.py`` module on its own.
+"""
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: parish writes, one commit per row vs batched.
+
+Each mode loads the same synthetic parishes into a fresh scratch database:
+
+- ``single``: upsert_parish with its own commit, the pre-batching loop
+- ``upsert_many``: upsert_parish inside DB_BATCH_SIZE-row transactions
+- ``insert_parishes``: executemany bulk insert, as seed.py uses
+- ``resave``: upsert_many over rows that are already stored and unchanged,
+  the common case for a re-scrape
+"""
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.fixtures import synthetic_parishes  # noqa: E402
+from config import DB_BATCH_SIZE  # noqa: E402
+from database import ParishDatabase  # noqa: E402
+
+
+def _single(db: ParishDatabase, rows, batch_size: int):
+    """Upsert row by row, committing each one."""
+    for row in rows:
+        db.upsert_parish(row)
+
+
+def _upsert_many(db: ParishDatabase, rows, batch_size: int):
+    """Upsert in batched transactions."""
+    db.upsert_many(rows, batch_size)
+
+
+def _insert_parishes(db: ParishDatabase, rows, batch_size: int):
+    """Bulk insert with executemany."""
+    db.insert_parishes(rows, batch_size)
+
+
+MODES = {
+    'single': _single,
+    'upsert_many': _upsert_many,
+    'insert_parishes': _insert_parishes,
+    'resave': _upsert_many,  # Same call; bench() stores the rows first
+}
+
+
+def bench(mode: str, rows: int, batch_size: int, wal: bool) -> float:
+    """Time one mode writing ``rows`` parishes into a fresh database."""
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()), \
+            ParishDatabase(str(Path(tmp) / 'parishes.db'), wal=wal) as db:
+        db.initialize()
+        if mode == 'resave':
+            db.insert_parishes(synthetic_parishes(rows), batch_size)
+        started = time.perf_counter()
+        MODES[mode](db, synthetic_parishes(rows), batch_size)
+        return time.perf_counter() - started
+
+
+def run(rows: int = 5000, single_rows: int = 1000, batch_size: int = DB_BATCH_SIZE,
+        wal: bool = False, repeat: int = 3) -> dict:
+    """
+    Benchmark every write mode; return machine-readable results.
+
+    ``single`` commits (and syncs) once per row, so it gets its own,
+    smaller row count to keep the run short; compare modes by rows/second.
+    """
+    results = {'batch_size': batch_size, 'wal': wal, 'modes': {}}
+    for mode in MODES:
+        mode_rows = single_rows if mode == 'single' else rows
+        seconds = min(bench(mode, mode_rows, batch_size, wal) for _ in range(repeat))
+        results['modes'][mode] = {
+            'rows': mode_rows,
+            'seconds': seconds,
+            'rows_per_second': mode_rows / seconds if seconds else None,
+        }
+    single = results['modes']['single']['rows_per_second']
+    for stats in results['modes'].values():
+        stats['speedup'] = stats['rows_per_second'] / single if single else None
+    return results
+
+
+def main(argv=None):
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark single vs batched parish writes.")
+    parser.add_argument('--rows', type=int, default=5000, help="Parishes written by the batched modes")
+    parser.add_argument('--single-rows', type=int, default=1000,
+                        help="Parishes written by the commit-per-row mode")
+    parser.add_argument('--batch-size', type=int, default=DB_BATCH_SIZE, help="Rows per transaction")
+    parser.add_argument('--wal', action='store_true', help="Open the database in WAL mode")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per mode (best is kept)")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run(args.rows, args.single_rows, args.batch_size, args.wal, args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"💾 Batch size {results['batch_size']}, WAL {'on' if results['wal'] else 'off'}")
+    for mode, stats in results['modes'].items():
+        print(f"  {mode:<16} {stats['rows']:>7,} rows {stats['seconds']:8.2f} s "
+              f"{stats['rows_per_second']:>10,.0f} rows/s  x{stats['speedup']:.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Benchmark export_json.py: time and output size of each export mode.
+
+A scratch database is filled with synthetic geocoded parishes (with Mass
+times), then exported as the single parishes.json, as grid tiles and as
+the per-tile next-Mass index. Sizes are reported raw and for every
+compressed sibling written, so a branch that bloats the payload shows up
+next to one that slows the export down.
+"""
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.fixtures import synthetic_parishes  # noqa: E402
+from database import ParishDatabase  # noqa: E402
+from export_json import export_parishes, export_service_index, export_tiles  # noqa: E402
+
+
+def _sizes(directory: Path) -> Dict[str, int]:
+    """Total bytes of the files under a directory, grouped by encoding."""
+    sizes = {'json': 0, 'gzip': 0, 'br': 0, 'files': 0}
+    for path in directory.rglob('*'):
+        if not path.is_file():
+            continue
+        encoding = {'.gz': 'gzip', '.br': 'br'}.get(path.suffix, 'json')
+        sizes[encoding] += path.stat().st_size
+        sizes['files'] += encoding == 'json'
+    return sizes
+
+
+def run(parishes: int = 20000, compress: bool = True, repeat: int = 3) -> dict:
+    """Benchmark every export mode over one scratch database; return machine-readable results."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        db_path = tmp / 'parishes.db'
+        with contextlib.redirect_stdout(io.StringIO()), ParishDatabase(str(db_path)) as db:
+            db.initialize()
+            db.insert_parishes(synthetic_parishes(parishes))
+
+        exports = {
+            'parishes': lambda out: export_parishes(db_path, out / 'parishes.json', compress=compress),
+            'tiles': lambda out: export_tiles(db_path, out, compress=compress),
+            'times': lambda out: export_service_index(db_path, out, compress=compress),
+        }
+        results = {'parishes': parishes, 'compress': compress, 'exports': {}}
+        for name, export in exports.items():
+            best = float('inf')
+            for attempt in range(repeat):
+                out = tmp / f"{name}-{attempt}"
+                started = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    export(out)
+                best = min(best, time.perf_counter() - started)
+            results['exports'][name] = {'seconds': best, **_sizes(out)}
+    return results
+
+
+def main(argv=None):
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark export_json.py time and output size.")
+    parser.add_argument('--parishes', type=int, default=20000, help="Parishes in the scratch database")
+    parser.add_argument('--no-compress', action='store_true', help="Skip the .gz/.br siblings")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per export (best is kept)")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run(args.parishes, not args.no_compress, args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"📦 {results['parishes']:,} parishes, compression {'on' if results['compress'] else 'off'}")
+    for name, stats in results['exports'].items():
+        print(f"  {name:<10} {stats['seconds']:7.2f} s  {stats['files']:>5,} files  "
+              f"{stats['json'] / 1e6:7.2f} MB json  {stats['gzip'] / 1e6:6.2f} MB gz  "
+              f"{stats['br'] / 1e6:6.2f} MB br")
+
+
+if __name__ == '__main__':
+    main()
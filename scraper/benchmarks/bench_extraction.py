@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: contact extraction over a corpus of saved pages.
+
+Compares the original per-field regex searches (recompiled patterns, two
+phone passes, one scan per field) with the single-pass engine in
+scrapers/extraction.py. The corpus is a PageArchive directory and/or a
+directory of .html files; ``--synthetic`` generates one when none is saved.
+
+Scrapers extract per parish container, so besides whole pages the texts
+are also split into blank-line separated blocks and benchmarked that way.
+"""
+import argparse
+import base64
+import gzip
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from scrapers.extraction import first_contacts, scan_contacts  # noqa: E402
+
+
+def legacy_extract(text: str) -> dict:
+    """The pre-engine extract_phone/extract_email/extract_zip, called back to back."""
+    phone = None
+    for pattern in [r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', r'\d{3}[-.\s]\d{3}[-.\s]\d{4}']:
+        match = re.search(pattern, text)
+        if match:
+            phone = match.group(0)
+            break
+    email = re.search(r'[\w\.-]+@[\w\.-]+\.\w+', text)
+    zip_code = re.search(r'\b\d{5}(?:-\d{4})?\b', text)
+    return {
+        'phone': phone,
+        'email': email.group(0) if email else None,
+        'zip': zip_code.group(0) if zip_code else None,
+    }
+
+
+def load_corpus(paths: List[str]) -> List[str]:
+    """Load page texts from archive directories, .jsonl.gz files or .html files."""
+    bodies = []
+    for raw in paths:
+        path = Path(raw)
+        files = sorted(path.rglob('*')) if path.is_dir() else [path]
+        for file in files:
+            if file.name.endswith('.jsonl.gz'):
+                with gzip.open(file, 'rt', encoding='utf-8') as f:
+                    bodies.extend(base64.b64decode(json.loads(line)['body']) for line in f if line.strip())
+            elif file.suffix in ('.html', '.htm'):
+                bodies.append(file.read_bytes())
+    return [BeautifulSoup(body, 'lxml').get_text() for body in bodies]
+
+
+def synthetic_corpus(pages: int, entries: int = 200) -> List[str]:
+    """Generate directory-like page texts with realistic contact blocks."""
+    texts = []
+    for page in range(pages):
+        lines = []
+        for i in range(entries):
+            n = page * entries + i
+            # Not every listing has every field; missing ones are the
+            # expensive case for per-field searches
+            phone = f"Phone: ({800 + n % 99}) {200 + n % 700}-{1000 + n % 9000}\n" if n % 3 else ""
+            email = f"Email: office{n}@parish{n}.org\n" if n % 2 else ""
+            lines.append(
+                f"St. Example Parish {n}\nPastor: Rev. John Doe\n"
+                f"{100 + n % 900} Main St, Springfield, KY {40000 + n % 9999:05d}\n"
+                f"{phone}{email}Mass: Sat 5:00 PM, Sun 8:00 AM & 10:30 AM\n"
+            )
+        texts.append('\n'.join(lines))
+    return texts
+
+
+def bench(func, texts: List[str], repeat: int) -> float:
+    """Return the best total seconds of ``repeat`` passes over the texts."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for text in texts:
+            func(text)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def split_blocks(texts: List[str]) -> List[str]:
+    """Split page texts into container-sized blocks."""
+    return [block for text in texts for block in re.split(r'\n\s*\n', text) if block.strip()]
+
+
+def run(texts: List[str], repeat: int = 5) -> dict:
+    """Benchmark each extractor per page and per block; return machine-readable results."""
+    results = {}
+    for unit, unit_texts in [('page', texts), ('block', split_blocks(texts))]:
+        total_bytes = sum(len(text.encode('utf-8')) for text in unit_texts)
+        unit_results = {'texts': len(unit_texts), 'bytes': total_bytes, 'extractors': {}}
+        for name, func in [('legacy', legacy_extract),
+                           ('first_contacts', first_contacts),
+                           ('scan_contacts', scan_contacts)]:
+            seconds = bench(func, unit_texts, repeat)
+            unit_results['extractors'][name] = {
+                'seconds': seconds,
+                'mb_per_second': total_bytes / seconds / 1e6 if seconds else None,
+            }
+        results[unit] = unit_results
+    return results
+
+
+def main(argv=None):
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark contact extraction.")
+    parser.add_argument('corpus', nargs='*', help="Archive dirs, .jsonl.gz or .html files")
+    parser.add_argument('--synthetic', type=int, default=0, metavar='PAGES',
+                        help="Add this many generated directory pages to the corpus")
+    parser.add_argument('--repeat', type=int, default=5, help="Passes per extractor (best is kept)")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    texts = load_corpus(args.corpus) + synthetic_corpus(args.synthetic)
+    if not texts:
+        parser.error("empty corpus: pass saved pages or --synthetic N")
+
+    results = run(texts, args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for unit, unit_results in results.items():
+        print(f"📚 {unit_results['texts']} {unit}s, {unit_results['bytes']:,} bytes of text")
+        for name, stats in unit_results['extractors'].items():
+            print(f"  {name:<15} {stats['seconds'] * 1000:8.1f} ms  {stats['mb_per_second']:7.1f} MB/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: HTML parse time per page for each BeautifulSoup backend.
+
+Pages come from a PageArchive directory (--archive) or the synthetic
+diocese site in fixtures.py. Listing and detail pages are reported
+separately for the synthetic site, since listings are parsed once per
+diocese page while detail pages dominate large runs.
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bs4 import BeautifulSoup  # noqa: E402
+from bs4.builder import builder_registry  # noqa: E402
+
+from benchmarks.fixtures import recorded_pages, synthetic_site  # noqa: E402
+
+PARSERS = ['lxml', 'html.parser', 'html5lib']
+
+
+def bench(parser: str, bodies: List[bytes], repeat: int) -> float:
+    """Return the best total seconds of ``repeat`` passes parsing every body."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for body in bodies:
+            BeautifulSoup(body, parser)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run(parishes: int = 100, archive: Optional[str] = None, repeat: int = 3,
+        parsers: Optional[List[str]] = None) -> dict:
+    """Benchmark each installed parser over each page group; return machine-readable results."""
+    if archive:
+        groups = {'archive': list(recorded_pages(archive).values())}
+    else:
+        pages, _ = synthetic_site(parishes)
+        groups: Dict[str, List[bytes]] = {'listing': [], 'detail': []}
+        for path, body in pages.items():
+            groups['detail' if path.startswith('/parish/') else 'listing'].append(body)
+
+    results = {}
+    for group, bodies in groups.items():
+        group_results = {'pages': len(bodies), 'bytes': sum(len(body) for body in bodies), 'parsers': {}}
+        for parser in parsers or PARSERS:
+            if builder_registry.lookup(parser) is None:
+                continue
+            seconds = bench(parser, bodies, repeat)
+            group_results['parsers'][parser] = {
+                'seconds': seconds,
+                'ms_per_page': seconds / len(bodies) * 1000 if bodies else None,
+                'mb_per_second': group_results['bytes'] / seconds / 1e6 if seconds else None,
+            }
+        results[group] = group_results
+    return results
+
+
+def main(argv=None):
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Benchmark HTML parse time per page.")
+    parser.add_argument('--parishes', type=int, default=100, help="Parishes in the synthetic site")
+    parser.add_argument('--archive', help="Parse pages from this PageArchive directory instead")
+    parser.add_argument('--parser', action='append', dest='parsers', choices=PARSERS,
+                        help="Backend to benchmark (repeatable; default: all installed)")
+    parser.add_argument('--repeat', type=int, default=3, help="Passes per parser (best is kept)")
+    parser.add_argument('--json', action='store_true', help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = run(args.parishes, args.archive, args.repeat, args.parsers)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for group, group_results in results.items():
+        print(f"📚 {group_results['pages']} {group} pages, {group_results['bytes']:,} bytes")
+        for name, stats in group_results['parsers'].items():
+            print(f"  {name:<12} {stats['ms_per_page']:8.2f} ms/page  {stats['mb_per_second']:7.2f} MB/s")
+
+
+if __name__ == '__main__':
+    main()
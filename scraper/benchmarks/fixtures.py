@@ -0,0 +1,249 @@
+"""Offline stand-ins shared by the benchmarks: a diocese website and a geocoder.
+
+``LocalSite`` serves a dict of pages (path -> body) from a threaded HTTP
+server on 127.0.0.1, so scrapers go through the real requests/socket
+stack without touching the internet. The pages come from
+``synthetic_site`` or, to benchmark real markup, from a recorded
+PageArchive via ``recorded_pages``.
+"""
+import base64
+import gzip
+import hashlib
+import json
+import re
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+from urllib.parse import urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from geocode_cache import GeocodeCache  # noqa: E402
+from geocode_providers import GeocodingProvider  # noqa: E402
+from geocoder import Geocoder  # noqa: E402
+
+STREETS = ['Main St', 'Church St', 'Oak Ave', 'Maple Dr', 'Broadway', 'Elm St', 'Park Rd']
+SAINTS = ['Mary', 'Joseph', 'Patrick', 'Anne', 'Peter', 'Paul', 'Francis', 'Thérèse']
+CITIES = [('Lexington', 'KY', 40500), ('Louisville', 'KY', 40200), ('Covington', 'KY', 41010),
+          ('Owensboro', 'KY', 42301), ('Frankfort', 'KY', 40601)]
+
+# Site chrome repeated on every page; real diocese pages are mostly this
+BOILERPLATE = (
+    '<header><nav><ul>' + ''.join(f'<li><a href="/about/{n}">About section {n}</a></li>' for n in range(40))
+    + '</ul></nav></header>'
+    + '<aside>' + '<p>Lorem ipsum dolor sit amet, consectetur adipiscing elit. </p>' * 30 + '</aside>'
+    + '<footer><p>Office hours: Monday-Friday 9:00 AM - 4:30 PM</p>'
+    + '<script>var analytics = {"id": "UA-0000", "events": []};</script></footer>'
+)
+
+
+def parish_record(n: int) -> Dict[str, str]:
+    """Deterministic fake parish ``n``."""
+    city, state, zip_base = CITIES[n % len(CITIES)]
+    return {
+        'name': f"St. {SAINTS[n % len(SAINTS)]} Parish {n}",
+        'address': f"{100 + n % 900} {STREETS[n % len(STREETS)]}",
+        'city': city,
+        'state': state,
+        'zip': f"{zip_base + n % 90:05d}",
+        'phone': f"({800 + n % 99}) {200 + n % 700}-{1000 + n % 9000}",
+        'email': f"office{n}@parish{n}.org",
+        'mass_times': f"Sat 5:00 PM; Sun {7 + n % 3}:30 AM, 11:00 AM; Mon-Fri 8:00 AM",
+    }
+
+
+def detail_page(n: int) -> bytes:
+    """HTML for parish ``n``'s detail page."""
+    parish = parish_record(n)
+    return (
+        f"<html><head><title>{parish['name']}</title></head><body>{BOILERPLATE}"
+        f"<main><h1>{parish['name']}</h1>"
+        f"<address>{parish['address']}, {parish['city']}, {parish['state']} {parish['zip']}</address>"
+        f"<p class=\"phone\">Phone: {parish['phone']}</p>"
+        f"<p><a href=\"mailto:{parish['email']}\">{parish['email']}</a></p>"
+        f"<div class=\"mass-times\">{parish['mass_times']}</div></main></body></html>"
+    ).encode('utf-8')
+
+
+def listing_page(page: int, pages: int, parishes: range) -> bytes:
+    """HTML for one page of the parish directory, linking to the given parishes."""
+    links = ''.join(
+        f'<li class="entry"><a href="/parish/{n}">{parish_record(n)["name"]}</a></li>'
+        for n in parishes
+    )
+    next_link = f'<a class="next" href="/directory?page={page + 1}">Next</a>' if page < pages else ''
+    return (
+        f"<html><head><title>Directory page {page}</title></head><body>{BOILERPLATE}"
+        f"<main><h1>Find a Parish</h1><ul>{links}</ul>"
+        f"<div class=\"pagination\">{next_link}</div></main></body></html>"
+    ).encode('utf-8')
+
+
+def synthetic_site(parishes: int, per_page: int = 25) -> Tuple[Dict[str, bytes], str]:
+    """
+    Build a paginated diocese directory with one detail page per parish.
+
+    Args:
+        parishes: Number of parishes (detail pages)
+        per_page: Detail links per listing page
+
+    Returns:
+        Tuple of (pages keyed by path, path of the first listing page)
+    """
+    pages = max(1, -(-parishes // per_page))
+    site = {}
+    for page in range(1, pages + 1):
+        first = (page - 1) * per_page
+        body = listing_page(page, pages, range(first, min(first + per_page, parishes)))
+        site[f"/directory?page={page}"] = body
+    site['/directory'] = site['/directory?page=1']
+    for n in range(parishes):
+        site[f"/parish/{n}"] = detail_page(n)
+    # Listing URLs avoid the word 'parish' so find_parish_links skips them
+    return site, '/directory'
+
+
+def _path(url: str) -> str:
+    """Path plus query of a URL, as LocalSite keys pages."""
+    parts = urlsplit(url)
+    return (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+
+
+def recorded_pages(archive_dir: str) -> Dict[str, bytes]:
+    """
+    Load a PageArchive directory as LocalSite pages.
+
+    Links to the archived hosts are made root-relative so the scraper
+    stays on the local server. Pages from several hosts share one path
+    space; later records win on collisions.
+    """
+    records = []
+    for file in sorted(Path(archive_dir).glob('*.jsonl.gz')):
+        with gzip.open(file, 'rt', encoding='utf-8') as f:
+            records.extend(json.loads(line) for line in f if line.strip())
+
+    origins = {f"{urlsplit(entry['url']).scheme}://{urlsplit(entry['url']).netloc}" for entry in records}
+    origin_re = re.compile('|'.join(re.escape(origin) for origin in sorted(origins, key=len, reverse=True))
+                           .encode('utf-8')) if origins else None
+    pages = {}
+    for entry in records:
+        body = base64.b64decode(entry['body'])
+        pages[_path(entry['url'])] = origin_re.sub(b'', body) if origin_re else body
+    return pages
+
+
+def _digest(key: str) -> int:
+    """Stable 64-bit hash of a string."""
+    return int.from_bytes(hashlib.sha1(key.encode('utf-8')).digest()[:8], 'big')
+
+
+def fake_coordinates(key: str) -> Tuple[float, float]:
+    """Deterministic (latitude, longitude) in the continental US for a string."""
+    digest = _digest(key)
+    return 25.0 + (digest % 2400) / 100, -124.0 + (digest // 2400 % 5700) / 100
+
+
+class LocalSite:
+    """
+    Serve pages from memory over HTTP on 127.0.0.1 (use as a context manager).
+
+    Unknown paths get a 404, including robots.txt unless it is in ``pages``.
+    """
+
+    def __init__(self, pages: Dict[str, bytes]):
+        """
+        Args:
+            pages: Response bodies keyed by path (plus query string)
+        """
+        self.pages = pages
+        self.requests = 0
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body go out in separate writes; without this,
+            # Nagle plus delayed ACKs add ~40 ms to every keep-alive request
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                site.requests += 1
+                body = site.pages.get(self.path)
+                self.send_response(200 if body is not None else 404)
+                body = body if body is not None else b'Not found'
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def origin(self) -> str:
+        """Base URL of the server, e.g. http://127.0.0.1:8123."""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path: str) -> str:
+        """Absolute URL for a path on this server."""
+        return self.origin + path
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.server.shutdown()
+        self.server.server_close()
+        return False
+
+
+class FakeProvider(GeocodingProvider):
+    """
+    Deterministic offline geocoder.
+
+    Coordinates are derived from a hash of the address, spread over the
+    continental US. Marked ``remote`` so results go through the geocode
+    cache like Nominatim's do.
+    """
+
+    name = 'fake'
+    remote = True
+
+    def __init__(self, miss_every: Optional[int] = None):
+        """
+        Args:
+            miss_every: Return None for roughly one address in this many
+        """
+        self.miss_every = miss_every
+        self.lookups = 0
+
+    def lookup(self, address: str, city: str = None, state: str = None,
+               zip_code: str = None) -> Optional[Tuple[float, float]]:
+        """Geocode one address without any I/O."""
+        self.lookups += 1
+        key = '|'.join(part or '' for part in (address, city, state, zip_code))
+        if self.miss_every and _digest(key) % self.miss_every == 0:
+            return None
+        return fake_coordinates(key)
+
+
+def fake_geocoder(cache_path: str, metrics=None) -> Geocoder:
+    """A Geocoder using FakeProvider and a throwaway cache database."""
+    return Geocoder(cache=GeocodeCache(cache_path), providers=[FakeProvider()], metrics=metrics)
+
+
+def synthetic_parishes(count: int, diocese: str = 'Benchmark Diocese',
+                       coordinates: bool = True) -> Iterator[Dict]:
+    """Parish rows as the scrapers produce them, optionally with coordinates."""
+    for n in range(count):
+        parish = {'diocese': diocese, 'country': 'USA', **parish_record(n)}
+        if coordinates:
+            parish['latitude'], parish['longitude'] = fake_coordinates(parish['name'])
+        yield parish
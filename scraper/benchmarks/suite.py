@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Run every offline benchmark and save the results for comparing branches.
+
+Usage:
+    git checkout main && python benchmarks/suite.py --output main.json
+    git checkout my-branch && python benchmarks/suite.py --output branch.json --compare main.json
+
+Nothing touches the network: pages come from a local HTTP stand-in and
+geocoding from FakeProvider (see fixtures.py). The results file records
+the git commit, Python version and machine next to each benchmark's own
+results, and ``--compare`` prints the change in every throughput and
+timing figure between two such files.
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks import bench_db, bench_export, bench_extraction, bench_parse, bench_pipeline  # noqa: E402
+
+# Benchmark sizes: the default run takes a few minutes, --quick seconds
+SIZES = {
+    'default': {'parishes': 500, 'pages': 50, 'rows': 5000, 'single_rows': 1000, 'export': 20000, 'repeat': 3},
+    'quick': {'parishes': 100, 'pages': 10, 'rows': 1000, 'single_rows': 200, 'export': 2000, 'repeat': 1},
+}
+
+BENCHMARKS = {
+    'pipeline': lambda size: bench_pipeline.run(parishes=size['parishes'], repeat=size['repeat']),
+    'parse': lambda size: bench_parse.run(parishes=size['pages'], repeat=size['repeat']),
+    'extraction': lambda size: bench_extraction.run(
+        bench_extraction.synthetic_corpus(size['pages']), size['repeat']),
+    'db': lambda size: bench_db.run(size['rows'], size['single_rows'], repeat=size['repeat']),
+    'export': lambda size: bench_export.run(size['export'], repeat=size['repeat']),
+}
+
+# Leaf keys worth comparing, and whether a bigger number is better
+HIGHER_IS_BETTER = {'per_second': True, 'speedup': True, 'seconds': False, 'ms_per_page': False,
+                    'json': False, 'gzip': False, 'br': False}
+NOISE_PERCENT = 5  # Smaller changes are not flagged in --compare output
+
+
+def git_commit() -> Dict[str, str]:
+    """Current commit and branch of the checkout, if it is a git repository."""
+    info = {}
+    for key, command in [('commit', ['git', 'rev-parse', 'HEAD']),
+                         ('branch', ['git', 'rev-parse', '--abbrev-ref', 'HEAD'])]:
+        try:
+            info[key] = subprocess.run(command, capture_output=True, text=True, check=True,
+                                       cwd=Path(__file__).parent).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            pass
+    return info
+
+
+def run(names=None, quick: bool = False) -> dict:
+    """Run the selected benchmarks (default: all); return the results document."""
+    size = SIZES['quick' if quick else 'default']
+    results = {
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'git': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'size': 'quick' if quick else 'default',
+        'benchmarks': {},
+    }
+    for name in names or BENCHMARKS:
+        print(f"⏱️  {name}...", file=sys.stderr)
+        started = time.perf_counter()
+        results['benchmarks'][name] = BENCHMARKS[name](size)
+        print(f"   done in {time.perf_counter() - started:.1f} s", file=sys.stderr)
+    return results
+
+
+def flatten(data, prefix: str = '') -> Iterator[Tuple[str, float]]:
+    """Yield (dotted.path, number) for every numeric leaf."""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            yield from flatten(value, f"{prefix}.{key}" if prefix else key)
+    elif isinstance(data, (int, float)) and not isinstance(data, bool):
+        yield prefix, data
+
+
+def _direction(path: str):
+    """True/False if a higher value is better/worse for this metric, None if not compared."""
+    leaf = path.rsplit('.', 1)[-1]
+    for suffix, higher in HIGHER_IS_BETTER.items():
+        if leaf == suffix or leaf.endswith(f"_{suffix}"):
+            return higher
+    return None
+
+
+def compare(old: dict, new: dict) -> str:
+    """Table of the change in every comparable metric from ``old`` to ``new``."""
+    before = dict(flatten(old['benchmarks']))
+    lines = [f"{'Metric':<58}{'Before':>12}{'After':>12}{'Change':>9}"]
+    for path, value in flatten(new['benchmarks']):
+        higher = _direction(path)
+        if higher is None or path not in before or not before[path]:
+            continue
+        change = (value - before[path]) / before[path] * 100
+        better = change > 0 if higher else change < 0
+        marker = '  ' if abs(change) < NOISE_PERCENT else '✅' if better else '❌'
+        lines.append(f"{path:<58}{before[path]:>12.4g}{value:>12.4g}{change:>+8.1f}% {marker}")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    """Main function."""
+    parser = argparse.ArgumentParser(description="Run the offline benchmark suite.")
+    parser.add_argument('--only', action='append', choices=list(BENCHMARKS),
+                        help="Run just this benchmark (repeatable)")
+    parser.add_argument('--quick', action='store_true', help="Small inputs and one run each")
+    parser.add_argument('--output', metavar='FILE', help="Write the results JSON here")
+    parser.add_argument('--compare', metavar='FILE', help="Compare against an earlier results file")
+    args = parser.parse_args(argv)
+
+    results = run(args.only, args.quick)
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"✅ Results written to {args.output}", file=sys.stderr)
+    else:
+        print(json.dumps(results, indent=2))
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f"\n📊 {baseline['git'].get('commit', '?')[:10]} → {results['git'].get('commit', '?')[:10]}")
+        print(compare(baseline, results))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,10 @@
 """Configuration for diocese scrapers."""
+from pathlib import Path
+
+# HTML parser backend: 'lxml' (fast, C), 'html5lib' (most lenient) or
+# 'html.parser' (pure Python). A diocese entry may override it with a
+# 'parser' key; unavailable backends fall back to 'html.parser'.
+DEFAULT_HTML_PARSER = 'lxml'
 
 DIOCESES = [
     {'name': 'Diocese of Lexington', 'state': 'KY', 'country': 'USA', 'website': 'https://www.cdlex.org', 'parishes_page': 'https://www.cdlex.org/parishes', 'scraper': 'lexington'},
@@ -21,3 +27,85 @@ DIOCESES = [
     {'name': 'Archdiocese of Galveston-Houston', 'state': 'TX', 'country': 'USA', 'website': 'https://www.archgh.org', 'parishes_page': 'https://www.archgh.org/parishes', 'scraper': 'generic'},
     {'name': 'Archdiocese of San Antonio', 'state': 'TX', 'country': 'USA', 'website': 'https://www.archsa.org', 'parishes_page': 'https://www.archsa.org/parishes', 'scraper': 'generic'},
 ]
+
+# Sitemap discovery (see scrapers/discovery.py): only sitemap URLs whose
+# path matches this pattern are treated as parish pages
+SITEMAP_URL_PATTERN = r'parish|church'
+
+# Defaults for 'generic' dioceses (see scrapers/generic.py). A diocese entry
+# may override any key with its own 'selectors' dict (and 'fields' entries
+# individually). Selectors are CSS; 'css@attr' reads an attribute instead of
+# the text. schema.org JSON-LD/microdata on a page is used before these.
+GENERIC_SELECTORS = {
+    'container': '.parish, .church, .parish-listing, .parish-item',  # One parish each on a listing page
+    'link': None,  # Parish detail links; None uses find_parish_links heuristics
+    'next_page': '.pagination a.next, a.next',  # rel=next and numbered pages are also followed
+    'sitemaps': 'fallback',  # Read robots.txt sitemaps: 'always', 'fallback' (no links found) or 'never'
+    'sitemap_pattern': SITEMAP_URL_PATTERN,
+    'fields': {
+        'name': 'h1, h2, h3, h4, .parish-name, .title',
+        'address': 'address, .address',
+        'phone': '.phone, a[href^="tel:"]@href',
+        'email': 'a[href^="mailto:"]@href',
+        'website': 'a.website@href, a.parish-website@href',
+        'mass_times': '.mass-times, .schedule',
+    },
+}
+GENERIC_MAX_PAGES = 25  # Listing pages followed per diocese
+
+# Concurrent crawl limits (see crawler.py)
+MAX_WORKERS = 8  # Dioceses crawled at the same time
+MAX_REQUESTS_PER_HOST = 2  # Simultaneous requests to any single host
+DETAIL_WORKERS = 4  # Parish detail pages fetched at once within a diocese
+
+# Persistent geocode cache (see geocode_cache.py)
+GEOCODE_CACHE_PATH = str(Path(__file__).parent / "geocode_cache.db")
+GEOCODE_CACHE_TTL_DAYS = 180  # How long a resolved address is trusted
+GEOCODE_NEGATIVE_TTL_DAYS = 14  # How long to remember addresses that failed
+
+# Geocoding backends, tried in order (see geocode_providers.py). 'gazetteer'
+# (street level) and 'centroid' (ZIP/city) read the offline database built
+# by gazetteer.py; 'nominatim' calls OpenStreetMap. An air-gapped build can
+# use ['gazetteer', 'centroid'].
+GEOCODE_PROVIDERS = ['nominatim']
+GAZETTEER_PATH = str(Path(__file__).parent / "gazetteer.db")
+
+# Bulk database writes (see ParishDatabase.insert_parishes)
+DB_BATCH_SIZE = 1000  # Rows written per transaction
+SEED_BATCH_SIZE = 20000  # Rows per transaction when loading seed files (see seed.py)
+
+# Per-URL HTTP validators for conditional re-scrapes (see scrapers/page_state.py)
+PAGE_STATE_PATH = str(Path(__file__).parent / "page_state.db")
+
+# Raw page archive for offline parser runs (see scrapers/archive.py)
+ARCHIVE_DIR = str(Path(__file__).parent / "archive")
+
+# Where main.py writes parishes; --replay runs default to a scratch database
+# and ledger so archived pages never overwrite live data
+DB_PATH = str(Path(__file__).parent / "parishes.db")
+REPLAY_DB_PATH = str(Path(__file__).parent / "replay.db")
+REPLAY_LEDGER_PATH = str(Path(__file__).parent / "replay_ledger.db")
+
+# Run ledger for resumable scrapes (see run_ledger.py)
+RUN_LEDGER_PATH = str(Path(__file__).parent / "run_ledger.db")
+
+# Per-event pipeline timings, written with main.py --metrics (see metrics.py)
+METRICS_PATH = str(Path(__file__).parent / "metrics.jsonl")
+
+# Politeness (see politeness.py)
+USER_AGENT = 'CatholicMassFinderBot/1.0 (Educational Project)'
+DEFAULT_REQUESTS_PER_SECOND = 0.5  # Per host, unless robots.txt asks for less
+HOST_RATE_LIMITS = {
+    'nominatim.openstreetmap.org': 1.0,  # Nominatim usage policy: 1 request/second
+}
+
+# Background geocoding stage (see geocode_queue.py)
+GEOCODE_MAX_ATTEMPTS = 3  # Lookups before a queued parish is given up on
+GEOCODE_RETRY_MINUTES = 60  # Wait before retrying a failed lookup; doubles with each failure
+
+# Duplicate parish detection (see dedup.py)
+DEDUP_CELL_DEGREES = 0.01  # Blocking grid cell (~0.7 mile); neighbours are compared too
+DEDUP_MAX_MILES = 0.5  # Farther apart than this is a different church
+DEDUP_MIN_SCORE = 0.8  # Name similarity (0-1) needed to call two rows the same parish
+DEDUP_SAME_SPOT_MILES = 0.02  # Same diocese and this close (~100 ft) lowers the name bar...
+DEDUP_SAME_SPOT_MIN_SCORE = 0.5  # ...to this, or to none for an identical street address
@@ -0,0 +1,80 @@
+"""Concurrent crawl engine for fetching many dioceses at once."""
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from config import MAX_WORKERS, MAX_REQUESTS_PER_HOST
+
+
+class HostLimiter:
+    """Caps the number of simultaneous requests made to each host."""
+
+    def __init__(self, per_host: int = MAX_REQUESTS_PER_HOST):
+        """Initialize limiter with a per-host concurrency limit."""
+        self.per_host = per_host
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        """Get (or create) the semaphore guarding a host."""
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.per_host)
+            return self._semaphores[host]
+
+    @contextmanager
+    def limit(self, url: str):
+        """Hold one of the host's request slots for the duration of the block."""
+        host = urlparse(url).netloc.lower()
+        with self._semaphore(host):
+            yield
+
+
+CrawlResult = Tuple[Dict, Optional[List[Dict]], Optional[Exception], int]
+
+
+def crawl_dioceses(dioceses: Iterable[Dict],
+                   scraper_factory: Callable,
+                   max_workers: int = MAX_WORKERS,
+                   per_host: int = MAX_REQUESTS_PER_HOST) -> Iterator[CrawlResult]:
+    """
+    Scrape parish listings for many dioceses concurrently.
+
+    Only the network and parsing work runs in the pool. Results are yielded
+    back to the calling thread as each diocese finishes, so the caller can
+    keep geocoding and all SQLite writes on a single thread.
+
+    Args:
+        dioceses: Diocese config dictionaries (see config.DIOCESES)
+        scraper_factory: Callable taking (diocese_config, host_limiter) and
+            returning a scraper, or None if no scraper is available
+        max_workers: Maximum number of dioceses fetched at the same time
+        per_host: Maximum simultaneous requests to any single host
+
+    Yields:
+        Tuples of (diocese_config, parishes, error, unchanged_pages).
+        ``parishes`` is None when no scraper is available; ``error`` is set
+        when the scrape raised; ``unchanged_pages`` counts detail pages
+        skipped because they had not changed.
+    """
+    host_limiter = HostLimiter(per_host)
+
+    def run(diocese_config: Dict) -> Tuple[Optional[List[Dict]], int]:
+        scraper = scraper_factory(diocese_config, host_limiter)
+        if not scraper:
+            return None, 0
+        parishes = scraper.scrape_parish_list(diocese_config['parishes_page'])
+        return parishes, scraper.unchanged_pages
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(run, diocese): diocese for diocese in dioceses}
+        for future in as_completed(futures):
+            diocese_config = futures[future]
+            try:
+                parishes, unchanged = future.result()
+            except Exception as e:
+                yield diocese_config, None, e, 0
+            else:
+                yield diocese_config, parishes, None, unchanged
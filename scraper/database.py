@@ -1,19 +1,119 @@
 """Database operations for parish data."""
 import sqlite3
 import json
-from datetime import datetime
+import math
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from itertools import groupby, islice
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterable, Iterator, List
+
+from config import DB_BATCH_SIZE, GEOCODE_MAX_ATTEMPTS, GEOCODE_RETRY_MINUTES
+from metrics import default_metrics
+from schedule import WEEKDAYS, MassTime, format_time, parse_schedule, worship_times
+from tiles import TILE_DEGREES, tile_key, tiles_in_box
+from timezones import MINUTES_PER_DAY, WEEK_MINUTES, timezone_for, week_minute, zone
+
+# PRAGMA user_version of a fully migrated database; initialize() runs the
+# one-time migrations for anything older (1: merge duplicate parishes)
+SCHEMA_VERSION = 1
+
+# Columns added to scrape_log after its first release, with their types;
+# initialize() adds any that an older database lacks
+SCRAPE_LOG_MIGRATIONS = {
+    'duration_seconds': 'REAL',
+    'wait_seconds': 'REAL',
+    'fetch_seconds': 'REAL',
+    'parse_seconds': 'REAL',
+    'extract_seconds': 'REAL',
+    'save_seconds': 'REAL',
+    'pages_fetched': 'INTEGER',
+    'bytes_fetched': 'INTEGER',
+}
+
+# Parish columns that decide a parish's service_index tile and time zone
+LOCATION_COLUMNS = frozenset({'latitude', 'longitude', 'state', 'country'})
+
+SERVICE_INDEX_QUERY = """
+    SELECT p.id, p.latitude, p.longitude, p.state, p.country, s.weekday, s.minute_of_day, s.type
+    FROM mass_schedule s JOIN parishes p ON p.id = s.parish_id
+    WHERE p.latitude IS NOT NULL AND p.longitude IS NOT NULL {where}
+    ORDER BY p.id
+"""
+SERVICE_INDEX_INSERT = ("INSERT OR IGNORE INTO service_index (tile, type, timezone, week_minute, parish_id) "
+                        "VALUES (?, ?, ?, ?, ?)")
+
+EARTH_RADIUS_MILES = 3959
+MILES_PER_DEGREE_LAT = 69.05
+
+
+def haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two coordinates in miles."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_boxes(latitude: float, longitude: float, radius_miles: float) -> List[tuple]:
+    """
+    Return (south, north, west, east) boxes covering a radius around a point.
+    
+    Usually one box; two when the circle crosses the antimeridian.
+    """
+    d_lat = radius_miles / MILES_PER_DEGREE_LAT
+    south, north = max(-90.0, latitude - d_lat), min(90.0, latitude + d_lat)
+    
+    cos_lat = math.cos(math.radians(max(abs(south), abs(north))))
+    if cos_lat < 1e-6 or radius_miles / (MILES_PER_DEGREE_LAT * cos_lat) >= 180:
+        return [(south, north, -180.0, 180.0)]
+        
+    d_lon = radius_miles / (MILES_PER_DEGREE_LAT * cos_lat)
+    west, east = longitude - d_lon, longitude + d_lon
+    if west < -180:
+        return [(south, north, west + 360, 180.0), (south, north, -180.0, east)]
+    if east > 180:
+        return [(south, north, west, 180.0), (south, north, -180.0, east - 360)]
+    return [(south, north, west, east)]
+
+
+def _service_entries(rows: Iterable[sqlite3.Row], tile_size: float) -> Iterator[tuple]:
+    """service_index rows for SERVICE_INDEX_QUERY results, resolving each parish's zone once."""
+    for _, services in groupby(rows, key=lambda row: row['id']):
+        services = list(services)
+        parish = services[0]
+        tile = tile_key(parish['latitude'], parish['longitude'], tile_size)
+        timezone_name = timezone_for(parish['latitude'], parish['longitude'], parish['state'],
+                                     parish['country'])
+        for service in services:
+            yield (tile, service['type'], timezone_name,
+                   service['weekday'] * MINUTES_PER_DAY + service['minute_of_day'],
+                   parish['id'])
 
 
 class ParishDatabase:
     """Handles all database operations for parish data."""
     
-    def __init__(self, db_path: str = "parishes.db"):
-        """Initialize database connection."""
+    def __init__(self, db_path: str = "parishes.db", wal: bool = False, metrics=None):
+        """
+        Initialize database connection.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            wal: Use write-ahead logging with synchronous=NORMAL, trading a
+                little durability on power loss for much cheaper commits
+            metrics: metrics.Metrics receiving write and commit timings;
+                defaults to the shared registry
+        """
         self.db_path = db_path
+        self.wal = wal
         self.conn = None
         self.cursor = None
+        self._transaction_depth = 0
+        self.metrics = metrics or default_metrics
+        # Tile size service_index rows are written with (see rebuild_service_index)
+        self.service_tile_size = TILE_DEGREES
         
     def __enter__(self):
         """Context manager entry."""
@@ -26,9 +126,12 @@ class ParishDatabase:
         
     def connect(self):
         """Connect to the database."""
-        self.conn = sqlite3.connect(self.db_path)
+        self.conn = sqlite3.connect(self.db_path, timeout=30)
         self.conn.row_factory = sqlite3.Row
         self.cursor = self.conn.cursor()
+        if self.wal:
+            self.cursor.execute("PRAGMA journal_mode=WAL")
+            self.cursor.execute("PRAGMA synchronous=NORMAL")
         
     def close(self):
         """Close database connection."""
@@ -41,23 +144,262 @@ class ParishDatabase:
         schema_path = Path(__file__).parent / "init_db.sql"
         with open(schema_path, 'r') as f:
             schema_sql = f.read()
+        version = self.cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version < 1:
+            # Must precede the script, which adds the unique (name, diocese) key
+            merged = self._merge_duplicate_parishes()
+            if merged:
+                print(f"🔀 Merged {merged} duplicate parish rows")
         self.cursor.executescript(schema_sql)
+        self._migrate()
+        self.cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         self.conn.commit()
         print(f"✅ Database initialized at {self.db_path}")
         
-    def insert_parish(self, parish_data: Dict[str, Any]) -> int:
-        """Insert a new parish record."""
-        # Convert mass_times dict to JSON string if present
+    def _merge_duplicate_parishes(self) -> int:
+        """
+        Collapse rows sharing a name and diocese into the oldest one.
+        
+        Older loads checked for a parish before inserting it and could
+        store it twice. The oldest row keeps its values; any column it
+        lacks is filled from the most recently scraped duplicate that has
+        it, and the duplicates are then deleted.
+        
+        Returns:
+            Number of rows deleted
+        """
+        columns = [row['name'] for row in self.cursor.execute("PRAGMA table_info(parishes)")
+                   if row['name'] not in ('id', 'name', 'diocese')]
+        if not columns:
+            return 0  # New database: init_db.sql creates the table
+        groups = self.cursor.execute(
+            "SELECT name, diocese FROM parishes GROUP BY name, diocese HAVING COUNT(*) > 1"
+        ).fetchall()
+        deleted = 0
+        for group in groups:
+            rows = self.cursor.execute(
+                "SELECT * FROM parishes WHERE name = ? AND diocese = ? ORDER BY id",
+                (group['name'], group['diocese'])
+            ).fetchall()
+            keep, duplicates = rows[0], rows[1:]
+            duplicates.sort(key=lambda row: row['last_scraped'] or '', reverse=True)
+            filled = {column: next((row[column] for row in duplicates if row[column] is not None), None)
+                      for column in columns if keep[column] is None}
+            filled = {column: value for column, value in filled.items() if value is not None}
+            if filled:
+                set_clause = ', '.join(f"{column} = ?" for column in filled)
+                self.cursor.execute(f"UPDATE parishes SET {set_clause} WHERE id = ?",
+                                    list(filled.values()) + [keep['id']])
+            self.cursor.executemany("DELETE FROM parishes WHERE id = ?",
+                                    [(row['id'],) for row in duplicates])
+            deleted += len(duplicates)
+        return deleted
+        
+    def _migrate(self):
+        """Add columns that init_db.sql's CREATE TABLE IF NOT EXISTS cannot add to old tables."""
+        existing = {row['name'] for row in self.cursor.execute("PRAGMA table_info(scrape_log)")}
+        for column, column_type in SCRAPE_LOG_MIGRATIONS.items():
+            if column not in existing:
+                self.cursor.execute(f"ALTER TABLE scrape_log ADD COLUMN {column} {column_type}")
+        
+    @contextmanager
+    def transaction(self):
+        """
+        Group writes into a single transaction.
+        
+        Writes inside the block skip their per-row commit; the outermost
+        block commits once on success and rolls back on error. Blocks nest.
+        """
+        self._transaction_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if self._transaction_depth == 1:
+                self.conn.rollback()
+            raise
+        else:
+            if self._transaction_depth == 1:
+                with self.metrics.timer('db_commit', log=False):
+                    self.conn.commit()
+        finally:
+            self._transaction_depth -= 1
+            
+    def _commit(self):
+        """Commit unless an enclosing transaction() block will."""
+        if self._transaction_depth == 0:
+            self.conn.commit()
+            
+    @staticmethod
+    def _serialize(parish_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a mass_times dict to a JSON string if present."""
         if 'mass_times' in parish_data and isinstance(parish_data['mass_times'], dict):
             parish_data['mass_times'] = json.dumps(parish_data['mass_times'])
+        return parish_data
+        
+    def insert_parish(self, parish_data: Dict[str, Any]) -> int:
+        """Insert a new parish record."""
+        parish_data = self._serialize(parish_data)
             
         columns = ', '.join(parish_data.keys())
         placeholders = ', '.join(['?' for _ in parish_data])
         
         query = f"INSERT INTO parishes ({columns}) VALUES ({placeholders})"
-        self.cursor.execute(query, list(parish_data.values()))
-        self.conn.commit()
-        return self.cursor.lastrowid
+        with self.metrics.timer('db_write', log=False):
+            self.cursor.execute(query, list(parish_data.values()))
+            parish_id = self.cursor.lastrowid
+            if parish_data.get('mass_times'):
+                self.replace_schedule(parish_id, parish_data['mass_times'])
+        self._commit()
+        return parish_id
+        
+    def insert_parishes(self, parishes: Iterable[Dict[str, Any]],
+                        batch_size: int = DB_BATCH_SIZE) -> int:
+        """
+        Bulk insert parish records.
+        
+        Records are consumed lazily and written with executemany, one
+        transaction per batch, so arbitrarily large iterables use bounded
+        memory. Consecutive records with the same keys share a statement.
+        
+        Args:
+            parishes: Iterable of parish dictionaries
+            batch_size: Number of rows written per transaction
+            
+        Returns:
+            Number of rows inserted
+        """
+        inserted = 0
+        records = (self._serialize(parish) for parish in parishes)
+        
+        while True:
+            batch = list(islice(records, batch_size))
+            if not batch:
+                break
+            with self.metrics.timer('db_batch', rows=len(batch)), self.transaction():
+                for columns, group in groupby(batch, key=lambda parish: tuple(parish.keys())):
+                    placeholders = ', '.join(['?' for _ in columns])
+                    query = f"INSERT INTO parishes ({', '.join(columns)}) VALUES ({placeholders})"
+                    self.cursor.executemany(query, (list(parish.values()) for parish in group))
+                for parish in batch:
+                    if parish.get('mass_times'):
+                        row = self.cursor.execute(
+                            "SELECT id FROM parishes WHERE name = ? AND diocese = ?",
+                            (parish['name'], parish['diocese'])
+                        ).fetchone()
+                        self.replace_schedule(row['id'], parish['mass_times'])
+            inserted += len(batch)
+            
+        return inserted
+        
+    def upsert_parish(self, parish_data: Dict[str, Any], insert_only: bool = False) -> str:
+        """
+        Insert a parish, or refresh the existing row with the same name and diocese.
+        
+        Only the columns present in ``parish_data`` are written, so a
+        re-scrape that lacks e.g. coordinates keeps the stored ones. Rows
+        whose values are all identical are left untouched. A changed
+        mass_times value is re-parsed into mass_schedule. A name and
+        diocese that dedup.py merged away (see parish_aliases) update the
+        parish it was merged into.
+        
+        Args:
+            parish_data: Parish dictionary; must include name and diocese
+            insert_only: Never modify a stored parish (or the parish an
+                alias points to); it is reported as 'unchanged'
+            
+        Returns:
+            One of 'inserted', 'updated' or 'unchanged'
+        """
+        parish_data = self._serialize(dict(parish_data))
+        parish_data.pop('created_at', None)
+        parish_data.pop('last_scraped', None)
+        
+        alias = self.cursor.execute(
+            "SELECT parish_id FROM parish_aliases WHERE name = ? AND diocese = ?",
+            (parish_data.get('name'), parish_data.get('diocese'))
+        ).fetchone()
+        if alias:
+            return 'unchanged' if insert_only else self._update_merged(alias['parish_id'], parish_data)
+            
+        # Inserted rows get identical timestamps; updated rows keep their
+        # original created_at, which is how the two cases are told apart.
+        now = datetime.now().isoformat()
+        row_data = {**parish_data, 'last_scraped': now, 'created_at': now}
+        columns = ', '.join(row_data.keys())
+        placeholders = ', '.join(['?' for _ in row_data])
+        
+        changeable = [key for key in parish_data if key not in ('name', 'diocese')]
+        if changeable and not insert_only:
+            set_clause = ', '.join(f"{key} = excluded.{key}" for key in changeable + ['last_scraped'])
+            changed = ' OR '.join(f"{key} IS NOT excluded.{key}" for key in changeable)
+            conflict = f"DO UPDATE SET {set_clause} WHERE {changed}"
+        else:
+            conflict = "DO NOTHING"
+            
+        query = f"""
+            INSERT INTO parishes ({columns}) VALUES ({placeholders})
+            ON CONFLICT(name, diocese) {conflict}
+            RETURNING id, created_at
+        """
+        with self.metrics.timer('db_write', log=False):
+            rows = self.cursor.execute(query, list(row_data.values())).fetchall()
+            if rows and 'mass_times' in parish_data:
+                self.replace_schedule(rows[0]['id'], parish_data['mass_times'])
+            elif rows and LOCATION_COLUMNS.intersection(parish_data):
+                self.reindex_services(rows[0]['id'])
+        self._commit()
+        
+        if not rows:
+            return 'unchanged'
+        return 'inserted' if rows[0]['created_at'] == now else 'updated'
+        
+    def _update_merged(self, parish_id: int, parish_data: Dict[str, Any]) -> str:
+        """Apply an upsert of a merged-away name to the parish that absorbed it."""
+        changeable = [key for key in parish_data if key not in ('name', 'diocese')]
+        if not changeable:
+            return 'unchanged'
+        set_clause = ', '.join(f"{key} = ?" for key in changeable)
+        changed = ' OR '.join(f"{key} IS NOT ?" for key in changeable)
+        values = [parish_data[key] for key in changeable]
+        with self.metrics.timer('db_write', log=False):
+            self.cursor.execute(
+                f"UPDATE parishes SET {set_clause}, last_scraped = ? WHERE id = ? AND ({changed})",
+                values + [datetime.now().isoformat(), parish_id] + values
+            )
+            updated = self.cursor.rowcount > 0
+            if updated and 'mass_times' in parish_data:
+                self.replace_schedule(parish_id, parish_data['mass_times'])
+            elif updated and LOCATION_COLUMNS.intersection(parish_data):
+                self.reindex_services(parish_id)
+        self._commit()
+        return 'updated' if updated else 'unchanged'
+        
+    def upsert_many(self, parishes: Iterable[Dict[str, Any]],
+                    batch_size: int = DB_BATCH_SIZE, insert_only: bool = False) -> Dict[str, int]:
+        """
+        Upsert parish records in batched transactions.
+        
+        Args:
+            parishes: Iterable of parish dictionaries
+            batch_size: Number of rows written per transaction
+            insert_only: Only add parishes that are not stored yet (see
+                upsert_parish)
+            
+        Returns:
+            Counts keyed by 'inserted', 'updated' and 'unchanged'
+        """
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        parishes = iter(parishes)
+        
+        while True:
+            batch = list(islice(parishes, batch_size))
+            if not batch:
+                break
+            with self.metrics.timer('db_batch', rows=len(batch)), self.transaction():
+                for parish in batch:
+                    counts[self.upsert_parish(parish, insert_only)] += 1
+                    
+        return counts
         
     def parish_exists(self, name: str, diocese: str) -> bool:
         """Check if a parish already exists."""
@@ -67,10 +409,7 @@ class ParishDatabase:
         
     def update_parish(self, parish_id: int, parish_data: Dict[str, Any]):
         """Update an existing parish record."""
-        # Convert mass_times dict to JSON string if present
-        if 'mass_times' in parish_data and isinstance(parish_data['mass_times'], dict):
-            parish_data['mass_times'] = json.dumps(parish_data['mass_times'])
-            
+        parish_data = self._serialize(parish_data)
         parish_data['last_scraped'] = datetime.now().isoformat()
         
         set_clause = ', '.join([f"{key} = ?" for key in parish_data.keys()])
@@ -78,16 +417,335 @@ class ParishDatabase:
         
         values = list(parish_data.values()) + [parish_id]
         self.cursor.execute(query, values)
-        self.conn.commit()
+        self._commit()
+        
+    def log_scrape(self, diocese: str, status: str, parishes_found: int, error_message: Optional[str] = None,
+                   timings: Optional[Dict[str, Any]] = None):
+        """
+        Log a scraping operation.
+        
+        Args:
+            diocese: Diocese name
+            status: success, partial, failed or unchanged
+            parishes_found: Parishes saved
+            error_message: Why the scrape failed, if it did
+            timings: Per-stage values keyed by SCRAPE_LOG_MIGRATIONS column
+                (e.g. 'fetch_seconds', 'bytes_fetched'); others are ignored
+        """
+        values = {'diocese': diocese, 'status': status, 'parishes_found': parishes_found,
+                  'error_message': error_message}
+        values.update({key: value for key, value in (timings or {}).items()
+                       if key in SCRAPE_LOG_MIGRATIONS})
+        query = f"""
+            INSERT INTO scrape_log ({', '.join(values)})
+            VALUES ({', '.join('?' * len(values))})
+        """
+        self.cursor.execute(query, list(values.values()))
+        self._commit()
+        
+    def nearby(self, latitude: float, longitude: float, radius: float = 25,
+               limit: int = 100) -> List[Dict]:
+        """
+        Find parishes within a radius, nearest first.
         
-    def log_scrape(self, diocese: str, status: str, parishes_found: int, error_message: Optional[str] = None):
-        """Log a scraping operation."""
+        Candidates are pruned with the parish_rtree bounding-box index before
+        exact great-circle distances are computed, so cost depends on the
+        number of nearby parishes rather than the size of the table.
+        
+        Args:
+            latitude: Search center latitude
+            longitude: Search center longitude
+            radius: Search radius in miles
+            limit: Maximum number of parishes to return
+            
+        Returns:
+            Parish dictionaries with an added 'distance' key (miles)
+        """
+        results = []
+        for south, north, west, east in bounding_boxes(latitude, longitude, radius):
+            rows = self.cursor.execute("""
+                SELECT p.* FROM parish_rtree r JOIN parishes p ON p.id = r.id
+                WHERE r.max_lat >= ? AND r.min_lat <= ?
+                  AND r.max_lon >= ? AND r.min_lon <= ?
+            """, (south, north, west, east)).fetchall()
+            for row in rows:
+                distance = haversine_miles(latitude, longitude, row['latitude'], row['longitude'])
+                if distance <= radius:
+                    results.append({**dict(row), 'distance': distance})
+                    
+        results.sort(key=lambda parish: parish['distance'])
+        return results[:limit]
+        
+    def replace_schedule(self, parish_id: int, mass_times: Any) -> int:
+        """
+        Parse a parish's schedule text and store it in mass_schedule.
+        
+        The parish's service_index rows are rewritten to match.
+        
+        Args:
+            parish_id: Parish row id
+            mass_times: Schedule text or dict (see schedule.parse_schedule)
+            
+        Returns:
+            Number of service times stored
+        """
+        times = parse_schedule(mass_times)
+        self.cursor.execute("DELETE FROM mass_schedule WHERE parish_id = ?", (parish_id,))
+        self.cursor.executemany(
+            "INSERT INTO mass_schedule (parish_id, weekday, minute_of_day, type, language) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(parish_id, *time) for time in times]
+        )
+        self.reindex_services(parish_id)
+        self._commit()
+        return len(times)
+        
+    def rebuild_schedules(self) -> tuple:
+        """
+        Re-parse every parish's mass_times, e.g. after improving the parser.
+        
+        Returns:
+            Tuple of (parishes with a schedule, service times stored)
+        """
+        parishes = times = 0
+        with self.transaction():
+            self.cursor.execute("DELETE FROM mass_schedule")
+            rows = self.cursor.execute(
+                "SELECT id, mass_times FROM parishes WHERE mass_times IS NOT NULL"
+            ).fetchall()
+            for row in rows:
+                stored = self.replace_schedule(row['id'], row['mass_times'])
+                parishes += 1 if stored else 0
+                times += stored
+        return parishes, times
+        
+    def get_schedule(self, parish_id: int) -> List[Dict]:
+        """Get a parish's services as WorshipTime-shaped dicts (day/time/type/language)."""
+        rows = self.cursor.execute(
+            "SELECT weekday, minute_of_day, type, language FROM mass_schedule WHERE parish_id = ?",
+            (parish_id,)
+        ).fetchall()
+        return worship_times([MassTime(*row) for row in rows])
+        
+    def find_services(self, weekday: int, after: int = 0, before: int = 24 * 60,
+                      service_type: str = 'Mass', language: Optional[str] = None,
+                      latitude: Optional[float] = None, longitude: Optional[float] = None,
+                      radius: float = 25, limit: int = 100) -> List[Dict]:
+        """
+        Find services on a weekday within a time window, soonest first.
+        
+        Uses idx_schedule_time for the day/time range and, with a location,
+        parish_rtree for the radius ("Sunday Mass after 5 PM near me").
+        
+        Args:
+            weekday: 0 = Sunday ... 6 = Saturday
+            after: Earliest minute of day (inclusive)
+            before: Latest minute of day (exclusive)
+            service_type: 'Mass', 'Confession' or 'Adoration'
+            language: Only services in this language
+            latitude: Search center latitude (optional)
+            longitude: Search center longitude (optional)
+            radius: Search radius in miles when a center is given
+            limit: Maximum number of services to return
+            
+        Returns:
+            Parish dictionaries with the service's 'minute_of_day', 'time',
+            'service_type' and 'service_language', plus 'distance' (miles)
+            when searching around a point
+        """
         query = """
-            INSERT INTO scrape_log (diocese, status, parishes_found, error_message)
-            VALUES (?, ?, ?, ?)
+            SELECT p.*, s.minute_of_day, s.type AS service_type, s.language AS service_language
+            FROM mass_schedule s JOIN parishes p ON p.id = s.parish_id
+            {join}
+            WHERE s.weekday = ? AND s.type = ? AND s.minute_of_day >= ? AND s.minute_of_day < ?
         """
-        self.cursor.execute(query, (diocese, status, parishes_found, error_message))
-        self.conn.commit()
+        params = [weekday, service_type, after, before]
+        if language:
+            query += " AND s.language = ?"
+            params.append(language)
+            
+        if latitude is None or longitude is None:
+            query = query.format(join='') + " ORDER BY s.minute_of_day LIMIT ?"
+            rows = self.cursor.execute(query, params + [limit]).fetchall()
+            return [{**dict(row), 'time': format_time(row['minute_of_day'])} for row in rows]
+            
+        query = query.format(join="""
+            JOIN parish_rtree r ON r.id = s.parish_id
+             AND r.max_lat >= ? AND r.min_lat <= ? AND r.max_lon >= ? AND r.min_lon <= ?
+        """)
+        results = []
+        for box in bounding_boxes(latitude, longitude, radius):
+            for row in self.cursor.execute(query, list(box) + params).fetchall():
+                distance = haversine_miles(latitude, longitude, row['latitude'], row['longitude'])
+                if distance <= radius:
+                    results.append({**dict(row), 'time': format_time(row['minute_of_day']),
+                                    'distance': distance})
+                    
+        results.sort(key=lambda service: (service['minute_of_day'], service['distance']))
+        return results[:limit]
+        
+    def rebuild_service_index(self, tile_size: float = TILE_DEGREES) -> int:
+        """
+        Recompute service_index from mass_schedule and parish coordinates.
+        
+        Each parish's time zone is resolved from its coordinates once, and
+        its services are stored as local week minutes under its map tile.
+        
+        Args:
+            tile_size: Tile edge length in degrees; next_services must be
+                called with the same value
+                
+        Returns:
+            Number of indexed services
+        """
+        rows = self.conn.cursor().execute(SERVICE_INDEX_QUERY.format(where=''))
+        self.service_tile_size = tile_size
+        with self.transaction():
+            self.cursor.execute("DELETE FROM service_index")
+            self.cursor.executemany(SERVICE_INDEX_INSERT, _service_entries(rows, tile_size))
+        return self.cursor.execute("SELECT COUNT(*) FROM service_index").fetchone()[0]
+        
+    def reindex_services(self, parish_id: int):
+        """
+        Rewrite one parish's service_index rows after its schedule or location changed.
+        
+        Does nothing until rebuild_service_index has built the index, so a
+        database that never exports does not pay for it. Rows use
+        ``service_tile_size``.
+        """
+        if not self.cursor.execute("SELECT 1 FROM service_index LIMIT 1").fetchone():
+            return
+        self.cursor.execute("DELETE FROM service_index WHERE parish_id = ?", (parish_id,))
+        rows = self.conn.cursor().execute(SERVICE_INDEX_QUERY.format(where='AND p.id = ?'),
+                                          (parish_id,))
+        self.cursor.executemany(SERVICE_INDEX_INSERT, _service_entries(rows, self.service_tile_size))
+
+    def next_services(self, latitude: float, longitude: float,
+                      after: Optional[datetime] = None, radius: float = 25,
+                      service_type: str = 'Mass', limit: int = 10,
+                      tile_size: float = TILE_DEGREES) -> List[Dict]:
+        """
+        Find the parishes within a radius whose next service starts soonest.
+        
+        Reads service_index (see rebuild_service_index): for every tile and
+        time zone near the point, one index seek finds the first service at
+        or after ``after`` in local time and rows are read in start order,
+        wrapping around the end of the week, until ``limit`` parishes in the
+        radius are found.
+        
+        Args:
+            latitude: Search center latitude
+            longitude: Search center longitude
+            after: Aware datetime to search from (defaults to now)
+            radius: Search radius in miles
+            service_type: 'Mass', 'Confession' or 'Adoration'
+            limit: Maximum number of parishes to return
+            tile_size: Tile size the index was built with
+            
+        Returns:
+            Parish dictionaries, soonest first, each once with its next
+            service's 'starts_at' (local ISO time), 'day', 'time',
+            'minutes_until', 'timezone' and 'distance' (miles)
+        """
+        after = after or datetime.now(timezone.utc)
+        if after.tzinfo is None:
+            raise ValueError("after must be a timezone-aware datetime")
+            
+        tiles = {key for box in bounding_boxes(latitude, longitude, radius)
+                 for key in tiles_in_box(*box, tile_size)}
+        query = """
+            SELECT s.week_minute, s.timezone, p.* FROM service_index s
+            JOIN parishes p ON p.id = s.parish_id
+            WHERE s.tile = ? AND s.type = ? AND s.timezone = ? AND s.week_minute {op} ?
+            ORDER BY s.week_minute
+        """
+        
+        soonest = {}
+        for tile in tiles:
+            zones = [row[0] for row in self.cursor.execute(
+                "SELECT DISTINCT timezone FROM service_index WHERE tile = ? AND type = ?",
+                (tile, service_type)
+            ).fetchall()]
+            for timezone_name in zones:
+                start = week_minute(after, timezone_name)
+                params = (tile, service_type, timezone_name, start)
+                found = 0
+                for op in ('>=', '<'):  # from now to Saturday night, then wrap
+                    for row in self.conn.cursor().execute(query.format(op=op), params):
+                        distance = haversine_miles(latitude, longitude, row['latitude'], row['longitude'])
+                        if distance > radius:
+                            continue
+                        minutes_until = (row['week_minute'] - start) % WEEK_MINUTES
+                        best = soonest.get(row['id'])
+                        if best is None:
+                            found += 1
+                        if best is None or minutes_until < best['minutes_until']:
+                            soonest[row['id']] = {**dict(row), 'distance': distance,
+                                                  'minutes_until': minutes_until}
+                        if found >= limit:
+                            break
+                    if found >= limit:
+                        break
+                        
+        results = sorted(soonest.values(), key=lambda parish: (parish['minutes_until'], parish['distance']))[:limit]
+        for parish in results:
+            local = after.astimezone(zone(parish['timezone'])).replace(second=0, microsecond=0)
+            parish['starts_at'] = (local + timedelta(minutes=parish['minutes_until'])).isoformat()
+            weekday, minute_of_day = divmod(parish.pop('week_minute'), MINUTES_PER_DAY)
+            parish['day'] = WEEKDAYS[weekday]
+            parish['time'] = format_time(minute_of_day)
+        return results
+        
+    def pending_geocodes(self, limit: int = 100,
+                         max_attempts: int = GEOCODE_MAX_ATTEMPTS) -> List[Dict]:
+        """
+        Get queued parishes that are due for a lookup.
+        
+        Never-tried parishes come first, oldest first. Failed ones wait
+        until their next_attempt_at, so an address that cannot be resolved
+        is not retried back to back against a rate-limited provider.
+        
+        Args:
+            limit: Maximum number of parishes to return
+            max_attempts: Skip parishes that have already failed this often
+            
+        Returns:
+            Dictionaries with id, name, address, city, state, zip and attempts
+        """
+        query = """
+            SELECT p.id, p.name, p.address, p.city, p.state, p.zip, q.attempts
+            FROM geocode_queue q JOIN parishes p ON p.id = q.parish_id
+            WHERE q.attempts < ?
+              AND (q.next_attempt_at IS NULL OR q.next_attempt_at <= CURRENT_TIMESTAMP)
+            ORDER BY q.attempts, q.enqueued_at, q.parish_id
+            LIMIT ?
+        """
+        return [dict(row) for row in self.cursor.execute(query, (max_attempts, limit)).fetchall()]
+        
+    def complete_geocode(self, parish_id: int, coords: Optional[tuple],
+                         error: str = 'No geocoding result'):
+        """
+        Record the outcome of a queued geocode.
+        
+        On success the coordinates are saved and the parish leaves the
+        queue; otherwise its attempt count is incremented and its next
+        attempt is put off by GEOCODE_RETRY_MINUTES, doubled per failure.
+        """
+        if coords:
+            self.cursor.execute(
+                "UPDATE parishes SET latitude = ?, longitude = ? WHERE id = ?",
+                (coords[0], coords[1], parish_id)
+            )
+            self.cursor.execute("DELETE FROM geocode_queue WHERE parish_id = ?", (parish_id,))
+            self.reindex_services(parish_id)
+        else:
+            self.cursor.execute(
+                "UPDATE geocode_queue SET attempts = attempts + 1, last_error = ?, "
+                "next_attempt_at = datetime('now', '+' || (? << attempts) || ' minutes') "
+                "WHERE parish_id = ?",
+                (error, GEOCODE_RETRY_MINUTES, parish_id)
+            )
+        self._commit()
         
     def get_parishes_by_diocese(self, diocese: str) -> List[Dict]:
         """Get all parishes for a diocese."""
@@ -114,5 +772,11 @@ class ParishDatabase:
             'states_covered': self.cursor.execute(
                 "SELECT COUNT(DISTINCT state) FROM parishes"
             ).fetchone()[0],
+            'parishes_with_schedule': self.cursor.execute(
+                "SELECT COUNT(DISTINCT parish_id) FROM mass_schedule"
+            ).fetchone()[0],
+            'pending_geocodes': self.cursor.execute(
+                "SELECT COUNT(*) FROM geocode_queue WHERE attempts < ?", (GEOCODE_MAX_ATTEMPTS,)
+            ).fetchone()[0],
         }
         return stats
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""Find and merge parishes that were loaded more than once.
+
+Seed files and scrapes name the same church differently ("St. Mary's
+Cathedral" vs "Cathedral of St. Mary"), and sometimes file it under a
+different diocese, so the (name, diocese) unique key cannot catch them.
+
+Rows are first grouped into blocks. A block is a grid cell of
+DEDUP_CELL_DEGREES plus its neighbours, a ZIP code for rows without
+coordinates, or an identical address. Only rows in the same block are
+compared. Names are reduced once per row to distinctive tokens, which
+drops words like "Catholic", "Church" and "Cathedral". Pairs are then
+scored by token overlap. A character-level ratio is used only for a
+single one-letter typo in a long word, so "St. Mary" and "St. Mark" stay
+two parishes. The cost grows with block size rather than with the
+square of the table.
+
+Run with no options for a report; --merge keeps the most complete row of
+each group, fills its empty fields from the others and deletes the rest.
+The deleted rows' names are kept as aliases of the surviving row (see
+parish_aliases in init_db.sql), so the next scrape or seed that still
+uses an old name updates the merged parish instead of re-creating it.
+"""
+import argparse
+import json
+import math
+import re
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from config import (DEDUP_CELL_DEGREES, DEDUP_MAX_MILES, DEDUP_MIN_SCORE, DEDUP_SAME_SPOT_MILES,
+                    DEDUP_SAME_SPOT_MIN_SCORE)
+from database import ParishDatabase, haversine_miles
+from scrapers.address import address_key, fold, zip5
+
+# Name words that say what kind of church it is, not which one
+GENERIC_NAME_WORDS = frozenset({
+    'the', 'of', 'and', 'a', 'catholic', 'roman', 'rc', 'church', 'parish', 'cathedral',
+    'co', 'basilica', 'minor', 'shrine', 'national', 'chapel', 'mission', 'community',
+    'metropolitan', 'iglesia', 'parroquia', 'catedral', 'igreja', 'paroquia',
+})
+NAME_SYNONYMS = {
+    'saint': 'st', 'santa': 'st', 'santo': 'st', 'san': 'st', 'sao': 'st', 'ste': 'st',
+    'saints': 'sts', 'ss': 'sts', 'mount': 'mt', 'blessed': 'bl', '&': 'and',
+}
+POSSESSIVE_RE = re.compile(r"['’]s\b", re.IGNORECASE)
+
+# Shortest name word a one-letter difference is treated as a typo in
+TYPO_MIN_LENGTH = 5
+
+# Parish columns copied into the kept row when it has no value
+MERGE_COLUMNS = ['address', 'street', 'city', 'state', 'zip', 'country', 'phone', 'website',
+                 'email', 'latitude', 'longitude', 'mass_times', 'pastor', 'source_url']
+
+
+class Candidate(NamedTuple):
+    """The parts of a parish row the matcher looks at, computed once."""
+    id: int
+    diocese: str
+    tokens: frozenset
+    key: str  # Sorted tokens joined, for the typo ratio
+    latitude: Optional[float]
+    longitude: Optional[float]
+    zip: Optional[str]
+    address: str  # scrapers.address.address_key, '' if no street
+
+
+def name_tokens(name: str) -> frozenset:
+    """
+    Distinctive words of a parish name in comparison form.
+
+    Example:
+        "St. Mary's Cathedral" and "Cathedral of Saint Mary" both give
+        {"st", "mary"}
+    """
+    words = fold(POSSESSIVE_RE.sub('', name or '')).replace('-', ' ').split()
+    words = [NAME_SYNONYMS.get(word, word) for word in words]
+    tokens = frozenset(word for word in words if word not in GENERIC_NAME_WORDS)
+    # "The Cathedral" has no distinctive words; compare it as it is
+    return tokens or frozenset(words)
+
+
+def _one_edit_apart(a: str, b: str) -> bool:
+    """True if one substitution, insertion or deletion turns ``a`` into ``b``."""
+    if abs(len(a) - len(b)) > 1 or a == b:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    for index, (char_a, char_b) in enumerate(zip(a, b)):
+        if char_a != char_b:
+            skip = index if len(a) < len(b) else index + 1
+            return a[skip:] == b[index + 1:]
+    return True
+
+
+def name_score(a: Candidate, b: Candidate, min_score: float = DEDUP_MIN_SCORE) -> float:
+    """
+    Name similarity from 0 to 1.
+
+    The score is the token overlap. Only when that is below ``min_score``
+    and the names differ in a single word of at least TYPO_MIN_LENGTH
+    letters, one edit apart ("Bernadette"/"Bernadete"), is the
+    character-level ratio used instead. Short names one letter apart are
+    usually different saints ("Mary"/"Mark", "John"/"Joan").
+    """
+    if not a.tokens or not b.tokens:
+        return 0.0
+    overlap = len(a.tokens & b.tokens) / len(a.tokens | b.tokens)
+    if overlap >= min_score:
+        return overlap
+    only_a, only_b = a.tokens - b.tokens, b.tokens - a.tokens
+    if len(only_a) != 1 or len(only_b) != 1:
+        return overlap
+    word_a, word_b = next(iter(only_a)), next(iter(only_b))
+    if min(len(word_a), len(word_b)) < TYPO_MIN_LENGTH or not _one_edit_apart(word_a, word_b):
+        return overlap
+    return max(overlap, SequenceMatcher(None, a.key, b.key).ratio())
+
+
+def _candidate(row) -> Candidate:
+    """Build the comparison form of a parish row."""
+    tokens = name_tokens(row['name'])
+    has_street = bool(row['street'] or (row['address'] and any(c.isdigit() for c in row['address'])))
+    return Candidate(
+        id=row['id'],
+        diocese=row['diocese'],
+        tokens=tokens,
+        key=" ".join(sorted(tokens)),
+        latitude=row['latitude'],
+        longitude=row['longitude'],
+        zip=zip5(row['zip']),
+        address=address_key(row['street'] or row['address'], row['city'], row['state'], row['zip'])
+        if has_street else '',
+    )
+
+
+def _blocks(candidates: List[Candidate], cell_size: float) -> Iterator[Tuple[Candidate, List[Candidate]]]:
+    """
+    Yield (candidate, others) pairs of rows that share a block.
+
+    Each unordered pair is produced at most once per blocking key: cells
+    look only at themselves and their "later" neighbours. A pair can
+    still share several keys (cell, ZIP, address); callers skip repeats.
+    """
+    cells: Dict[Tuple[int, int], List[Candidate]] = {}
+    zips: Dict[str, List[Candidate]] = {}
+    addresses: Dict[str, List[Candidate]] = {}
+    for candidate in candidates:
+        if candidate.latitude is not None and candidate.longitude is not None:
+            cell = (int(math.floor(candidate.latitude / cell_size)),
+                    int(math.floor(candidate.longitude / cell_size)))
+            cells.setdefault(cell, []).append(candidate)
+        if candidate.zip:
+            zips.setdefault(candidate.zip, []).append(candidate)
+        if candidate.address:
+            addresses.setdefault(candidate.address, []).append(candidate)
+
+    for (row, col), members in cells.items():
+        neighbours = []
+        for d_row, d_col in ((0, 1), (1, -1), (1, 0), (1, 1)):
+            neighbours.extend(cells.get((row + d_row, col + d_col), ()))
+        for index, candidate in enumerate(members):
+            yield candidate, members[index + 1:] + neighbours
+    for group in list(zips.values()) + list(addresses.values()):
+        for index, candidate in enumerate(group):
+            yield candidate, group[index + 1:]
+
+
+def find_duplicates(db: ParishDatabase, max_miles: float = DEDUP_MAX_MILES,
+                    min_score: float = DEDUP_MIN_SCORE,
+                    cell_size: float = DEDUP_CELL_DEGREES) -> List[Dict[str, Any]]:
+    """
+    Group parish rows that describe the same church.
+
+    Two rows match when their names score at least ``min_score`` and they
+    are within ``max_miles`` of each other, or share a ZIP code or a
+    normalized street address when coordinates are missing. Rows of one
+    diocese within DEDUP_SAME_SPOT_MILES match with a name score of
+    DEDUP_SAME_SPOT_MIN_SCORE, or any names if their street addresses are
+    identical. Centroid geocodes put every parish of a ZIP or city on one
+    spot, so closeness alone is never enough. Matches are chained, so A~B
+    and B~C put A, B and C in one group.
+
+    Returns:
+        Groups as dicts with the member 'ids' (ascending) and the matched
+        'pairs' as (id, id, score, miles or None)
+    """
+    rows = db.cursor.execute(
+        "SELECT id, name, diocese, address, street, city, state, zip, latitude, longitude FROM parishes"
+    )
+    candidates = [_candidate(row) for row in rows]
+
+    parent = {candidate.id: candidate.id for candidate in candidates}
+
+    def root(parish_id: int) -> int:
+        while parent[parish_id] != parish_id:
+            parent[parish_id] = parent[parent[parish_id]]
+            parish_id = parent[parish_id]
+        return parish_id
+
+    pairs = {}
+    for candidate, others in _blocks(candidates, cell_size):
+        for other in others:
+            pair = (min(candidate.id, other.id), max(candidate.id, other.id))
+            if pair in pairs:
+                continue
+            score = name_score(candidate, other, min_score)
+            miles = None
+            if candidate.latitude is not None and other.latitude is not None:
+                miles = haversine_miles(candidate.latitude, candidate.longitude,
+                                        other.latitude, other.longitude)
+                # One diocese listing the same church twice under two names
+                same_spot = (miles <= DEDUP_SAME_SPOT_MILES and candidate.diocese == other.diocese
+                             and (score >= DEDUP_SAME_SPOT_MIN_SCORE
+                                  or (candidate.address and candidate.address == other.address)))
+                if miles > max_miles or (score < min_score and not same_spot):
+                    continue
+            elif score < min_score or (candidate.address != other.address
+                                       and candidate.zip != other.zip):
+                continue
+            pairs[pair] = (pair[0], pair[1], round(score, 3), None if miles is None else round(miles, 3))
+            parent[root(pair[1])] = root(pair[0])
+
+    groups: Dict[int, Dict[str, Any]] = {}
+    for pair in sorted(pairs.values()):
+        group = groups.setdefault(root(pair[0]), {'ids': set(), 'pairs': []})
+        group['ids'].update(pair[:2])
+        group['pairs'].append(pair)
+    return [{'ids': sorted(group['ids']), 'pairs': group['pairs']}
+            for group in sorted(groups.values(), key=lambda group: min(group['ids']))]
+
+
+def merge_group(db: ParishDatabase, ids: List[int]) -> int:
+    """
+    Collapse one duplicate group into its most complete row.
+
+    The kept row is the one with the most filled columns (coordinates
+    first, then the oldest id). Its empty columns are filled from the
+    other rows in id order, and the other rows are deleted; triggers clean
+    up their spatial index, geocode queue and schedule entries. The
+    deleted rows' names (and any aliases they had) become aliases of the
+    kept row.
+
+    Returns:
+        Id of the kept parish
+    """
+    placeholders = ', '.join('?' * len(ids))
+    rows = [dict(row) for row in db.cursor.execute(
+        f"SELECT * FROM parishes WHERE id IN ({placeholders}) ORDER BY id", ids
+    ).fetchall()]
+    keeper = max(rows, key=lambda row: (row['latitude'] is not None,
+                                        sum(row[column] is not None for column in MERGE_COLUMNS),
+                                        -row['id']))
+
+    updates = {}
+    for row in rows:
+        for column in MERGE_COLUMNS:
+            if keeper[column] is None and column not in updates and row[column] is not None:
+                updates[column] = row[column]
+    # Coordinates only travel together
+    if ('latitude' in updates) != ('longitude' in updates):
+        updates.pop('latitude', None)
+        updates.pop('longitude', None)
+
+    others = [row for row in rows if row['id'] != keeper['id']]
+    other_ids = [row['id'] for row in others]
+    other_placeholders = ', '.join('?' * len(others))
+    db.cursor.execute(f"UPDATE parish_aliases SET parish_id = ? WHERE parish_id IN ({other_placeholders})",
+                      [keeper['id']] + other_ids)
+    db.cursor.executemany(
+        "INSERT OR REPLACE INTO parish_aliases (name, diocese, parish_id) VALUES (?, ?, ?)",
+        [(row['name'], row['diocese'], keeper['id']) for row in others]
+    )
+    db.cursor.execute(f"DELETE FROM parishes WHERE id IN ({other_placeholders})", other_ids)
+    if updates:
+        db.update_parish(keeper['id'], updates)
+        if 'mass_times' in updates:
+            db.replace_schedule(keeper['id'], updates['mass_times'])
+    return keeper['id']
+
+
+def merge_duplicates(db: ParishDatabase, groups: List[Dict[str, Any]]) -> int:
+    """
+    Merge every duplicate group in one transaction.
+
+    Returns:
+        Number of rows deleted
+    """
+    removed = 0
+    with db.transaction():
+        for group in groups:
+            merge_group(db, group['ids'])
+            removed += len(group['ids']) - 1
+    return removed
+
+
+def print_report(db: ParishDatabase, groups: List[Dict[str, Any]]):
+    """Print each duplicate group with its rows and match scores."""
+    for group in groups:
+        print(f"\n🔁 {len(group['ids'])} rows:")
+        for parish_id in group['ids']:
+            row = db.cursor.execute(
+                "SELECT name, diocese, city, state FROM parishes WHERE id = ?", (parish_id,)
+            ).fetchone()
+            print(f"   #{parish_id} {row['name']} ({row['diocese']}) - "
+                  f"{row['city'] or 'N/A'}, {row['state'] or 'N/A'}")
+        for first, second, score, miles in group['pairs']:
+            distance = f", {miles} mi" if miles is not None else ""
+            print(f"     #{first} ~ #{second}: score {score}{distance}")
+
+
+def main(argv=None):
+    """Report or merge duplicate parishes."""
+    parser = argparse.ArgumentParser(description="Find (and optionally merge) duplicate parishes.")
+    parser.add_argument('--db', default=str(Path(__file__).parent / "parishes.db"),
+                        help="Path to parishes.db")
+    parser.add_argument('--merge', action='store_true',
+                        help="Merge each group into its most complete row instead of only reporting")
+    parser.add_argument('--report', help="Also write the groups to this JSON file")
+    parser.add_argument('--max-miles', type=float, default=DEDUP_MAX_MILES,
+                        help=f"Maximum distance between duplicates (default: {DEDUP_MAX_MILES})")
+    parser.add_argument('--min-score', type=float, default=DEDUP_MIN_SCORE,
+                        help=f"Minimum name similarity, 0-1 (default: {DEDUP_MIN_SCORE})")
+    args = parser.parse_args(argv)
+
+    with ParishDatabase(args.db) as db:
+        db.initialize()
+        groups = find_duplicates(db, args.max_miles, args.min_score)
+        print_report(db, groups)
+        if args.report:
+            with open(args.report, 'w') as f:
+                json.dump(groups, f, indent=2)
+
+        duplicates = sum(len(group['ids']) - 1 for group in groups)
+        print(f"\n📊 {len(groups)} duplicate groups, {duplicates} extra rows")
+        if args.merge and groups:
+            removed = merge_duplicates(db, groups)
+            print(f"✅ Merged {len(groups)} groups, removed {removed} rows")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,15 +1,455 @@
 #!/usr/bin/env python3
-"""Export parishes database to JSON."""
-from database import ParishDatabase
+"""Export parishes database to JSON.
+
+Rows are streamed from the database cursor straight to disk, so memory use
+does not grow with the table. Alongside ``parishes.json`` the exporter
+writes pre-compressed ``.gz`` (and ``.br`` when the ``brotli`` package is
+installed) siblings plus a manifest with the content hash for ETags.
+
+With ``--tiles`` it also splits parishes into a fixed latitude/longitude
+grid under ``public/tiles/`` so clients only download the area around them.
+``--times`` adds a per-tile "next Mass" index under ``public/tiles/times/``.
+"""
+import argparse
+import gzip
+import hashlib
 import json
+import math
+import os
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from itertools import groupby
+from typing import Any, Dict, List, Optional
+
+from database import ParishDatabase
+from tiles import TILE_DEGREES, tile_bounds
+
+try:
+    import brotli
+except ImportError:  # Optional: only needed for .br output
+    brotli = None
+
+SCRAPER_DIR = Path(__file__).parent
+DEFAULT_DB_PATH = SCRAPER_DIR / "parishes.db"
+DEFAULT_OUTPUT_PATH = SCRAPER_DIR.parent / "public" / "parishes.json"
+DEFAULT_TILES_DIR = SCRAPER_DIR.parent / "public" / "tiles"
+
+# Files export_tiles/export_service_index write ("<row>_<col>.json" and its
+# compressed siblings); only these are ever removed as stale
+TILE_FILE_RE = re.compile(r'^\d+_\d+\.json(\.gz|\.br)?$')
+
+# Columns the front end reads (see src/services/localParishes.ts)
+EXPORT_COLUMNS = [
+    'id', 'name', 'diocese', 'address', 'city', 'state', 'zip', 'country',
+    'phone', 'website', 'email', 'latitude', 'longitude',
+]
+
+# 5 decimal places is roughly 1 meter, plenty for a map pin
+COORD_PRECISION = 5
+
+
+class ExportWriter:
+    """Writes an export file plus compressed siblings and a running hash."""
+
+    def __init__(self, path: Path, compress: bool = True):
+        """Open the output file and compressors for writing."""
+        self.path = path
+        self.sha256 = hashlib.sha256()
+        self.bytes_written = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp_paths = {path: path.with_name(path.name + '.tmp')}
+        self._file = open(self._tmp_paths[path], 'wb')
+        self._gzip = None
+        self._brotli = None
+        self._brotli_file = None
+
+        if compress:
+            gz_path = path.with_name(path.name + '.gz')
+            self._tmp_paths[gz_path] = gz_path.with_name(gz_path.name + '.tmp')
+            self._gzip = gzip.GzipFile(self._tmp_paths[gz_path], 'wb', compresslevel=9, mtime=0)
+            if brotli:
+                br_path = path.with_name(path.name + '.br')
+                self._tmp_paths[br_path] = br_path.with_name(br_path.name + '.tmp')
+                self._brotli_file = open(self._tmp_paths[br_path], 'wb')
+                self._brotli = brotli.Compressor(mode=brotli.MODE_TEXT, quality=11)
+            else:
+                print("⚠️  brotli not installed, skipping .br output")
+
+    def write(self, text: str):
+        """Append text to the export and every compressed sibling."""
+        data = text.encode('utf-8')
+        self.sha256.update(data)
+        self.bytes_written += len(data)
+        self._file.write(data)
+        if self._gzip:
+            self._gzip.write(data)
+        if self._brotli:
+            self._brotli_file.write(self._brotli.process(data))
+
+    def close(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Finish all outputs and move them into place.
+
+        Returns:
+            Dictionary of encoding name to file name and size
+        """
+        self._file.close()
+        if self._gzip:
+            self._gzip.close()
+        if self._brotli:
+            self._brotli_file.write(self._brotli.finish())
+            self._brotli_file.close()
+
+        encodings = {}
+        for final_path, tmp_path in self._tmp_paths.items():
+            os.replace(tmp_path, final_path)
+            if final_path != self.path:
+                encoding = 'gzip' if final_path.suffix == '.gz' else 'br'
+                encodings[encoding] = {'file': final_path.name, 'bytes': final_path.stat().st_size}
+        return encodings
+
+
+def _prepare_row(row, columns: List[str], compact: bool) -> Dict[str, Any]:
+    """Project a database row onto the export columns."""
+    record = {}
+    for column in columns:
+        value = row[column]
+        if value is None and compact:
+            continue
+        if column in ('latitude', 'longitude') and value is not None:
+            value = round(value, COORD_PRECISION)
+        record[column] = value
+    return record
+
+
+def _check_columns(db: ParishDatabase, columns: List[str]):
+    """Raise ValueError if any export column is missing from the table."""
+    available = {row['name'] for row in db.cursor.execute("PRAGMA table_info(parishes)")}
+    unknown = [column for column in columns if column not in available]
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(unknown)}")
+
+
+def _check_tables(db: ParishDatabase, tables: List[str]):
+    """Raise ValueError if the database predates any of the given tables."""
+    available = {row['name'] for row in db.cursor.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table'")}
+    missing = [table for table in tables if table not in available]
+    if missing:
+        raise ValueError(f"Missing tables: {', '.join(missing)} "
+                         "(run main.py or seed.py once to upgrade the database)")
+
+
+def _write_rows(writer: ExportWriter, rows, columns: List[str], compact: bool) -> int:
+    """Write rows to a writer as a JSON array and return the row count."""
+    separators = (',', ':') if compact else (', ', ': ')
+    row_separator = ',' if compact else ',\n'
+    count = 0
+    writer.write('[' if compact else '[\n')
+    for row in rows:
+        if count:
+            writer.write(row_separator)
+        record = _prepare_row(row, columns, compact)
+        writer.write(json.dumps(record, ensure_ascii=False, separators=separators))
+        count += 1
+    writer.write(']' if compact else '\n]\n')
+    return count
+
+
+def export_parishes(db_path: Path = DEFAULT_DB_PATH,
+                    output_path: Path = DEFAULT_OUTPUT_PATH,
+                    columns: Optional[List[str]] = None,
+                    compact: bool = True,
+                    compress: bool = True,
+                    coords_only: bool = False) -> Dict[str, Any]:
+    """
+    Stream the parishes table to a JSON array.
+
+    Args:
+        db_path: Path to parishes.db
+        output_path: Destination JSON file
+        columns: Columns to export (defaults to EXPORT_COLUMNS)
+        compact: Minify the JSON and omit null fields
+        compress: Also write .gz/.br siblings
+        coords_only: Skip parishes without coordinates
+
+    Returns:
+        The manifest written next to the export
+    """
+    columns = columns or EXPORT_COLUMNS
+    output_path = Path(output_path)
+
+    with ParishDatabase(str(db_path)) as db:
+        _check_columns(db, columns)
+
+        query = f"SELECT {', '.join(columns)} FROM parishes"
+        if coords_only:
+            query += " WHERE latitude IS NOT NULL AND longitude IS NOT NULL"
+        query += " ORDER BY id" if 'id' in columns else ""
+
+        writer = ExportWriter(output_path, compress)
+        count = _write_rows(writer, db.cursor.execute(query), columns, compact)
+        encodings = writer.close()
+
+    digest = writer.sha256.hexdigest()
+    manifest = {
+        'file': output_path.name,
+        'count': count,
+        'bytes': writer.bytes_written,
+        'sha256': digest,
+        'etag': f'"{digest[:32]}"',
+        'columns': columns,
+        'encodings': encodings,
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+    }
+    manifest_path = output_path.with_name(output_path.stem + '.manifest.json')
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    return manifest
+
+
+def _iter_tiles(db: ParishDatabase, columns: List[str], tile_size: float):
+    """
+    Yield (key, rows) for each non-empty tile.
+
+    Parishes are read one latitude band at a time through idx_location and
+    ordered by longitude within the band, so each tile's rows arrive
+    contiguously and only one tile is held in memory.
+    """
+    select = ', '.join(dict.fromkeys(columns + ['latitude', 'longitude']))
+    lat_range = db.cursor.execute(
+        "SELECT MIN(latitude), MAX(latitude) FROM parishes WHERE longitude IS NOT NULL"
+    ).fetchone()
+    if lat_range[0] is None:
+        return
+
+    first_band = int(math.floor((lat_range[0] + 90) / tile_size))
+    last_band = int(math.floor((lat_range[1] + 90) / tile_size))
+    band_cursor = db.conn.cursor()
+
+    for band in range(first_band, last_band + 1):
+        south = band * tile_size - 90
+        rows = band_cursor.execute(
+            f"SELECT {select} FROM parishes "
+            "WHERE latitude >= ? AND latitude < ? AND longitude IS NOT NULL "
+            "ORDER BY longitude",
+            (south, south + tile_size)
+        )
+        current_key, tile_rows = None, []
+        for row in rows:
+            col = int(math.floor((row['longitude'] + 180) / tile_size))
+            key = f"{band}_{col}"
+            if key != current_key and tile_rows:
+                yield current_key, tile_rows
+                tile_rows = []
+            current_key = key
+            tile_rows.append(row)
+        if tile_rows:
+            yield current_key, tile_rows
+
+
+def _remove_stale_tiles(directory: Path, keys) -> int:
+    """Delete tile files (see TILE_FILE_RE) whose key is not in ``keys``; return how many."""
+    removed = 0
+    for path in directory.iterdir():
+        if TILE_FILE_RE.match(path.name) and path.name.split('.', 1)[0] not in keys:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def export_tiles(db_path: Path = DEFAULT_DB_PATH,
+                 tiles_dir: Path = DEFAULT_TILES_DIR,
+                 tile_size: float = TILE_DEGREES,
+                 columns: Optional[List[str]] = None,
+                 compact: bool = True,
+                 compress: bool = True) -> Dict[str, Any]:
+    """
+    Export parishes with coordinates as grid tiles plus an index.
+
+    Each tile is written to ``<tiles_dir>/<row>_<col>.json`` and listed in
+    ``<tiles_dir>/index.json`` with its bounds, parish count and hash.
+    Tiles left over from a previous export are removed.
+
+    Args:
+        db_path: Path to parishes.db
+        tiles_dir: Directory for tile files
+        tile_size: Tile edge length in degrees
+        columns: Columns to export (defaults to EXPORT_COLUMNS)
+        compact: Minify the JSON and omit null fields
+        compress: Also write .gz/.br siblings for each tile
+
+    Returns:
+        The tile index
+    """
+    columns = columns or EXPORT_COLUMNS
+    tiles_dir = Path(tiles_dir)
+    tiles = []
+
+    with ParishDatabase(str(db_path)) as db:
+        _check_columns(db, columns)
+        for key, rows in _iter_tiles(db, columns, tile_size):
+            writer = ExportWriter(tiles_dir / f"{key}.json", compress)
+            count = _write_rows(writer, rows, columns, compact)
+            writer.close()
+            digest = writer.sha256.hexdigest()
+            tiles.append({
+                'key': key,
+                'bounds': tile_bounds(key, tile_size),
+                'count': count,
+                'bytes': writer.bytes_written,
+                'etag': f'"{digest[:32]}"',
+            })
+
+    tiles_dir.mkdir(parents=True, exist_ok=True)
+    _remove_stale_tiles(tiles_dir, {tile['key'] for tile in tiles})
+
+    index = {
+        'tile_size': tile_size,
+        'count': sum(tile['count'] for tile in tiles),
+        'columns': columns,
+        'tiles': tiles,
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+    }
+    with open(tiles_dir / 'index.json', 'w') as f:
+        json.dump(index, f, separators=(',', ':') if compact else None, indent=None if compact else 2)
+
+    return index
+
+
+def export_service_index(db_path: Path = DEFAULT_DB_PATH,
+                         times_dir: Path = DEFAULT_TILES_DIR / "times",
+                         tile_size: float = TILE_DEGREES,
+                         service_type: str = 'Mass',
+                         compact: bool = True,
+                         compress: bool = True) -> Dict[str, Any]:
+    """
+    Rebuild service_index and export it as one time-sorted file per tile.
+
+    Each ``<times_dir>/<row>_<col>.json`` holds, per time zone, parallel
+    ``minutes`` (local week minute, 0 = Sunday 00:00, ascending) and
+    ``ids`` (parish id) arrays. A client converts "now" to each zone's week
+    minute and binary-searches ``minutes`` for the next service, wrapping
+    to the start of the array after Saturday night.
+
+    Args:
+        db_path: Path to parishes.db
+        times_dir: Directory for the index files
+        tile_size: Tile edge length in degrees (match the parish tiles)
+        service_type: Service type to index
+        compact: Minify the JSON
+        compress: Also write .gz/.br siblings for each file
+
+    Returns:
+        The service index manifest
+    """
+    times_dir = Path(times_dir)
+    separators = (',', ':') if compact else (', ', ': ')
+    tiles = []
+
+    with ParishDatabase(str(db_path)) as db:
+        _check_tables(db, ['mass_schedule', 'service_index'])
+        total = db.rebuild_service_index(tile_size)
+        rows = db.cursor.execute(
+            "SELECT tile, timezone, week_minute, parish_id FROM service_index "
+            "WHERE type = ? ORDER BY tile, timezone, week_minute, parish_id",
+            (service_type,)
+        )
+        for key, tile_rows in groupby(rows, key=lambda row: row['tile']):
+            zones = {}
+            for timezone_name, zone_rows in groupby(tile_rows, key=lambda row: row['timezone']):
+                zone_rows = list(zone_rows)
+                zones[timezone_name] = {
+                    'minutes': [row['week_minute'] for row in zone_rows],
+                    'ids': [row['parish_id'] for row in zone_rows],
+                }
+            writer = ExportWriter(times_dir / f"{key}.json", compress)
+            writer.write(json.dumps({'tile': key, 'type': service_type, 'zones': zones},
+                                    separators=separators))
+            writer.close()
+            digest = writer.sha256.hexdigest()
+            tiles.append({
+                'key': key,
+                'bounds': tile_bounds(key, tile_size),
+                'count': sum(len(zone['ids']) for zone in zones.values()),
+                'zones': sorted(zones),
+                'bytes': writer.bytes_written,
+                'etag': f'"{digest[:32]}"',
+            })
+
+    times_dir.mkdir(parents=True, exist_ok=True)
+    _remove_stale_tiles(times_dir, {tile['key'] for tile in tiles})
+
+    index = {
+        'tile_size': tile_size,
+        'type': service_type,
+        'count': sum(tile['count'] for tile in tiles),
+        'indexed': total,
+        'week_start': 'Sunday 00:00 local time',
+        'tiles': tiles,
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+    }
+    with open(times_dir / 'index.json', 'w') as f:
+        json.dump(index, f, separators=(',', ':') if compact else None, indent=None if compact else 2)
+
+    return index
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Export parishes database to JSON.")
+    parser.add_argument('--db', default=str(DEFAULT_DB_PATH), help="Path to parishes.db")
+    parser.add_argument('--output', default=str(DEFAULT_OUTPUT_PATH), help="Output JSON file")
+    parser.add_argument('--columns', help="Comma-separated columns to export "
+                        f"(default: {','.join(EXPORT_COLUMNS)})")
+    parser.add_argument('--pretty', action='store_true',
+                        help="One record per line and keep null fields instead of minifying")
+    parser.add_argument('--no-compress', action='store_true', help="Skip .gz/.br siblings")
+    parser.add_argument('--coords-only', action='store_true',
+                        help="Only export parishes that have coordinates")
+    parser.add_argument('--tiles', action='store_true',
+                        help="Also write geographic tiles and a tile index")
+    parser.add_argument('--tiles-dir', default=str(DEFAULT_TILES_DIR), help="Output directory for tiles")
+    parser.add_argument('--times', action='store_true',
+                        help="Also rebuild the next-Mass index and write it per tile")
+    parser.add_argument('--times-dir', help="Output directory for the next-Mass index "
+                        "(default: <tiles-dir>/times)")
+    parser.add_argument('--tile-size', type=float, default=TILE_DEGREES,
+                        help=f"Tile edge length in degrees (default: {TILE_DEGREES})")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Main function."""
+    args = parse_args(argv)
+    columns = [column.strip() for column in args.columns.split(',')] if args.columns else None
+
+    manifest = export_parishes(args.db, args.output, columns,
+                               compact=not args.pretty,
+                               compress=not args.no_compress,
+                               coords_only=args.coords_only)
+
+    print(f"✅ Exported {manifest['count']} parishes to {manifest['file']} ({manifest['bytes']:,} bytes)")
+    for encoding, info in manifest['encodings'].items():
+        print(f"   📦 {encoding}: {info['file']} ({info['bytes']:,} bytes)")
+    print(f"   🔑 ETag: {manifest['etag']}")
+
+    if args.tiles:
+        index = export_tiles(args.db, args.tiles_dir, args.tile_size, columns,
+                             compact=not args.pretty,
+                             compress=not args.no_compress)
+        print(f"🗺️  Exported {index['count']} parishes into {len(index['tiles'])} tiles "
+              f"({args.tile_size}° grid) in {args.tiles_dir}")
 
-db = ParishDatabase('parishes.db')
-db.connect()
-rows = db.cursor.execute('SELECT * FROM parishes').fetchall()
-parishes = [dict(row) for row in rows]
+    if args.times:
+        times_dir = args.times_dir or str(Path(args.tiles_dir) / 'times')
+        index = export_service_index(args.db, times_dir, args.tile_size,
+                                     compact=not args.pretty,
+                                     compress=not args.no_compress)
+        print(f"⏰ Indexed {index['count']} Mass times in {len(index['tiles'])} tiles in {times_dir}")
 
-with open('../public/parishes.json', 'w') as f:
-    json.dump(parishes, f, indent=2)
 
-db.close()
-print(f'✅ Exported {len(parishes)} parishes to parishes.json')
+if __name__ == '__main__':
+    main()
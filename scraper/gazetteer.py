@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""Offline gazetteer for geocoding without network access.
+
+Builds a single indexed SQLite file from public datasets and answers
+address lookups against it:
+
+* OpenAddresses CSV (LON, LAT, NUMBER, STREET, CITY, REGION, POSTCODE)
+  for street-level points. A house number missing from the data is
+  interpolated between its nearest neighbours on the same street.
+* GeoNames postal code dump (e.g. US.txt from download.geonames.org/export/zip)
+  for ZIP centroids.
+* GeoNames cities table (e.g. cities1000.txt) for city centroids.
+
+Example:
+    python gazetteer.py --openaddresses ky/statewide.csv.gz \\
+        --zips US.txt --cities cities1000.txt
+"""
+import argparse
+import csv
+import gzip
+import io
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+
+from config import DB_BATCH_SIZE, GAZETTEER_PATH
+from scrapers.address import fold, normalize_street, strip_unit, zip5
+
+HOUSE_NUMBER_RE = re.compile(r'^\s*(\d+)[A-Za-z]?(?:-\d+)?\s+(.+)$')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS address_points (
+  street_key TEXT NOT NULL,
+  number INTEGER NOT NULL,
+  zip TEXT,
+  city_key TEXT,
+  state TEXT,
+  latitude REAL NOT NULL,
+  longitude REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS zip_centroids (
+  zip TEXT PRIMARY KEY,
+  latitude REAL NOT NULL,
+  longitude REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS city_centroids (
+  city_key TEXT NOT NULL,
+  state TEXT NOT NULL,
+  latitude REAL NOT NULL,
+  longitude REAL NOT NULL,
+  population INTEGER DEFAULT 0,
+  PRIMARY KEY (city_key, state)
+);
+"""
+
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_points_zip ON address_points(street_key, zip, number);
+CREATE INDEX IF NOT EXISTS idx_points_city ON address_points(street_key, state, city_key, number);
+"""
+
+
+def split_house_number(address: str) -> Tuple[Optional[int], str]:
+    """
+    Split a street address into house number and street.
+
+    Returns:
+        Tuple of (number, street); number is None if the address has none
+    """
+    # Drop suite/unit parts that follow a comma
+    address = address.split(',')[0]
+    match = HOUSE_NUMBER_RE.match(address)
+    if not match:
+        return None, address.strip()
+    return int(match.group(1)), strip_unit(match.group(2).strip())
+
+
+def _open_text(path: str):
+    """Open a plain or gzipped text file."""
+    if path.endswith('.gz'):
+        return io.TextIOWrapper(gzip.open(path, 'rb'), encoding='utf-8', newline='')
+    return open(path, encoding='utf-8', newline='')
+
+
+class Gazetteer:
+    """Read-side access to a gazetteer database built by this module."""
+
+    def __init__(self, path: str = GAZETTEER_PATH, mmap_size: int = 256 * 1024 * 1024):
+        """
+        Open the gazetteer read-only.
+
+        Args:
+            path: Path to gazetteer.db
+            mmap_size: Bytes of the file SQLite may memory-map
+        """
+        if not Path(path).exists():
+            raise FileNotFoundError(f"Gazetteer not found: {path} (build it with gazetteer.py)")
+        self.path = path
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        self.conn.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+
+    def close(self):
+        """Close the database connection."""
+        self.conn.close()
+
+    def street(self, address: str, city: str = None, state: str = None,
+               zip_code: str = None) -> Optional[Tuple[float, float]]:
+        """
+        Look up a street address.
+
+        Exact house numbers win; otherwise the position is interpolated
+        between the nearest numbers below and above on the same street.
+
+        Returns:
+            Tuple of (latitude, longitude) or None without a street match
+        """
+        number, street = split_house_number(address or '')
+        if number is None or not street:
+            return None
+        street_key = normalize_street(street)
+        zip_key = zip5(zip_code)
+
+        if zip_key:
+            where, params = "street_key = ? AND zip = ?", (street_key, zip_key)
+        elif city and state:
+            where, params = ("street_key = ? AND state = ? AND city_key = ?",
+                             (street_key, state.upper(), fold(city)))
+        else:
+            return None
+
+        with self._lock:
+            below = self.conn.execute(
+                f"SELECT number, latitude, longitude FROM address_points "
+                f"WHERE {where} AND number <= ? ORDER BY number DESC LIMIT 1",
+                params + (number,)
+            ).fetchone()
+            if below and below[0] == number:
+                return below[1], below[2]
+            above = self.conn.execute(
+                f"SELECT number, latitude, longitude FROM address_points "
+                f"WHERE {where} AND number > ? ORDER BY number LIMIT 1",
+                params + (number,)
+            ).fetchone()
+
+        if below and above:
+            fraction = (number - below[0]) / (above[0] - below[0])
+            return (below[1] + (above[1] - below[1]) * fraction,
+                    below[2] + (above[2] - below[2]) * fraction)
+        # Past either end of the street: use the closest known number
+        nearest = below or above
+        return (nearest[1], nearest[2]) if nearest else None
+
+    def centroid(self, city: str = None, state: str = None,
+                 zip_code: str = None) -> Optional[Tuple[float, float]]:
+        """
+        Approximate location from the ZIP code, then the city.
+
+        Returns:
+            Tuple of (latitude, longitude) or None
+        """
+        zip_key = zip5(zip_code)
+        with self._lock:
+            if zip_key:
+                row = self.conn.execute(
+                    "SELECT latitude, longitude FROM zip_centroids WHERE zip = ?", (zip_key,)
+                ).fetchone()
+                if row:
+                    return row[0], row[1]
+            if city and state:
+                row = self.conn.execute(
+                    "SELECT latitude, longitude FROM city_centroids WHERE city_key = ? AND state = ?",
+                    (fold(city), state.upper())
+                ).fetchone()
+                if row:
+                    return row[0], row[1]
+        return None
+
+
+def read_openaddresses(path: str) -> Iterator[tuple]:
+    """Yield address_points rows from an OpenAddresses CSV."""
+    with _open_text(path) as f:
+        for row in csv.DictReader(f):
+            row = {key.upper(): value for key, value in row.items()}
+            number, street = split_house_number(f"{row.get('NUMBER', '')} {row.get('STREET', '')}")
+            if number is None or not street:
+                continue
+            try:
+                latitude, longitude = float(row['LAT']), float(row['LON'])
+            except (KeyError, TypeError, ValueError):
+                continue
+            yield (
+                normalize_street(street),
+                number,
+                zip5(row.get('POSTCODE')),
+                fold(row.get('CITY') or ''),
+                (row.get('REGION') or '').upper() or None,
+                latitude,
+                longitude,
+            )
+
+
+def read_geonames_zips(path: str) -> Iterator[tuple]:
+    """Yield zip_centroids rows from a GeoNames postal code dump."""
+    with _open_text(path) as f:
+        for fields in csv.reader(f, delimiter='\t', quoting=csv.QUOTE_NONE):
+            if len(fields) < 11 or not zip5(fields[1]):
+                continue
+            try:
+                yield zip5(fields[1]), float(fields[9]), float(fields[10])
+            except ValueError:
+                continue
+
+
+def read_geonames_cities(path: str, country: str = 'US') -> Iterator[tuple]:
+    """Yield city_centroids rows from a GeoNames cities table."""
+    with _open_text(path) as f:
+        for fields in csv.reader(f, delimiter='\t', quoting=csv.QUOTE_NONE):
+            if len(fields) < 15 or fields[8] != country or fields[6] != 'P':
+                continue
+            try:
+                population = int(fields[14] or 0)
+                yield fold(fields[1]), fields[10], float(fields[4]), float(fields[5]), population
+            except ValueError:
+                continue
+
+
+def _insert_batched(conn: sqlite3.Connection, sql: str, rows: Iterator[tuple],
+                    batch_size: int = DB_BATCH_SIZE) -> int:
+    """Insert rows in batches; returns the number of rows read."""
+    count = 0
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            conn.executemany(sql, batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        conn.executemany(sql, batch)
+        count += len(batch)
+    return count
+
+
+def build(output: str, openaddresses=(), zips=(), cities=()) -> dict:
+    """
+    Build (or add to) a gazetteer database.
+
+    Args:
+        output: Path of the gazetteer database
+        openaddresses: OpenAddresses CSV files (optionally gzipped)
+        zips: GeoNames postal code files
+        cities: GeoNames cities files
+
+    Returns:
+        Dictionary of rows loaded per table
+    """
+    Path(output).parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(output)
+    conn.executescript(SCHEMA)
+    counts = {'address_points': 0, 'zip_centroids': 0, 'city_centroids': 0}
+    with conn:
+        for path in openaddresses:
+            counts['address_points'] += _insert_batched(
+                conn, "INSERT INTO address_points VALUES (?, ?, ?, ?, ?, ?, ?)",
+                read_openaddresses(path))
+        for path in zips:
+            counts['zip_centroids'] += _insert_batched(
+                conn, "INSERT OR REPLACE INTO zip_centroids VALUES (?, ?, ?)",
+                read_geonames_zips(path))
+        for path in cities:
+            # Keep the most populous place when a name repeats within a state
+            counts['city_centroids'] += _insert_batched(
+                conn,
+                "INSERT INTO city_centroids VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(city_key, state) DO UPDATE SET latitude = excluded.latitude, "
+                "longitude = excluded.longitude, population = excluded.population "
+                "WHERE excluded.population > city_centroids.population",
+                read_geonames_cities(path))
+    # Indexes are built once after loading, which is much faster than
+    # maintaining them row by row
+    conn.executescript(INDEXES)
+    conn.execute("ANALYZE")
+    conn.close()
+    return counts
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Build the offline geocoding gazetteer.")
+    parser.add_argument('--output', default=GAZETTEER_PATH,
+                        help="Gazetteer database to create or extend")
+    parser.add_argument('--openaddresses', nargs='+', default=[], metavar='CSV',
+                        help="OpenAddresses CSV files (.csv or .csv.gz)")
+    parser.add_argument('--zips', nargs='+', default=[], metavar='TXT',
+                        help="GeoNames postal code files")
+    parser.add_argument('--cities', nargs='+', default=[], metavar='TXT',
+                        help="GeoNames cities files")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Build the gazetteer from the given datasets."""
+    args = parse_args(argv)
+    if not (args.openaddresses or args.zips or args.cities):
+        print("❌ Nothing to load; pass --openaddresses, --zips and/or --cities")
+        return
+
+    print(f"🗺️  Building gazetteer at {args.output}...")
+    counts = build(args.output, args.openaddresses, args.zips, args.cities)
+    print(f"✅ Loaded {counts['address_points']} address points, "
+          f"{counts['zip_centroids']} ZIP centroids, {counts['city_centroids']} cities")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""Persistent on-disk cache for geocoding results."""
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+
+from config import GEOCODE_CACHE_PATH, GEOCODE_CACHE_TTL_DAYS, GEOCODE_NEGATIVE_TTL_DAYS
+
+DAY_SECONDS = 24 * 60 * 60
+
+
+def normalize_key(full_address: str) -> str:
+    """Normalize a full address string into a cache key."""
+    parts = (" ".join(part.split()) for part in full_address.lower().split(","))
+    return ", ".join(part for part in parts if part)
+
+
+class GeocodeCache:
+    """
+    SQLite-backed geocode cache shared across runs and scripts.
+
+    Successful lookups and failed ("negative") lookups are both stored.
+    Entries expire after their TTL, so negative results are retried sooner
+    than positive ones.
+    """
+    
+    def __init__(self, path: str = GEOCODE_CACHE_PATH,
+                 ttl_days: float = GEOCODE_CACHE_TTL_DAYS,
+                 negative_ttl_days: float = GEOCODE_NEGATIVE_TTL_DAYS):
+        """Open (or create) the cache database."""
+        self.path = path
+        self.ttl = ttl_days * DAY_SECONDS
+        self.negative_ttl = negative_ttl_days * DAY_SECONDS
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS geocode_cache (
+              address_key TEXT PRIMARY KEY,
+              latitude REAL,  -- NULL for negative entries
+              longitude REAL,
+              cached_at REAL NOT NULL
+            )
+        """)
+        self.conn.commit()
+        
+    def get(self, full_address: str) -> Tuple[bool, Optional[Tuple[float, float]]]:
+        """
+        Look up an address.
+        
+        Args:
+            full_address: Full address string (normalized internally)
+            
+        Returns:
+            Tuple of (found, coords). ``found`` is False on a miss or an
+            expired entry; ``coords`` is None for a cached failure.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT latitude, longitude, cached_at FROM geocode_cache WHERE address_key = ?",
+                (normalize_key(full_address),)
+            ).fetchone()
+        if row is None:
+            return False, None
+            
+        latitude, longitude, cached_at = row
+        negative = latitude is None or longitude is None
+        ttl = self.negative_ttl if negative else self.ttl
+        if time.time() - cached_at > ttl:
+            return False, None
+        return True, None if negative else (latitude, longitude)
+        
+    def set(self, full_address: str, coords: Optional[Tuple[float, float]]):
+        """Store a result; pass None to record a failed lookup."""
+        latitude, longitude = coords if coords else (None, None)
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO geocode_cache (address_key, latitude, longitude, cached_at) "
+                "VALUES (?, ?, ?, ?)",
+                (normalize_key(full_address), latitude, longitude, time.time())
+            )
+            self.conn.commit()
+            
+    def purge_expired(self) -> int:
+        """Delete expired entries and return how many were removed."""
+        now = time.time()
+        with self._lock:
+            cursor = self.conn.execute(
+                "DELETE FROM geocode_cache WHERE "
+                "(latitude IS NULL AND cached_at < ?) OR (latitude IS NOT NULL AND cached_at < ?)",
+                (now - self.negative_ttl, now - self.ttl)
+            )
+            self.conn.commit()
+        return cursor.rowcount
+        
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM geocode_cache").fetchone()[0]
+            
+    def close(self):
+        """Close the cache database."""
+        with self._lock:
+            self.conn.close()
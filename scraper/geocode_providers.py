@@ -0,0 +1,143 @@
+"""Geocoding backends used by geocoder.Geocoder.
+
+Each provider turns address parts into coordinates. ``Geocoder`` tries its
+providers in order and takes the first answer, so an offline gazetteer can
+go first and Nominatim only sees the addresses it could not resolve.
+"""
+import time
+from typing import List, Optional, Tuple
+
+from geopy.exc import GeocoderServiceError, GeocoderTimedOut
+from geopy.geocoders import Nominatim
+
+from config import GAZETTEER_PATH, USER_AGENT
+from gazetteer import Gazetteer
+from politeness import default_scheduler
+
+NOMINATIM_HOST = 'nominatim.openstreetmap.org'
+
+
+class ProviderError(Exception):
+    """Raised when a provider could not answer (as opposed to finding nothing)."""
+
+
+class GeocodingProvider:
+    """
+    Base class for geocoding backends.
+
+    Subclasses implement ``lookup``. ``remote`` providers have their results
+    stored in the persistent geocode cache; local ones are cheap enough to
+    ask again and are never cached, so rebuilding the gazetteer takes
+    effect immediately.
+    """
+
+    name = 'base'
+    remote = False
+
+    def lookup(self, address: str, city: str = None, state: str = None,
+               zip_code: str = None) -> Optional[Tuple[float, float]]:
+        """
+        Geocode one address.
+
+        Returns:
+            Tuple of (latitude, longitude) or None if nothing matched
+
+        Raises:
+            ProviderError: if the backend failed to answer
+        """
+        raise NotImplementedError
+
+
+class NominatimProvider(GeocodingProvider):
+    """OpenStreetMap Nominatim, limited to its allowed request rate."""
+
+    name = 'nominatim'
+    remote = True
+
+    def __init__(self, scheduler=None, max_retries: int = 3):
+        """
+        Initialize provider.
+
+        Args:
+            scheduler: politeness.HostScheduler enforcing the Nominatim rate
+                limit; defaults to the process-wide shared scheduler
+            max_retries: Attempts per address on timeouts and service errors
+        """
+        self.geolocator = Nominatim(user_agent=USER_AGENT)
+        self.scheduler = scheduler or default_scheduler
+        self.max_retries = max_retries
+
+    def lookup(self, address: str, city: str = None, state: str = None,
+               zip_code: str = None) -> Optional[Tuple[float, float]]:
+        """Geocode one address with Nominatim."""
+        full_address = ", ".join(filter(None, [address, city, state, zip_code]))
+        for attempt in range(self.max_retries):
+            try:
+                self.scheduler.wait(NOMINATIM_HOST)
+                location = self.geolocator.geocode(full_address)
+            except (GeocoderTimedOut, GeocoderServiceError) as e:
+                if attempt < self.max_retries - 1:
+                    print(f"⚠️  Geocoding timeout, retrying... ({attempt + 1}/{self.max_retries})")
+                    time.sleep(2)
+                    continue
+                raise ProviderError(f"Nominatim failed after {self.max_retries} attempts: {e}")
+
+            if not location:
+                return None
+            # Validate coordinates are in expected state if provided
+            if state and state.upper() not in location.address.upper():
+                print(f"⚠️  Warning: Geocoded to wrong state: {full_address}")
+            return location.latitude, location.longitude
+        return None
+
+
+class GazetteerProvider(GeocodingProvider):
+    """Street-level lookups against the offline gazetteer (see gazetteer.py)."""
+
+    name = 'gazetteer'
+
+    def __init__(self, gazetteer: Gazetteer):
+        self.gazetteer = gazetteer
+
+    def lookup(self, address: str, city: str = None, state: str = None,
+               zip_code: str = None) -> Optional[Tuple[float, float]]:
+        """Geocode a street address offline."""
+        return self.gazetteer.street(address, city, state, zip_code)
+
+
+class CentroidProvider(GazetteerProvider):
+    """ZIP or city centroid from the offline gazetteer; a last resort."""
+
+    name = 'centroid'
+
+    def lookup(self, address: str, city: str = None, state: str = None,
+               zip_code: str = None) -> Optional[Tuple[float, float]]:
+        """Approximate an address by its ZIP code or city."""
+        return self.gazetteer.centroid(city, state, zip_code)
+
+
+def build_providers(names: List[str], scheduler=None,
+                    gazetteer_path: str = GAZETTEER_PATH) -> List[GeocodingProvider]:
+    """
+    Create providers from their names.
+
+    Args:
+        names: Provider names in lookup order ('gazetteer', 'nominatim', 'centroid')
+        scheduler: Rate limiter passed to the Nominatim provider
+        gazetteer_path: Gazetteer database shared by the offline providers
+
+    Returns:
+        List of providers
+    """
+    providers = []
+    gazetteer = None
+    for name in names:
+        if name == 'nominatim':
+            providers.append(NominatimProvider(scheduler))
+        elif name in ('gazetteer', 'centroid'):
+            gazetteer = gazetteer or Gazetteer(gazetteer_path)
+            provider_class = GazetteerProvider if name == 'gazetteer' else CentroidProvider
+            providers.append(provider_class(gazetteer))
+        else:
+            raise ValueError(f"Unknown geocoding provider: {name}")
+    return providers
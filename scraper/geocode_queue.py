@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Background geocoding stage that drains the persistent geocode queue.
+
+Scraped parishes are saved straight away without coordinates; database
+triggers add them to the ``geocode_queue`` table. ``GeocodeWorker`` works
+through that table at the geocoder's allowed rate on its own thread and
+connection, so scraping is never held up by Nominatim. Because the queue
+lives in the database, an interrupted run simply resumes where it stopped.
+
+Run this file directly to drain the queue without scraping.
+"""
+import argparse
+import threading
+from pathlib import Path
+from typing import Optional
+
+from config import GEOCODE_MAX_ATTEMPTS
+from database import ParishDatabase
+from geocoder import Geocoder
+
+
+class GeocodeWorker(threading.Thread):
+    """Thread that geocodes queued parishes until asked to stop."""
+
+    def __init__(self, db_path: str, geocoder: Optional[Geocoder] = None,
+                 batch_size: int = 50, poll_interval: float = 2.0,
+                 max_attempts: int = GEOCODE_MAX_ATTEMPTS):
+        """
+        Initialize worker.
+
+        Args:
+            db_path: Path to parishes.db (the worker opens its own connection)
+            geocoder: Geocoder to use; created on first use if omitted
+            batch_size: Queue rows fetched per read
+            poll_interval: Seconds to wait for new work when the queue is empty
+            max_attempts: Failed lookups before a parish is skipped
+        """
+        super().__init__(name='geocode-worker', daemon=True)
+        self.db_path = db_path
+        self.geocoder = geocoder
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.geocoded = 0
+        self.failed = 0
+        self._wake = threading.Event()
+        self._drain = threading.Event()
+        self._abort = threading.Event()
+
+    def notify(self):
+        """Tell the worker new parishes were queued."""
+        self._wake.set()
+
+    def finish(self):
+        """Exit once the queue is empty."""
+        self._drain.set()
+        self._wake.set()
+
+    def stop(self):
+        """Exit after the current lookup, leaving the rest queued."""
+        self._abort.set()
+        self._wake.set()
+
+    def run(self):
+        """Drain the queue."""
+        if self.geocoder is None:
+            self.geocoder = Geocoder()
+
+        with ParishDatabase(self.db_path, wal=True) as db:
+            while not self._abort.is_set():
+                pending = db.pending_geocodes(self.batch_size, self.max_attempts)
+                if not pending:
+                    if self._drain.is_set():
+                        break
+                    self._wake.wait(self.poll_interval)
+                    self._wake.clear()
+                    continue
+
+                for parish in pending:
+                    if self._abort.is_set():
+                        break
+                    # A retry must reach the providers again; the failure
+                    # it follows is in the geocode cache
+                    coords = self.geocoder.geocode(
+                        parish['address'],
+                        parish['city'],
+                        parish['state'],
+                        parish['zip'],
+                        retry_failures=parish['attempts'] > 0
+                    )
+                    db.complete_geocode(parish['id'], coords)
+                    if coords:
+                        self.geocoded += 1
+                        print(f"  ✓ {parish['name']}: {coords}")
+                    else:
+                        self.failed += 1
+                        print(f"  ✗ {parish['name']}: Could not geocode")
+
+
+def main(argv=None):
+    """Drain the geocode queue without scraping."""
+    parser = argparse.ArgumentParser(description="Geocode parishes waiting in the geocode queue.")
+    parser.add_argument('--db', default=str(Path(__file__).parent / "parishes.db"),
+                        help="Path to parishes.db")
+    parser.add_argument('--max-attempts', type=int, default=GEOCODE_MAX_ATTEMPTS,
+                        help=f"Skip parishes that failed this many times (default: {GEOCODE_MAX_ATTEMPTS})")
+    args = parser.parse_args(argv)
+
+    with ParishDatabase(args.db) as db:
+        db.initialize()
+        pending = db.get_stats()['pending_geocodes']
+    print(f"🌍 {pending} parishes waiting for coordinates")
+
+    worker = GeocodeWorker(args.db, max_attempts=args.max_attempts)
+    worker.finish()
+    worker.start()
+    try:
+        worker.join()
+    except KeyboardInterrupt:
+        print("\n⏸️  Stopping; remaining parishes stay queued for next time")
+        worker.stop()
+        worker.join()
+
+    print(f"\n✅ Geocoded {worker.geocoded} parishes ({worker.failed} failed)")
+
+
+if __name__ == '__main__':
+    main()
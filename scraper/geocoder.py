@@ -1,20 +1,43 @@
 """Geocoding service to convert addresses to coordinates."""
-import time
-from typing import Optional, Tuple
-from geopy.geocoders import Nominatim
-from geopy.exc import GeocoderTimedOut, GeocoderServiceError
+import warnings
+from contextlib import nullcontext
+from typing import List, Optional, Tuple
+
+from config import GEOCODE_PROVIDERS
+from geocode_cache import GeocodeCache
+from geocode_providers import NOMINATIM_HOST, GeocodingProvider, ProviderError, build_providers
+from metrics import default_metrics
+from politeness import default_scheduler
+from scrapers.address import address_key, dedupe_components
 
 
 class Geocoder:
     """Handles geocoding of addresses to latitude/longitude."""
     
-    def __init__(self):
-        """Initialize geocoder with Nominatim (OpenStreetMap)."""
-        self.geolocator = Nominatim(user_agent="CatholicMassFinderBot/1.0")
-        self.cache = {}  # Simple in-memory cache
+    def __init__(self, cache: Optional[GeocodeCache] = None, scheduler=None,
+                 providers: Optional[List[GeocodingProvider]] = None, metrics=None):
+        """
+        Initialize geocoder.
+        
+        Args:
+            cache: Persistent result cache; defaults to the shared on-disk
+                cache at config.GEOCODE_CACHE_PATH
+            scheduler: politeness.HostScheduler enforcing the Nominatim rate
+                limit; defaults to the process-wide shared scheduler
+            providers: Backends tried in order (see geocode_providers.py);
+                defaults to config.GEOCODE_PROVIDERS
+            metrics: metrics.Metrics receiving 'geocode' timings and cache
+                hit/miss counts; defaults to the shared registry
+        """
+        self.cache = cache if cache is not None else GeocodeCache()
+        self.metrics = metrics or default_metrics
+        self.scheduler = scheduler or default_scheduler
+        self.providers = providers if providers is not None else build_providers(
+            GEOCODE_PROVIDERS, self.scheduler)
         
     def geocode(self, address: str, city: str = None, state: str = None, 
-                zip_code: str = None, max_retries: int = 3) -> Optional[Tuple[float, float]]:
+                zip_code: str = None, max_retries: Optional[int] = None,
+                retry_failures: bool = False) -> Optional[Tuple[float, float]]:
         """
         Convert address to coordinates.
         
@@ -23,83 +46,100 @@ class Geocoder:
             city: City name
             state: State abbreviation
             zip_code: ZIP code
-            max_retries: Maximum retry attempts
+            max_retries: Deprecated and ignored; retries are configured on
+                the provider (NominatimProvider's max_retries)
+            retry_failures: Ask the remote providers again even if they
+                failed on this address before (a cached negative result)
             
         Returns:
             Tuple of (latitude, longitude) or None if geocoding fails
         """
-        # Build full address
-        address_parts = [address]
-        if city:
-            address_parts.append(city)
-        if state:
-            address_parts.append(state)
-        if zip_code:
-            address_parts.append(zip_code)
+        if max_retries is not None:
+            warnings.warn("Geocoder.geocode(max_retries=...) is ignored; pass max_retries "
+                          "to NominatimProvider instead", DeprecationWarning, stacklevel=2)
+        with self.metrics.timer('geocode') as event:
+            coords, event['result'] = self._geocode(address, city, state, zip_code, retry_failures)
+        self.metrics.count(f"geocode_{event['result']}")
+        return coords
         
-        full_address = ", ".join(filter(None, address_parts))
+    def _geocode(self, address: str, city: Optional[str], state: Optional[str],
+                 zip_code: Optional[str], retry_failures: bool = False
+                 ) -> Tuple[Optional[Tuple[float, float]], str]:
+        """
+        Geocode without instrumentation.
         
-        # Check cache
-        if full_address in self.cache:
-            return self.cache[full_address]
+        Returns:
+            Tuple of (coordinates or None, outcome), where outcome is
+            'cache_hit', 'cache_miss' (found by a provider) or 'failed'
+        """
+        # Drop city/state/ZIP repeated inside the street address
+        address, city, state, zip_code = dedupe_components(address, city, state, zip_code)
+        full_address = ", ".join(filter(None, [address, city, state, zip_code]))
         
-        # Try geocoding with retries
-        for attempt in range(max_retries):
+        # Check cache (includes remembered failures); equivalent spellings
+        # of an address share one key
+        key = address_key(address, city, state, zip_code)
+        found, coords = self.cache.get(key)
+        if found and coords:
+            return coords, 'cache_hit'
+        if retry_failures:
+            found = False
+        
+        # A remembered failure only rules out the remote providers; the
+        # local ones are cheap and their data may have changed since
+        remote_answered = False
+        errored = False
+        for provider in self.providers:
+            if found and provider.remote:
+                continue
             try:
-                location = self.geolocator.geocode(full_address)
+                coords = provider.lookup(address, city, state, zip_code)
+            except ProviderError as e:
+                print(f"❌ {provider.name}: {e}: {full_address}")
+                errored = True
+                continue
                 
-                if location:
-                    coords = (location.latitude, location.longitude)
-                    self.cache[full_address] = coords
-                    
-                    # Validate coordinates are in expected state if provided
-                    if state and not self._validate_state(location.address, state):
-                        print(f"⚠️  Warning: Geocoded to wrong state: {full_address}")
-                    
-                    # Rate limit: 1 request per second for Nominatim
-                    time.sleep(1)
-                    return coords
-                else:
-                    print(f"❌ Geocoding failed: {full_address}")
-                    return None
-                    
-            except (GeocoderTimedOut, GeocoderServiceError) as e:
-                if attempt < max_retries - 1:
-                    print(f"⚠️  Geocoding timeout, retrying... ({attempt + 1}/{max_retries})")
-                    time.sleep(2)
-                else:
-                    print(f"❌ Geocoding error after {max_retries} attempts: {full_address}")
-                    return None
-                    
-        return None
-        
-    def _validate_state(self, geocoded_address: str, expected_state: str) -> bool:
-        """Validate that geocoded address is in expected state."""
-        # Simple check - look for state abbreviation in geocoded address
-        return expected_state.upper() in geocoded_address.upper()
+            if coords:
+                if provider.remote:
+                    self.cache.set(key, coords)
+                return coords, 'cache_miss'
+            remote_answered = remote_answered or provider.remote
+            
+        if found:
+            return None, 'cache_hit'
+        print(f"❌ Geocoding failed: {full_address}")
+        # Only remember a failure if every remote provider actually answered
+        if remote_answered and not errored:
+            self.cache.set(key, None)
+        return None, 'failed'
         
-    def geocode_batch(self, addresses: list, delay: float = 1.0) -> dict:
+    def geocode_batch(self, addresses: list, delay: Optional[float] = None) -> dict:
         """
         Geocode multiple addresses with rate limiting.
         
+        Pacing comes from the shared scheduler, so only addresses that miss
+        the cache wait for a request slot.
+        
         Args:
             addresses: List of address dictionaries
-            delay: Delay between requests in seconds
+            delay: Minimum seconds between Nominatim requests for this
+                batch; it can only slow requests below the configured
+                rate (1/second under the usage policy), never speed them up
             
         Returns:
             Dictionary mapping address to coordinates
         """
         results = {}
-        
-        for addr_dict in addresses:
-            full_addr = addr_dict.get('full_address', '')
-            coords = self.geocode(
-                addr_dict.get('address', ''),
-                addr_dict.get('city'),
-                addr_dict.get('state'),
-                addr_dict.get('zip')
-            )
-            results[full_addr] = coords
-            time.sleep(delay)
-            
+        slowed = self.scheduler.slowed(NOMINATIM_HOST, 1 / delay) if delay else nullcontext()
+        with slowed:
+            for addr_dict in addresses:
+                full_addr = addr_dict.get('full_address', '')
+                coords = self.geocode(
+                    addr_dict.get('address', ''),
+                    addr_dict.get('city'),
+                    addr_dict.get('state'),
+                    addr_dict.get('zip')
+                )
+                results[full_addr] = coords
+                
         return results
@@ -22,16 +22,155 @@ CREATE TABLE IF NOT EXISTS parishes (
   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+-- A parish is identified by its name within a diocese. Duplicates left by
+-- older check-then-insert loads are merged once, before this script runs
+-- (see ParishDatabase._merge_duplicate_parishes).
+CREATE UNIQUE INDEX IF NOT EXISTS idx_name_diocese ON parishes(name, diocese);
+
 CREATE INDEX IF NOT EXISTS idx_location ON parishes(latitude, longitude);
 CREATE INDEX IF NOT EXISTS idx_state ON parishes(state);
 CREATE INDEX IF NOT EXISTS idx_diocese ON parishes(diocese);
 CREATE INDEX IF NOT EXISTS idx_city ON parishes(city);
 
+-- R*Tree spatial index for radius queries (see ParishDatabase.nearby).
+-- Each parish is a zero-area box; triggers keep it in sync with parishes.
+CREATE VIRTUAL TABLE IF NOT EXISTS parish_rtree USING rtree(
+  id,
+  min_lat, max_lat,
+  min_lon, max_lon
+);
+
+CREATE TRIGGER IF NOT EXISTS parish_rtree_insert AFTER INSERT ON parishes
+WHEN NEW.latitude IS NOT NULL AND NEW.longitude IS NOT NULL
+BEGIN
+  INSERT OR REPLACE INTO parish_rtree VALUES (NEW.id, NEW.latitude, NEW.latitude, NEW.longitude, NEW.longitude);
+END;
+
+CREATE TRIGGER IF NOT EXISTS parish_rtree_update AFTER UPDATE OF latitude, longitude ON parishes
+BEGIN
+  DELETE FROM parish_rtree WHERE id = OLD.id;
+  INSERT INTO parish_rtree
+    SELECT NEW.id, NEW.latitude, NEW.latitude, NEW.longitude, NEW.longitude
+    WHERE NEW.latitude IS NOT NULL AND NEW.longitude IS NOT NULL;
+END;
+
+CREATE TRIGGER IF NOT EXISTS parish_rtree_delete AFTER DELETE ON parishes
+BEGIN
+  DELETE FROM parish_rtree WHERE id = OLD.id;
+END;
+
+-- Backfill rows that predate the spatial index
+INSERT OR REPLACE INTO parish_rtree
+  SELECT id, latitude, latitude, longitude, longitude FROM parishes
+  WHERE latitude IS NOT NULL AND longitude IS NOT NULL
+    AND id NOT IN (SELECT id FROM parish_rtree);
+
+-- Parishes waiting for coordinates, drained by geocode_queue.py. Triggers
+-- enqueue new rows without coordinates and rows whose address changed.
+CREATE TABLE IF NOT EXISTS geocode_queue (
+  parish_id INTEGER PRIMARY KEY,
+  attempts INTEGER NOT NULL DEFAULT 0,
+  last_error TEXT,
+  enqueued_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  next_attempt_at TIMESTAMP  -- Set after a failure; the row waits until then
+);
+
+CREATE TRIGGER IF NOT EXISTS geocode_queue_insert AFTER INSERT ON parishes
+WHEN NEW.latitude IS NULL AND NEW.address IS NOT NULL
+BEGIN
+  INSERT OR IGNORE INTO geocode_queue (parish_id) VALUES (NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS geocode_queue_address AFTER UPDATE OF address, city, state, zip ON parishes
+WHEN NEW.address IS NOT NULL AND (
+  NEW.address IS NOT OLD.address OR NEW.city IS NOT OLD.city OR
+  NEW.state IS NOT OLD.state OR NEW.zip IS NOT OLD.zip)
+BEGIN
+  INSERT OR REPLACE INTO geocode_queue (parish_id) VALUES (NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS geocode_queue_delete AFTER DELETE ON parishes
+BEGIN
+  DELETE FROM geocode_queue WHERE parish_id = OLD.id;
+END;
+
+-- Backfill parishes that predate the queue
+INSERT OR IGNORE INTO geocode_queue (parish_id)
+  SELECT id FROM parishes WHERE latitude IS NULL AND address IS NOT NULL;
+
+-- Weekly services parsed from parishes.mass_times (see schedule.py), so
+-- "Sunday Mass after 5 PM" is an index range scan instead of a text scan.
+-- weekday: 0 = Sunday ... 6 = Saturday; minute_of_day: local parish time.
+CREATE TABLE IF NOT EXISTS mass_schedule (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  parish_id INTEGER NOT NULL REFERENCES parishes(id),
+  weekday INTEGER NOT NULL CHECK (weekday BETWEEN 0 AND 6),
+  minute_of_day INTEGER NOT NULL CHECK (minute_of_day BETWEEN 0 AND 1439),
+  type TEXT NOT NULL DEFAULT 'Mass',  -- Mass, Confession, Adoration
+  language TEXT  -- NULL when the schedule does not say
+);
+
+CREATE INDEX IF NOT EXISTS idx_schedule_time ON mass_schedule(weekday, type, minute_of_day, parish_id);
+CREATE INDEX IF NOT EXISTS idx_schedule_parish ON mass_schedule(parish_id);
+
+CREATE TRIGGER IF NOT EXISTS mass_schedule_delete AFTER DELETE ON parishes
+BEGIN
+  DELETE FROM mass_schedule WHERE parish_id = OLD.id;
+END;
+
+-- Precomputed "next service" lookup (see ParishDatabase.rebuild_service_index).
+-- Each service is a minute of the local week (0 = Sunday 00:00) grouped by
+-- map tile and time zone, so "next Mass after T" near a point is one index
+-- seek per tile instead of a scan of every schedule. Rebuilt by export and
+-- kept current per parish by ParishDatabase.reindex_services.
+CREATE TABLE IF NOT EXISTS service_index (
+  tile TEXT NOT NULL,  -- "<row>_<col>", see tiles.tile_key
+  type TEXT NOT NULL,
+  timezone TEXT NOT NULL,
+  week_minute INTEGER NOT NULL CHECK (week_minute BETWEEN 0 AND 10079),
+  parish_id INTEGER NOT NULL,
+  PRIMARY KEY (tile, type, timezone, week_minute, parish_id)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_service_index_parish ON service_index(parish_id);
+
+CREATE TRIGGER IF NOT EXISTS service_index_delete AFTER DELETE ON parishes
+BEGIN
+  DELETE FROM service_index WHERE parish_id = OLD.id;
+END;
+
+-- Names that dedup.py merged into another row. upsert_parish writes a
+-- scrape or seed of an alias to the surviving parish, so a merge is not
+-- undone by the next load of the source that still uses the old name.
+CREATE TABLE IF NOT EXISTS parish_aliases (
+  name TEXT NOT NULL,
+  diocese TEXT NOT NULL,
+  parish_id INTEGER NOT NULL,
+  PRIMARY KEY (name, diocese)
+) WITHOUT ROWID;
+
+CREATE INDEX IF NOT EXISTS idx_alias_parish ON parish_aliases(parish_id);
+
+CREATE TRIGGER IF NOT EXISTS parish_aliases_delete AFTER DELETE ON parishes
+BEGIN
+  DELETE FROM parish_aliases WHERE parish_id = OLD.id;
+END;
+
 CREATE TABLE IF NOT EXISTS scrape_log (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
   diocese TEXT,
-  status TEXT,  -- success, failed, partial
+  status TEXT,  -- success, partial, failed, unchanged
   parishes_found INTEGER,
   error_message TEXT,
-  scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+  scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  -- Per-stage timings (see metrics.py); older databases gain these
+  -- columns through ParishDatabase._migrate
+  duration_seconds REAL,
+  wait_seconds REAL,  -- politeness waits, not counted in fetch_seconds
+  fetch_seconds REAL,
+  parse_seconds REAL,
+  extract_seconds REAL,
+  save_seconds REAL,
+  pages_fetched INTEGER,
+  bytes_fetched INTEGER
 );
@@ -1,108 +1,301 @@
 #!/usr/bin/env python3
 """Main entry point for parish scraper."""
+import argparse
 import sys
+from functools import partial
 from pathlib import Path
 from tqdm import tqdm
 
 from database import ParishDatabase
-from geocoder import Geocoder
-from config import DIOCESES
+from geocode_queue import GeocodeWorker
+from metrics import default_metrics
+from config import (ARCHIVE_DIR, DB_PATH, DIOCESES, GENERIC_MAX_PAGES, GEOCODE_MAX_ATTEMPTS, MAX_WORKERS,
+                    MAX_REQUESTS_PER_HOST, METRICS_PATH, REPLAY_DB_PATH, REPLAY_LEDGER_PATH,
+                    RUN_LEDGER_PATH)
+from crawler import crawl_dioceses
+from run_ledger import RunLedger
+from scrapers.archive import PageArchive
+from scrapers.generic import GenericScraper
 from scrapers.lexington import LexingtonScraper
+from scrapers.page_state import PageStateStore
 
 
-def get_scraper(diocese_config):
+def get_scraper(diocese_config, host_limiter=None, page_state=None, archive=None, ledger=None):
     """Get appropriate scraper for diocese."""
     scraper_type = diocese_config.get('scraper', 'generic')
     diocese_name = diocese_config['name']
     diocese_state = diocese_config['state']
     
     if scraper_type == 'lexington':
-        return LexingtonScraper(diocese_name, diocese_state)
+        return LexingtonScraper(diocese_name, diocese_state, host_limiter, page_state, archive,
+                                parser=diocese_config.get('parser'), ledger=ledger)
+    elif scraper_type == 'generic':
+        return GenericScraper(diocese_name, diocese_state, host_limiter, page_state, archive,
+                              parser=diocese_config.get('parser'),
+                              selectors=diocese_config.get('selectors'),
+                              max_pages=diocese_config.get('max_pages', GENERIC_MAX_PAGES),
+                              ledger=ledger)
     else:
-        # TODO: Implement generic scraper
-        print(f"⚠️  Generic scraper not yet implemented for {diocese_name}")
+        print(f"⚠️  Unknown scraper '{scraper_type}' for {diocese_name}")
         return None
 
 
-def scrape_diocese(diocese_config, db, geocoder):
+def scrape_diocese(diocese_config, db, geocode_worker=None, page_state=None, archive=None,
+                   ledger=None):
     """Scrape a single diocese."""
     print(f"\n{'='*60}")
     print(f"📍 {diocese_config['name']} ({diocese_config['state']})")
     print(f"{'='*60}")
     
     # Get scraper
-    scraper = get_scraper(diocese_config)
+    scraper = get_scraper(diocese_config, page_state=page_state, archive=archive, ledger=ledger)
     if not scraper:
-        db.log_scrape(diocese_config['name'], 'failed', 0, 'No scraper available')
+        log_result(diocese_config, db, ledger, 'failed', 0, 'No scraper available')
         return
         
     try:
         # Scrape parishes
         parishes = scraper.scrape_parish_list(diocese_config['parishes_page'])
+    except Exception as e:
+        report_scrape_error(diocese_config, db, e, ledger)
+        finish_page_state(diocese_config, page_state, False)
+        return
         
+    saved = save_parishes(diocese_config, parishes, db, geocode_worker, ledger,
+                          unchanged_pages=scraper.unchanged_pages)
+    finish_page_state(diocese_config, page_state, saved)
+
+
+def crawl_concurrently(dioceses, db, max_workers, per_host, geocode_worker=None,
+                       page_state=None, archive=None, ledger=None):
+    """
+    Scrape dioceses in parallel, saving results on the calling thread.
+    
+    Fetching and parsing run in a worker pool; parish writes happen here
+    as each diocese completes, so scraped data is only ever written from
+    one thread. Geocoding runs separately in the geocode worker.
+    """
+    print(f"⚡ Concurrent crawl: {max_workers} workers, {per_host} requests per host")
+    
+    scraper_factory = partial(get_scraper, page_state=page_state, archive=archive, ledger=ledger)
+    
+    for diocese_config, parishes, error, unchanged_pages in crawl_dioceses(
+            dioceses, scraper_factory, max_workers, per_host):
+        print(f"\n{'='*60}")
+        print(f"📍 {diocese_config['name']} ({diocese_config['state']})")
+        print(f"{'='*60}")
+        
+        saved = False
+        if error:
+            report_scrape_error(diocese_config, db, error, ledger)
+        elif parishes is None:
+            log_result(diocese_config, db, ledger, 'failed', 0, 'No scraper available')
+        else:
+            saved = save_parishes(diocese_config, parishes, db, geocode_worker, ledger,
+                                  unchanged_pages)
+        finish_page_state(diocese_config, page_state, saved)
+
+
+def finish_page_state(diocese_config, page_state, saved):
+    """Persist a diocese's page validators only once its parishes are saved."""
+    if not page_state:
+        return
+    if saved:
+        page_state.commit(diocese_config['name'])
+    else:
+        page_state.discard(diocese_config['name'])
+
+
+def stage_timings(metrics):
+    """Map a diocese's metrics onto the scrape_log timing columns."""
+    snapshot = metrics.snapshot()
+    stages = snapshot['stages']
+    empty = {'count': 0, 'seconds': 0.0, 'bytes': 0}
+    return {
+        'duration_seconds': round(snapshot['seconds'], 3),
+        'wait_seconds': round(stages.get('wait', empty)['seconds'], 3),
+        'fetch_seconds': round(stages.get('fetch', empty)['seconds'], 3),
+        'parse_seconds': round(stages.get('parse', empty)['seconds'], 3),
+        'extract_seconds': round(stages.get('extract', empty)['seconds'], 3),
+        'save_seconds': round(stages.get('save', empty)['seconds'], 3),
+        'pages_fetched': stages.get('fetch', empty)['count'],
+        'bytes_fetched': stages.get('fetch', empty)['bytes'],
+    }
+
+
+def log_result(diocese_config, db, ledger, status, parishes_found, error_message=None):
+    """Record a diocese's outcome in scrape_log, the run ledger and the metrics file."""
+    metrics = default_metrics.child(diocese_config['name'])
+    db.log_scrape(diocese_config['name'], status, parishes_found, error_message,
+                  timings=stage_timings(metrics))
+    metrics.write_snapshot('diocese')
+    if ledger:
+        ledger.finish_diocese(diocese_config['name'], status, parishes_found, error_message)
+
+
+def report_scrape_error(diocese_config, db, error, ledger=None):
+    """Print and log a failed diocese scrape."""
+    print(f"❌ Error scraping {diocese_config['name']}: {error}")
+    import traceback
+    traceback.print_exception(type(error), error, error.__traceback__)
+    log_result(diocese_config, db, ledger, 'failed', 0, str(error))
+
+
+def save_parishes(diocese_config, parishes, db, geocode_worker=None, ledger=None,
+                  unchanged_pages=0):
+    """
+    Save the parishes scraped for a diocese.
+    
+    Parishes are written without waiting for coordinates; new or moved
+    parishes land in the geocode queue (see geocode_queue.py) and the
+    background worker is woken to pick them up.
+    
+    Args:
+        unchanged_pages: Detail pages skipped as unchanged. With no
+            parishes, a non-zero count means the diocese is unchanged
+            rather than failed.
+    
+    Returns:
+        True if every parish was saved (or nothing had changed), so the
+        diocese's page validators can be committed
+    """
+    try:
+        if not parishes and unchanged_pages:
+            print(f"⏭️  All {unchanged_pages} parish pages unchanged since last scrape")
+            log_result(diocese_config, db, ledger, 'unchanged', 0)
+            return True
+            
         if not parishes:
             print("❌ No parishes found")
-            db.log_scrape(diocese_config['name'], 'failed', 0, 'No parishes found')
-            return
+            log_result(diocese_config, db, ledger, 'failed', 0, 'No parishes found')
+            return False
             
         print(f"\n✅ Found {len(parishes)} parishes")
-        print("\n🌍 Geocoding addresses...")
         
-        # Geocode and save parishes
-        parishes_saved = 0
+        # Save parishes
+        counts = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+        errors = 0
         
-        for parish in tqdm(parishes, desc="Processing parishes"):
-            # Check if parish already exists
-            if db.parish_exists(parish['name'], diocese_config['name']):
-                print(f"⏭️  Skipping existing: {parish['name']}")
-                continue
-                
-            # Geocode if we have an address
-            if parish.get('address'):
-                coords = geocoder.geocode(
-                    parish.get('address', ''),
-                    parish.get('city'),
-                    parish.get('state'),
-                    parish.get('zip')
-                )
-                if coords:
-                    parish['latitude'], parish['longitude'] = coords
-                    print(f"  ✓ {parish['name']}: {coords}")
-                else:
-                    print(f"  ✗ {parish['name']}: Could not geocode")
+        # One transaction per diocese instead of a commit per parish
+        metrics = default_metrics.child(diocese_config['name'])
+        with metrics.timer('save', rows=len(parishes)), db.transaction():
+            for parish in tqdm(parishes, desc="Saving parishes"):
+                # Save to database, refreshing the row if it already exists
+                try:
+                    counts[db.upsert_parish(parish)] += 1
+                except Exception as e:
+                    errors += 1
+                    print(f"❌ Error saving {parish['name']}: {e}")
                     
-            # Save to database
-            try:
-                db.insert_parish(parish)
-                parishes_saved += 1
-            except Exception as e:
-                print(f"❌ Error saving {parish['name']}: {e}")
-                
-        # Log scrape result
-        db.log_scrape(diocese_config['name'], 'success', parishes_saved)
-        print(f"\n✅ Saved {parishes_saved} parishes to database")
+        if geocode_worker:
+            geocode_worker.notify()
+            
+        # Log scrape result; a partial save is retried by --resume/--only-failed
+        parishes_saved = counts['inserted'] + counts['updated']
+        log_result(diocese_config, db, ledger, 'success' if errors == 0 else 'partial', parishes_saved,
+                   f"{errors} parishes failed to save" if errors else None)
+        print(f"\n✅ Saved {parishes_saved} parishes to database "
+              f"({counts['inserted']} new, {counts['updated']} updated, {counts['unchanged']} unchanged)")
+        if unchanged_pages:
+            print(f"⏭️  {unchanged_pages} parish pages unchanged since last scrape")
+        return errors == 0
         
     except Exception as e:
-        print(f"❌ Error scraping {diocese_config['name']}: {e}")
-        import traceback
-        traceback.print_exc()
-        db.log_scrape(diocese_config['name'], 'failed', 0, str(e))
+        report_scrape_error(diocese_config, db, e, ledger)
+        return False
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Scrape parish data from diocese websites.")
+    parser.add_argument('--db', metavar='FILE',
+                        help=f"Parish database (default: {DB_PATH}; with --replay, {REPLAY_DB_PATH})")
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS,
+                        help=f"Dioceses to crawl at once; 1 scrapes sequentially (default: {MAX_WORKERS})")
+    parser.add_argument('--per-host', type=int, default=MAX_REQUESTS_PER_HOST,
+                        help=f"Simultaneous requests per host (default: {MAX_REQUESTS_PER_HOST})")
+    parser.add_argument('--no-geocode', action='store_true',
+                        help="Leave new parishes in the geocode queue (drain later with geocode_queue.py)")
+    parser.add_argument('--full-refresh', action='store_true',
+                        help="Re-fetch and re-parse every page, ignoring ETag/Last-Modified/hash state")
+    archive = parser.add_mutually_exclusive_group()
+    archive.add_argument('--archive', nargs='?', const=ARCHIVE_DIR, metavar='DIR',
+                         help=f"Record raw responses to an archive (default: {ARCHIVE_DIR}); "
+                              "implies --full-refresh so unchanged pages are archived too")
+    archive.add_argument('--replay', nargs='?', const=ARCHIVE_DIR, metavar='DIR',
+                         help="Parse pages from an archive instead of the network; implies "
+                              "--no-geocode and writes to a scratch --db and run ledger")
+    parser.add_argument('--metrics', nargs='?', const=METRICS_PATH, metavar='FILE',
+                        help=f"Append per-event timings as JSON lines (default: {METRICS_PATH})")
+    run = parser.add_mutually_exclusive_group()
+    run.add_argument('--resume', action='store_true',
+                     help="Continue the last unfinished run, skipping finished dioceses and parsed pages")
+    run.add_argument('--only-failed', action='store_true',
+                     help="Start a run with only the dioceses whose last attempt failed")
+    args = parser.parse_args(argv)
+    
+    # A replay is offline and must not touch live data
+    args.ledger = RUN_LEDGER_PATH
+    if args.replay:
+        args.no_geocode = True
+        args.ledger = REPLAY_LEDGER_PATH
+        if args.db is None:
+            args.db = REPLAY_DB_PATH
+        elif Path(args.db).resolve() == Path(DB_PATH).resolve():
+            parser.error(f"--replay must not write to {DB_PATH}; pass another --db")
+    args.db = args.db or DB_PATH
+    # A 304 has no body to archive, so an archiving run fetches every page
+    if args.archive:
+        args.full_refresh = True
+    return args
+
+
+def select_dioceses(args, ledger):
+    """
+    Start or resume a run in the ledger and return the dioceses it covers.
+    
+    Returns:
+        Diocese configs to scrape, or None if there is nothing to do
+    """
+    if args.resume:
+        run_id = ledger.resume_run()
+        if run_id is None:
+            print("✅ The last run finished; nothing to resume")
+            return None
+        remaining = set(ledger.remaining_dioceses())
+        dioceses = [diocese for diocese in DIOCESES if diocese['name'] in remaining]
+        print(f"⏯️  Resuming run {run_id}: {len(dioceses)} dioceses left")
+        return dioceses
+        
+    if args.only_failed:
+        failed = set(ledger.failed_dioceses())
+        dioceses = [diocese for diocese in DIOCESES if diocese['name'] in failed]
+        if not dioceses:
+            print("✅ No failed dioceses to re-run")
+            return None
+    else:
+        dioceses = DIOCESES
+    run_id = ledger.start_run([diocese['name'] for diocese in dioceses],
+                              {'only_failed': args.only_failed, 'full_refresh': args.full_refresh})
+    print(f"🗂️  Run {run_id}: {len(dioceses)} dioceses")
+    return dioceses
 
 
-def main():
+def main(argv=None):
     """Main function."""
+    args = parse_args(argv)
+    
     print("🏛️  Catholic Mass Finder - Parish Scraper")
     print("=" * 60)
     
-    # Get database path
-    db_path = Path(__file__).parent / "parishes.db"
+    db_path = Path(args.db)
     print(f"📁 Database: {db_path}")
     
     # Check if database needs initialization
     needs_init = not db_path.exists()
     
     # Initialize database
-    with ParishDatabase(str(db_path)) as db:
+    with ParishDatabase(str(db_path), wal=True) as db:
         # Initialize schema if needed
         if needs_init:
             print("🔨 Initializing database...")
@@ -115,17 +308,76 @@ def main():
                       f"{stats['dioceses_scraped']} dioceses, {stats['states_covered']} states")
             except Exception as e:
                 print(f"⚠️  Database exists but needs initialization: {e}")
-                db.initialize()
+            # Schema is idempotent; this also applies new indexes to old databases
+            db.initialize()
+            
+        if args.metrics:
+            print(f"⏱️  Writing metrics to {args.metrics}")
+            default_metrics.open(args.metrics)
             
-        # Initialize geocoder
-        geocoder = Geocoder()
+        # Checkpoints so an interrupted run can be resumed
+        ledger = RunLedger(args.ledger)
+        dioceses = select_dioceses(args, ledger)
+        if dioceses is None:
+            ledger.close()
+            return
+            
+        # Geocode in the background while scraping continues
+        geocode_worker = None
+        if not args.no_geocode:
+            geocode_worker = GeocodeWorker(str(db_path))
+            geocode_worker.start()
+        
+        # Conditional requests let unchanged pages be skipped entirely
+        page_state = None if args.full_refresh or args.replay else PageStateStore()
         
-        # Scrape all configured dioceses
-        print(f"\n🎯 Scraping {len(DIOCESES)} dioceses...")
+        archive = None
+        if args.replay:
+            print(f"📼 Replaying pages from {args.replay}")
+            archive = PageArchive(args.replay, replay=True)
+        elif args.archive:
+            print(f"📼 Archiving raw pages to {args.archive}")
+            archive = PageArchive(args.archive)
         
-        for diocese in DIOCESES:
-            scrape_diocese(diocese, db, geocoder)
+        # Scrape the run's dioceses
+        print(f"\n🎯 Scraping {len(dioceses)} dioceses...")
+        
+        try:
+            if args.workers > 1:
+                crawl_concurrently(dioceses, db, args.workers, args.per_host, geocode_worker,
+                                   page_state, archive, ledger)
+            else:
+                for diocese in dioceses:
+                    scrape_diocese(diocese, db, geocode_worker, page_state, archive, ledger)
+        except KeyboardInterrupt:
+            print(f"\n⏸️  Run {ledger.run_id} interrupted; continue it with: python main.py --resume")
+            if geocode_worker:
+                geocode_worker.stop()
+                geocode_worker.join()
+            ledger.close()
+            return
+            
+        if geocode_worker:
+            pending = db.get_stats()['pending_geocodes']
+            print(f"\n🌍 Scraping done; waiting for {pending} queued geocodes (Ctrl-C to leave them queued)...")
+            geocode_worker.finish()
+            try:
+                geocode_worker.join()
+            except KeyboardInterrupt:
+                geocode_worker.stop()
+                geocode_worker.join()
+            print(f"✅ Geocoded {geocode_worker.geocoded} parishes ({geocode_worker.failed} failed)")
             
+        # Dioceses with parishes still due a geocode attempt stay 'saved'
+        waiting = db.cursor.execute(
+            "SELECT DISTINCT p.diocese FROM geocode_queue q JOIN parishes p ON p.id = q.parish_id "
+            "WHERE q.attempts < ?", (GEOCODE_MAX_ATTEMPTS,)
+        ).fetchall()
+        ledger.mark_geocoded(row[0] for row in waiting)
+        ledger.finish_run()
+        summary = ledger.summary()
+        ledger.close()
+        
         # Print final stats
         print("\n" + "=" * 60)
         print("📊 Final Statistics")
@@ -133,6 +385,13 @@ def main():
         stats = db.get_stats()
         for key, value in stats.items():
             print(f"  {key}: {value}")
+        for status, count in sorted(summary['dioceses'].items()):
+            print(f"  dioceses_{status}: {count}")
+            
+        print("\n⏱️  Stage Timings")
+        print(default_metrics.summary_table())
+        default_metrics.write_snapshot('summary')
+        default_metrics.close()
             
         print("\n✅ Scraping complete!")
         print(f"💾 Database saved to: {db_path}")
@@ -0,0 +1,148 @@
+"""Lightweight timers and counters for the scrape pipeline.
+
+Stages (wait, fetch, parse, extract, geocode, db_write, ...) report to a
+``Metrics`` registry, which keeps running totals per stage and can also
+append one JSON line per event to a metrics file. Each diocese gets a
+child registry (see ``child``) whose totals also roll up into the parent.
+That way a diocese's own fetch/parse/save times can be written to
+scrape_log while the run still gets an overall summary.
+
+Example:
+    with default_metrics.timer('fetch', url=url) as event:
+        body = download(url)
+        event['bytes'] = len(body)
+"""
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, TextIO
+
+
+class Metrics:
+    """Thread-safe per-stage timers and counters."""
+
+    def __init__(self, name: str = 'run', parent: Optional['Metrics'] = None):
+        """
+        Create a registry.
+
+        Args:
+            name: Label written with each event (the diocese for children)
+            parent: Registry that also receives every event
+        """
+        self.name = name
+        self.parent = parent
+        self.started = time.perf_counter()
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self.counters: Dict[str, int] = {}
+        self._children: Dict[str, 'Metrics'] = {}
+        self._lock = threading.Lock()
+        self._file: Optional[TextIO] = None
+
+    def open(self, path: str):
+        """Append events to a JSON-lines file from now on."""
+        with self._lock:
+            self._file = open(path, 'a', encoding='utf-8')
+
+    def close(self):
+        """Close the JSON-lines file, if any."""
+        with self._lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+    def child(self, name: str) -> 'Metrics':
+        """Get (or create) the child registry for ``name``, e.g. a diocese."""
+        with self._lock:
+            if name not in self._children:
+                self._children[name] = Metrics(name, parent=self)
+            return self._children[name]
+
+    def record(self, stage: str, seconds: float, log: bool = True, **fields: Any):
+        """
+        Add one event to a stage's totals.
+
+        Args:
+            stage: Stage name, e.g. 'fetch'
+            seconds: Time the event took
+            log: Also write the event to the metrics file. Pass False for
+                very frequent events; their totals are still kept
+            fields: Extra event data; a numeric 'bytes' is totalled too
+        """
+        size = fields.get('bytes') or 0
+        with self._lock:
+            totals = self.stages.setdefault(stage, {'count': 0, 'seconds': 0.0, 'max': 0.0, 'bytes': 0})
+            totals['count'] += 1
+            totals['seconds'] += seconds
+            totals['max'] = max(totals['max'], seconds)
+            totals['bytes'] += size
+        if self.parent:
+            self.parent.record(stage, seconds, log, **{'scope': self.name, **fields})
+        elif log:
+            self._write({'stage': stage, 'seconds': round(seconds, 6), **fields})
+
+    @contextmanager
+    def timer(self, stage: str, log: bool = True, **fields: Any) -> Iterator[Dict[str, Any]]:
+        """
+        Time a block as one event of ``stage``.
+
+        Yields a dict the block can add fields to (e.g. 'bytes', 'result'),
+        recorded with the event even if the block raises.
+        """
+        event = dict(fields)
+        start = time.perf_counter()
+        try:
+            yield event
+        except BaseException as e:
+            event.setdefault('error', type(e).__name__)
+            raise
+        finally:
+            self.record(stage, time.perf_counter() - start, log, **event)
+
+    def count(self, name: str, amount: int = 1):
+        """Increment a counter, here and in the parent."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+        if self.parent:
+            self.parent.count(name, amount)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Copy of the totals: elapsed 'seconds', per-stage 'stages' and 'counters'."""
+        with self._lock:
+            return {
+                'name': self.name,
+                'seconds': time.perf_counter() - self.started,
+                'stages': {stage: dict(totals) for stage, totals in self.stages.items()},
+                'counters': dict(self.counters),
+            }
+
+    def write_snapshot(self, kind: str = 'summary'):
+        """Write this registry's totals to the (root) metrics file as one line."""
+        root = self
+        while root.parent:
+            root = root.parent
+        root._write({'type': kind, **self.snapshot()})
+
+    def _write(self, record: Dict[str, Any]):
+        """Append a record to the metrics file."""
+        with self._lock:
+            if self._file:
+                self._file.write(json.dumps({'ts': time.time(), **record}, default=str) + '\n')
+                self._file.flush()
+
+    def summary_table(self) -> str:
+        """Per-stage totals as an aligned text table, slowest stage first."""
+        snapshot = self.snapshot()
+        lines = [f"{'Stage':<18}{'Count':>9}{'Total s':>11}{'Mean ms':>10}{'Max ms':>10}{'MB':>9}"]
+        stages = sorted(snapshot['stages'].items(), key=lambda item: -item[1]['seconds'])
+        for stage, totals in stages:
+            mean = totals['seconds'] / totals['count'] * 1000 if totals['count'] else 0
+            lines.append(f"{stage:<18}{totals['count']:>9,}{totals['seconds']:>11.2f}{mean:>10.1f}"
+                         f"{totals['max'] * 1000:>10.1f}{totals['bytes'] / 1e6:>9.2f}")
+        for name, value in sorted(snapshot['counters'].items()):
+            lines.append(f"{name:<18}{value:>9,}")
+        return "\n".join(lines)
+
+
+# Shared registry for the whole process; main.py opens its metrics file
+default_metrics = Metrics()
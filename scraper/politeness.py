@@ -0,0 +1,172 @@
+"""Per-host rate limiting shared by the scrapers and the geocoder."""
+import threading
+import time
+from contextlib import contextmanager
+
+import requests
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+from config import DEFAULT_REQUESTS_PER_SECOND, HOST_RATE_LIMITS, USER_AGENT
+
+
+class _Bucket:
+    """Token bucket for one host."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+
+class HostScheduler:
+    """
+    Token-bucket politeness scheduler keyed by host.
+
+    ``wait(url)`` blocks only the calling thread, and only until that
+    host's next request slot, so work for other hosts keeps flowing while
+    one host is throttled. The first request to a host reads its
+    robots.txt and slows the host down to any ``Crawl-delay`` it asks for.
+    """
+
+    def __init__(self, rate: float = DEFAULT_REQUESTS_PER_SECOND, burst: int = 1,
+                 host_rates: Optional[Dict[str, float]] = None,
+                 respect_robots: bool = True, user_agent: str = USER_AGENT):
+        """
+        Initialize scheduler.
+
+        Args:
+            rate: Default requests per second for each host
+            burst: Requests a host may receive back to back after idling
+            host_rates: Per-host overrides of ``rate`` (robots.txt is not
+                consulted for these hosts)
+            respect_robots: Apply robots.txt Crawl-delay / Request-rate
+            user_agent: User agent matched against robots.txt rules
+        """
+        self.rate = rate
+        self.burst = burst
+        self.host_rates = dict(HOST_RATE_LIMITS if host_rates is None else host_rates)
+        self.respect_robots = respect_robots
+        self.user_agent = user_agent
+        self._buckets: Dict[str, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url_or_host: str) -> str:
+        """Return the lower-cased host for a URL (or pass a bare host through)."""
+        if '://' not in url_or_host:
+            return url_or_host.lower()
+        return urlparse(url_or_host).netloc.lower()
+
+    def set_rate(self, host: str, rate: float):
+        """Override the request rate for a host."""
+        host = self.host_of(host)
+        with self._lock:
+            self.host_rates[host] = rate
+            if host in self._buckets:
+                self._buckets[host].rate = rate
+
+    @contextmanager
+    def slowed(self, host: str, rate: float) -> Iterator[float]:
+        """
+        Lower a host's request rate for the duration of a block.
+
+        The rate is only ever reduced: a host already slower than ``rate``
+        keeps its own pace, so callers cannot exceed a usage policy. The
+        previous rate is restored on exit.
+
+        Yields:
+            The rate in effect inside the block
+        """
+        host = self.host_of(host)
+        with self._lock:
+            had_override = host in self.host_rates
+            previous = self.host_rates.get(host)
+            bucket = self._buckets.get(host)
+            bucket_rate = bucket.rate if bucket else None
+            current = bucket_rate or previous or self.rate
+            capped = min(current, rate)
+            self.host_rates[host] = capped
+            if bucket:
+                bucket.rate = capped
+        try:
+            yield capped
+        finally:
+            with self._lock:
+                if had_override:
+                    self.host_rates[host] = previous
+                else:
+                    self.host_rates.pop(host, None)
+                bucket = self._buckets.get(host)
+                if bucket:
+                    bucket.rate = bucket_rate or previous or self.rate
+
+    def robots_rate(self, url: str) -> Optional[float]:
+        """Return the rate a site's robots.txt asks for, or None."""
+        parts = urlparse(url)
+        try:
+            response = requests.get(f"{parts.scheme}://{parts.netloc}/robots.txt", timeout=10,
+                                    headers={'User-Agent': self.user_agent})
+        except requests.RequestException:
+            return None
+        if response.status_code != 200:
+            return None
+        parser = RobotFileParser()
+        parser.parse(response.text.splitlines())
+
+        rates = []
+        delay = parser.crawl_delay(self.user_agent)
+        if delay:
+            rates.append(1 / float(delay))
+        request_rate = parser.request_rate(self.user_agent)
+        if request_rate and request_rate.seconds:
+            rates.append(request_rate.requests / request_rate.seconds)
+        return min(rates) if rates else None
+
+    def _bucket(self, url_or_host: str) -> _Bucket:
+        """Get (or create) the bucket for a host."""
+        host = self.host_of(url_or_host)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket:
+                return bucket
+            override = self.host_rates.get(host)
+            bucket = _Bucket(override or self.rate, self.burst)
+            self._buckets[host] = bucket
+            # Held until robots.txt is known, so other threads for this
+            # host queue behind it without blocking the global lock
+            bucket.lock.acquire()
+
+        try:
+            if override is None and self.respect_robots and '://' in url_or_host:
+                robots = self.robots_rate(url_or_host)
+                if robots:
+                    bucket.rate = min(bucket.rate, robots)
+        finally:
+            bucket.lock.release()
+        return bucket
+
+    def reserve(self, url_or_host: str) -> float:
+        """Take a request slot for a host and return seconds until it may be used."""
+        bucket = self._bucket(url_or_host)
+        with bucket.lock:
+            now = time.monotonic()
+            bucket.tokens = min(bucket.burst, bucket.tokens + (now - bucket.updated) * bucket.rate)
+            bucket.updated = now
+            bucket.tokens -= 1
+            # A negative balance is the queue of requests already promised
+            return 0.0 if bucket.tokens >= 0 else -bucket.tokens / bucket.rate
+
+    def wait(self, url_or_host: str) -> float:
+        """Block until the host may be contacted again; return seconds slept."""
+        delay = self.reserve(url_or_host)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+# Shared by default so every scraper and the geocoder see the same budgets
+default_scheduler = HostScheduler()
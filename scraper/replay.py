@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Re-run diocese parsers against archived pages, with no network or database.
+
+Useful for iterating on extraction heuristics: record pages once with
+``main.py --archive``, then run this as often as needed. Output is one JSON
+object per parish, so two runs can be diffed to review a parser change.
+"""
+import argparse
+import json
+import sys
+import time
+from contextlib import redirect_stdout
+
+from config import ARCHIVE_DIR, DIOCESES
+from main import get_scraper
+from scrapers.archive import PageArchive
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Replay archived diocese pages through the scrapers.")
+    parser.add_argument('--archive', default=ARCHIVE_DIR, help=f"Archive directory (default: {ARCHIVE_DIR})")
+    parser.add_argument('--diocese', action='append',
+                        help="Only replay this diocese (may be repeated)")
+    parser.add_argument('--output', help="Write parish JSON lines here instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Main function."""
+    args = parse_args(argv)
+    archive = PageArchive(args.archive, replay=True)
+    dioceses = [d for d in DIOCESES if not args.diocese or d['name'] in args.diocese]
+    
+    out = open(args.output, 'w') if args.output else sys.stdout
+    total = 0
+    started = time.perf_counter()
+    
+    try:
+        for diocese_config in dioceses:
+            scraper = get_scraper(diocese_config, archive=archive)
+            if not scraper:
+                continue
+            # Keep scraper progress output out of the JSON stream
+            with redirect_stdout(sys.stderr):
+                parishes = scraper.scrape_parish_list(diocese_config['parishes_page'])
+            for parish in parishes:
+                out.write(json.dumps(parish, sort_keys=True) + '\n')
+            total += len(parishes)
+    finally:
+        if args.output:
+            out.close()
+            
+    elapsed = time.perf_counter() - started
+    print(f"✅ Replayed {len(dioceses)} dioceses: {total} parishes in {elapsed:.2f}s", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""Checkpoints for scrape runs so an interrupted run can pick up where it stopped.
+
+Each ``main.py`` run is a row in ``scrape_runs``. Every diocese in it has a
+state in ``run_dioceses``, and every page the scrapers touch has one in
+``run_urls``. Parsed detail pages keep their parish record, so a resumed
+run reuses them instead of fetching the page again.
+
+Diocese states: pending -> saved | unchanged | failed, then geocoded
+once none of its parishes wait in the geocode queue. URL states: pending
+-> fetched -> parsed | unchanged | failed, then saved with its diocese.
+
+Run this file directly to list recent runs.
+"""
+import argparse
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from config import RUN_LEDGER_PATH
+
+# Diocese states that need no more work in a run
+DONE_STATES = ('saved', 'unchanged', 'geocoded')
+
+# scrape_log status -> diocese state
+LOG_STATES = {'success': 'saved', 'unchanged': 'unchanged', 'partial': 'failed', 'failed': 'failed'}
+
+
+class RunLedger:
+    """
+    Records per-diocese and per-URL progress of scrape runs.
+
+    Scraper worker threads write URL states while the main thread writes
+    diocese states, so all access goes through one lock-guarded
+    connection. The ledger lives in its own database file so its frequent
+    small commits never wait on parish writes.
+    """
+
+    def __init__(self, path: str = RUN_LEDGER_PATH):
+        """Open (or create) the run ledger database."""
+        self.path = path
+        self.run_id: Optional[int] = None
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS scrape_runs (
+              id INTEGER PRIMARY KEY AUTOINCREMENT,
+              status TEXT NOT NULL DEFAULT 'running',  -- running, finished
+              options TEXT,
+              started_at TIMESTAMP,
+              finished_at TIMESTAMP
+            );
+            CREATE TABLE IF NOT EXISTS run_dioceses (
+              run_id INTEGER NOT NULL,
+              diocese TEXT NOT NULL,
+              status TEXT NOT NULL DEFAULT 'pending',
+              parishes INTEGER,
+              error TEXT,
+              updated_at TIMESTAMP,
+              PRIMARY KEY (run_id, diocese)
+            );
+            CREATE TABLE IF NOT EXISTS run_urls (
+              run_id INTEGER NOT NULL,
+              url TEXT NOT NULL,
+              diocese TEXT NOT NULL,
+              status TEXT NOT NULL,
+              parish TEXT,  -- Parsed record (JSON) once the page is parsed
+              updated_at TIMESTAMP,
+              PRIMARY KEY (run_id, url)
+            );
+            CREATE INDEX IF NOT EXISTS idx_run_urls_diocese ON run_urls(run_id, diocese);
+            CREATE INDEX IF NOT EXISTS idx_run_dioceses_name ON run_dioceses(diocese, run_id);
+        """)
+        self.conn.commit()
+
+    def close(self):
+        """Close the ledger database."""
+        with self._lock:
+            self.conn.close()
+
+    def start_run(self, dioceses: Iterable[str], options: Optional[Dict] = None) -> int:
+        """
+        Begin a new run with every diocese pending.
+
+        Returns:
+            The new run id
+        """
+        now = datetime.now().isoformat()
+        with self._lock:
+            cursor = self.conn.execute(
+                "INSERT INTO scrape_runs (options, started_at) VALUES (?, ?)",
+                (json.dumps(options or {}), now)
+            )
+            self.run_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO run_dioceses (run_id, diocese, updated_at) VALUES (?, ?, ?)",
+                [(self.run_id, diocese, now) for diocese in dioceses]
+            )
+            self.conn.commit()
+        return self.run_id
+
+    def resume_run(self) -> Optional[int]:
+        """
+        Reopen the most recent run that did not finish.
+
+        Returns:
+            Its run id, or None if the last run finished
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT id, status FROM scrape_runs ORDER BY id DESC LIMIT 1"
+            ).fetchone()
+        if not row or row['status'] == 'finished':
+            return None
+        self.run_id = row['id']
+        return self.run_id
+
+    def finish_run(self):
+        """Mark the current run as finished."""
+        with self._lock:
+            self.conn.execute(
+                "UPDATE scrape_runs SET status = 'finished', finished_at = ? WHERE id = ?",
+                (datetime.now().isoformat(), self.run_id)
+            )
+            self.conn.commit()
+
+    def remaining_dioceses(self) -> List[str]:
+        """Dioceses of the current run that are not done yet."""
+        placeholders = ', '.join('?' * len(DONE_STATES))
+        with self._lock:
+            rows = self.conn.execute(
+                f"SELECT diocese FROM run_dioceses WHERE run_id = ? AND status NOT IN ({placeholders})",
+                (self.run_id, *DONE_STATES)
+            ).fetchall()
+        return [row['diocese'] for row in rows]
+
+    def failed_dioceses(self) -> List[str]:
+        """Dioceses whose most recent attempt, in any run, failed."""
+        with self._lock:
+            rows = self.conn.execute("""
+                SELECT diocese, status FROM run_dioceses d
+                WHERE run_id = (SELECT MAX(run_id) FROM run_dioceses
+                                WHERE diocese = d.diocese AND status != 'pending')
+            """).fetchall()
+        return [row['diocese'] for row in rows if row['status'] == 'failed']
+
+    def finish_diocese(self, diocese: str, log_status: str, parishes: int = 0,
+                       error: Optional[str] = None):
+        """
+        Record a diocese's outcome from its scrape_log status.
+
+        A saved diocese also marks its parsed pages as saved.
+        """
+        status = LOG_STATES.get(log_status, 'failed')
+        now = datetime.now().isoformat()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO run_dioceses (run_id, diocese, status, parishes, error, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (self.run_id, diocese, status, parishes, error, now)
+            )
+            if status == 'saved':
+                self.conn.execute(
+                    "UPDATE run_urls SET status = 'saved', updated_at = ? "
+                    "WHERE run_id = ? AND diocese = ? AND status IN ('fetched', 'parsed')",
+                    (now, self.run_id, diocese)
+                )
+            self.conn.commit()
+
+    def mark_geocoded(self, waiting: Iterable[str]):
+        """Move saved dioceses to geocoded unless they have parishes in ``waiting``."""
+        waiting = set(waiting)
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT diocese FROM run_dioceses WHERE run_id = ? AND status = 'saved'",
+                (self.run_id,)
+            ).fetchall()
+            self.conn.executemany(
+                "UPDATE run_dioceses SET status = 'geocoded', updated_at = ? WHERE run_id = ? AND diocese = ?",
+                [(datetime.now().isoformat(), self.run_id, row['diocese'])
+                 for row in rows if row['diocese'] not in waiting]
+            )
+            self.conn.commit()
+
+    def mark_url(self, diocese: str, url: str, status: str, parish: Optional[Dict] = None):
+        """Record a page's state, keeping the parsed record when given."""
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO run_urls (run_id, url, diocese, status, parish, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (self.run_id, url, diocese, status,
+                 json.dumps(parish, ensure_ascii=False) if parish is not None else None,
+                 datetime.now().isoformat())
+            )
+            self.conn.commit()
+
+    def parsed(self, url: str) -> Optional[Dict]:
+        """The parish parsed from a page earlier in this run, if any."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT parish FROM run_urls WHERE run_id = ? AND url = ? AND status IN ('parsed', 'saved') "
+                "AND parish IS NOT NULL",
+                (self.run_id, url)
+            ).fetchone()
+        return json.loads(row['parish']) if row else None
+
+    def summary(self, run_id: Optional[int] = None) -> Dict[str, Dict[str, int]]:
+        """Counts of dioceses and URLs per state for a run (default: the current one)."""
+        run_id = run_id or self.run_id
+        with self._lock:
+            dioceses = self.conn.execute(
+                "SELECT status, COUNT(*) FROM run_dioceses WHERE run_id = ? GROUP BY status", (run_id,)
+            ).fetchall()
+            urls = self.conn.execute(
+                "SELECT status, COUNT(*) FROM run_urls WHERE run_id = ? GROUP BY status", (run_id,)
+            ).fetchall()
+        return {'dioceses': {row[0]: row[1] for row in dioceses},
+                'urls': {row[0]: row[1] for row in urls}}
+
+
+def main(argv=None):
+    """List recent scrape runs and their progress."""
+    parser = argparse.ArgumentParser(description="Show recent scrape runs from the run ledger.")
+    parser.add_argument('--ledger', default=RUN_LEDGER_PATH, help="Path to run_ledger.db")
+    parser.add_argument('--limit', type=int, default=10, help="Runs to show (default: 10)")
+    args = parser.parse_args(argv)
+
+    ledger = RunLedger(args.ledger)
+    runs = ledger.conn.execute(
+        "SELECT id, status, started_at, finished_at FROM scrape_runs ORDER BY id DESC LIMIT ?",
+        (args.limit,)
+    ).fetchall()
+    for run in runs:
+        summary = ledger.summary(run['id'])
+        dioceses = ', '.join(f"{count} {status}" for status, count in sorted(summary['dioceses'].items()))
+        urls = ', '.join(f"{count} {status}" for status, count in sorted(summary['urls'].items()))
+        print(f"🗂️  Run {run['id']} ({run['status']}, started {run['started_at']})")
+        print(f"   Dioceses: {dioceses or 'none'}")
+        print(f"   Pages: {urls or 'none'}")
+    ledger.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""Parse free-form Mass schedules into normalized weekday/time records.
+
+Scrapers store whatever schedule text a parish page shows, e.g.::
+
+    Saturday: 5:00 PM (Vigil) Sunday: 8, 10:30 AM, 12:30 PM (Spanish)
+    Weekdays: Mon-Fri 12:10 PM  Confessions: Sat 3:30-4:30 PM
+
+``parse_schedule`` turns that into ``MassTime`` records, which
+ParishDatabase keeps in the ``mass_schedule`` table. Weekdays are numbered
+0 = Sunday to 6 = Saturday, as in SQLite's strftime('%w') and JavaScript's
+Date.getDay().
+
+Run this file directly to re-parse every stored schedule.
+"""
+import argparse
+import json
+import re
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+WEEKDAYS = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
+_DAY_INDEX = {name[:3].lower(): index for index, name in enumerate(WEEKDAYS)}
+
+DAY_GROUPS = {
+    'weekday': [1, 2, 3, 4, 5],
+    'daily': [1, 2, 3, 4, 5],
+    'weekend': [6, 0],
+}
+
+# Service words: the type recorded for the times that follow. None means
+# the times are not worship times (parish office hours, bingo, ...), and
+# 'holyday' means they belong to no weekday.
+SERVICE_TYPES = [
+    (r'confessions?|reconciliation|penance', 'Confession'),
+    (r'adoration|exposition|holy\s+hour', 'Adoration'),
+    (r'holy\s+days?(?:\s+of\s+obligation)?', 'holyday'),
+    (r'masse?s?|liturgy|vigil|anticipated', 'Mass'),
+    (r'office(?:\s+hours)?|rosary|novena|stations\s+of\s+the\s+cross|bingo|meeting|'
+     r'religious\s+education|faith\s+formation|ccd|choir|rehearsal', None),
+]
+
+LANGUAGES = [
+    (r'spanish|espa[ñn]ol', 'Spanish'),
+    (r'latin|tridentine|extraordinary\s+form', 'Latin'),
+    (r'vietnamese', 'Vietnamese'),
+    (r'polish', 'Polish'),
+    (r'korean', 'Korean'),
+    (r'tagalog|filipino', 'Tagalog'),
+    (r'portuguese', 'Portuguese'),
+    (r'french', 'French'),
+    (r'italian', 'Italian'),
+    (r'german', 'German'),
+    (r'chinese|mandarin|cantonese', 'Chinese'),
+    (r'haitian\s+creole|creole', 'Haitian Creole'),
+    (r'asl|sign\s+language', 'ASL'),
+    (r'english', 'English'),
+]
+
+_DAY = (r'\b(?:sun(?:day)?|mon(?:day)?|tue(?:s|sday)?|wed(?:nesday)?|thu(?:r|rs|rsday)?|'
+        r'fri(?:day)?|sat(?:urday)?)s?\b\.?')
+_CLOCK = r'\d{1,2}(?::[0-5]\d)?(?:\s*[ap]\.?\s?m\b\.?|[ap]\b)?(?![\d/])'
+# A time may not follow a dash ("555-1234", "2024-06"); only the end of a
+# range may, since the range's own dash was matched just before it
+_TIME = rf'(?:(?<![\w/:.$#-]){_CLOCK})|\bnoon\b|\bmidnight\b'
+_RANGE_END = rf'(?:(?<![\w/:.$#]){_CLOCK})|\bnoon\b|\bmidnight\b'
+_RANGE = r'\s*(?:-|–|—|\bto\b|\bthrough\b|\bthru\b|\buntil\b)\s*'
+
+TOKEN_RE = re.compile(
+    rf'(?P<day_range>{_DAY}{_RANGE}{_DAY})'
+    rf'|(?P<day_group>\b(?:weekdays?|daily|weekends?)\b)'
+    rf'|(?P<day>{_DAY})'
+    rf'|(?P<time_range>(?:{_TIME}){_RANGE}(?:{_RANGE_END}))'
+    rf'|(?P<time>{_TIME})'
+    rf'|(?P<service>\b(?:{"|".join(pattern for pattern, _ in SERVICE_TYPES)})\b)'
+    rf'|(?P<language>\b(?:{"|".join(pattern for pattern, _ in LANGUAGES)})\b)'
+    rf'|(?P<separator>[\n;|])',
+    re.IGNORECASE
+)
+DAY_RE = re.compile(_DAY, re.IGNORECASE)
+CLOCK_RE = re.compile(
+    r'(?P<hour>\d{1,2})(?::(?P<minute>[0-5]\d))?(?:\s*(?P<meridiem>[ap])\.?\s?m\b\.?|(?P<short>[ap])\b)?'
+    r'|(?P<noon>noon)|(?P<midnight>midnight)',
+    re.IGNORECASE
+)
+# Text allowed between items of one list ("Sat & Sun", "8, 10:30 AM")
+JOINER_RE = re.compile(r'[\s,&/+]*(?:and\s*)?', re.IGNORECASE)
+# Text allowed between a time and a language that annotates it ("12 PM (Spanish)")
+ANNOTATION_RE = re.compile(r'[\s(\[\-–—,:]*(?:in\s+)?', re.IGNORECASE)
+# A language directly followed by a service word, day or time introduces
+# those ("10 AM, Spanish Mass 1 PM") rather than annotating the time before it
+LANGUAGE_PREFIX_RE = re.compile(
+    rf'[\s:]*(?:\b(?:{"|".join(pattern for pattern, _ in SERVICE_TYPES)})\b|{_DAY}|{_TIME})',
+    re.IGNORECASE
+)
+
+
+class MassTime(NamedTuple):
+    """One weekly service."""
+    weekday: int  # 0 = Sunday ... 6 = Saturday
+    minute_of_day: int  # 0-1439, local time at the parish
+    type: str  # 'Mass', 'Confession' or 'Adoration'
+    language: Optional[str] = None  # None when the schedule does not say
+
+
+def _lookup(table, word: str):
+    """Value for the first (pattern, value) pair in ``table`` matching ``word``."""
+    for pattern, value in table:
+        if re.fullmatch(pattern, word, re.IGNORECASE):
+            return value
+    return None
+
+
+def _clock(text: str):
+    """
+    Parse one clock reading.
+
+    Returns:
+        Tuple of (hour, minute, meridiem, explicit); meridiem is 'a', 'p'
+        or None, explicit is False for a bare hour like "8"
+    """
+    match = CLOCK_RE.fullmatch(text.strip())
+    if not match:
+        return None
+    if match.group('noon'):
+        return 12, 0, 'p', True
+    if match.group('midnight'):
+        return 12, 0, 'a', True
+    meridiem = (match.group('meridiem') or match.group('short') or '').lower() or None
+    minute = match.group('minute')
+    return int(match.group('hour')), int(minute or 0), meridiem, bool(meridiem or minute)
+
+
+def _minutes(hour: int, minute: int, meridiem: Optional[str]) -> Optional[int]:
+    """Minute of day, guessing the meridiem from the hour when it is missing."""
+    if hour > 23:
+        return None
+    if meridiem is None:
+        if hour == 0 or hour > 12:
+            return hour * 60 + minute  # 24-hour clock
+        # Masses run from early morning to evening: 7-11 are mornings,
+        # 12-6 afternoons and evenings
+        meridiem = 'a' if 7 <= hour <= 11 else 'p'
+    if hour > 12:
+        return None
+    hour = hour % 12 + (12 if meridiem == 'p' else 0)
+    return hour * 60 + minute
+
+
+def _days(match) -> List[int]:
+    """Weekdays named by a day, day_group or day_range token."""
+    kind = match.lastgroup
+    text = match.group(kind)
+    if kind == 'day_group':
+        return DAY_GROUPS[text.lower().rstrip('s')]
+    names = [name.lower()[:3] for name in DAY_RE.findall(text)]
+    days = [_DAY_INDEX[name] for name in names]
+    if kind == 'day_range' and len(days) == 2:
+        first, last = days
+        return [(first + offset) % 7 for offset in range((last - first) % 7 + 1)]
+    return days
+
+
+def schedule_text(value) -> str:
+    """
+    Flatten a stored mass_times value into parseable text.
+
+    Accepts plain text, a JSON string, or a dict/list such as
+    {"Sunday": ["8:00 AM", "10:30 AM"]}.
+    """
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        stripped = value.strip()
+        if not stripped.startswith(('{', '[')):
+            return value
+        try:
+            value = json.loads(stripped)
+        except ValueError:
+            return value
+    if isinstance(value, dict):
+        return '\n'.join(f"{key}: {schedule_text(item)}" for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return ', '.join(schedule_text(item) for item in value)
+    return str(value)
+
+
+def parse_schedule(value) -> List[MassTime]:
+    """
+    Parse schedule text into weekly service times.
+
+    Days apply to the times after them until the next day. "Sat & Sun",
+    "Mon-Fri", "Weekdays" and "Daily" (Monday-Friday) are understood. A
+    service word ("Confessions:") sets the type until the next line or
+    semicolon. A language either precedes its times ("Spanish Mass:
+    Sunday 1 PM", "10 AM, Spanish Mass 1 PM") or annotates the time just
+    before it ("1 PM (Spanish)"). A bare hour ("8, 10:30 AM") takes the
+    meridiem of the next time in the list, and a range ("3:30-4:30 PM",
+    "Sat 11-12") records its start.
+
+    Args:
+        value: Schedule text, or a dict/list/JSON value (see schedule_text)
+
+    Returns:
+        Distinct MassTime records in the order found
+    """
+    text = schedule_text(value)
+    records = []
+    days: List[int] = []
+    service = 'Mass'
+    language = None
+    language_used = False
+    last_time = []  # records from the most recent time token
+    pending = []  # bare hours waiting for the next time's meridiem
+    previous = None
+    previous_end = 0
+
+    def emit(minute_of_day):
+        nonlocal language_used
+        added = [[day, minute_of_day, service, language] for day in days]
+        records.extend(added)
+        language_used = True
+        return added
+
+    for match in TOKEN_RE.finditer(text):
+        kind = match.lastgroup
+        gap = text[previous_end:match.start()]
+        joined = JOINER_RE.fullmatch(gap) is not None
+
+        # Bare hours only count when a full time follows in the same list
+        if kind not in ('time', 'time_range') or not joined:
+            pending = []
+
+        if kind in ('day', 'day_group', 'day_range'):
+            new_days = _days(match)
+            if previous in ('day', 'day_group', 'day_range') and joined:
+                days = days + [day for day in new_days if day not in days]
+            else:
+                days = new_days
+                if language_used:
+                    language = None
+            last_time = []
+            if service == 'holyday':
+                service = 'Mass'
+        elif kind == 'separator':
+            service = 'Mass'
+            language = None
+            last_time = []
+        elif kind == 'service':
+            service = _lookup(SERVICE_TYPES, match.group(kind))
+            if service == 'holyday':
+                days = []
+            last_time = []
+        elif kind == 'language':
+            name = _lookup(LANGUAGES, match.group(kind))
+            if (last_time and previous in ('time', 'time_range') and ANNOTATION_RE.fullmatch(gap)
+                    and not LANGUAGE_PREFIX_RE.match(text, match.end())):
+                for record in last_time:
+                    record[3] = name
+            else:
+                language = name
+                language_used = False
+        elif kind in ('time', 'time_range'):
+            parts = re.split(_RANGE, match.group(kind), maxsplit=1, flags=re.IGNORECASE)
+            clock = _clock(parts[0])
+            if clock is None:
+                continue
+            hour, minute, meridiem, explicit = clock
+            if kind == 'time_range':
+                end = _clock(parts[1])
+                if meridiem is None and end and end[2]:
+                    # "3:30-4:30 PM": the start shares the end's meridiem
+                    # unless that would put it after the end ("11-1 PM")
+                    start = _minutes(hour, minute, end[2])
+                    if start is not None and start <= _minutes(end[0], end[1], end[2]):
+                        meridiem = end[2]
+                    else:
+                        meridiem = 'a'
+                # A range is a time on its own ("Sat 11-12"), never a bare
+                # hour waiting for the next time's meridiem
+                explicit = True
+
+            if not explicit:
+                pending.append((hour, minute))
+            elif service in ('Mass', 'Confession', 'Adoration'):
+                minute_of_day = _minutes(hour, minute, meridiem)
+                if minute_of_day is not None:
+                    for bare_hour, bare_minute in pending:
+                        bare = _minutes(bare_hour, bare_minute, meridiem)
+                        if bare is not None and bare > minute_of_day:
+                            bare = _minutes(bare_hour, bare_minute, 'a')
+                        if bare is not None:
+                            emit(bare)
+                    last_time = emit(minute_of_day)
+                pending = []
+            else:
+                pending = []
+
+        previous = kind
+        previous_end = match.end()
+
+    return list(dict.fromkeys(MassTime(*record) for record in records))
+
+
+def format_time(minute_of_day: int) -> str:
+    """Render a minute of day as "5:30 PM"."""
+    hour, minute = divmod(minute_of_day, 60)
+    return f"{hour % 12 or 12}:{minute:02d} {'AM' if hour < 12 else 'PM'}"
+
+
+def worship_times(times: List[MassTime]) -> List[dict]:
+    """Convert records to the front end's WorshipTime shape (day/time/type/language)."""
+    result = []
+    for mass in sorted(times, key=lambda m: (m.weekday, m.minute_of_day)):
+        item = {'day': WEEKDAYS[mass.weekday], 'time': format_time(mass.minute_of_day),
+                'type': mass.type}
+        if mass.language:
+            item['language'] = mass.language
+        result.append(item)
+    return result
+
+
+def main(argv=None):
+    """Re-parse the mass_times text of every parish into mass_schedule and service_index."""
+    from database import ParishDatabase
+
+    parser = argparse.ArgumentParser(description="Rebuild the mass_schedule table from stored schedule text.")
+    parser.add_argument('--db', default=str(Path(__file__).parent / "parishes.db"),
+                        help="Path to parishes.db")
+    args = parser.parse_args(argv)
+
+    with ParishDatabase(args.db) as db:
+        db.initialize()
+        parishes, times = db.rebuild_schedules()
+        indexed = db.rebuild_service_index()
+    print(f"✅ Parsed {times} service times for {parishes} parishes ({indexed} indexed by tile)")
+
+
+if __name__ == '__main__':
+    main()
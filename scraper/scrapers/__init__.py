@@ -1,5 +1,8 @@
 """Scrapers for various diocese websites."""
+from .archive import PageArchive
 from .base_scraper import BaseScraper
+from .generic import GenericScraper
 from .lexington import LexingtonScraper
+from .page_state import PageStateStore, PageUnchanged
 
-__all__ = ['BaseScraper', 'LexingtonScraper']
+__all__ = ['BaseScraper', 'GenericScraper', 'PageArchive', 'LexingtonScraper', 'PageStateStore', 'PageUnchanged']
@@ -0,0 +1,207 @@
+"""Postal address normalization shared by the scrapers and the geocoder.
+
+Two spellings of one address ("214 S Lake Dr" and "214 South Lake Drive,")
+should produce the same key, so cache lookups and duplicate checks can
+compare them directly. Street words are reduced to USPS Publication 28
+abbreviations, and case, punctuation and whitespace are folded.
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+from .extraction import STATE_CODES, WHITESPACE_RE, ZIP_RE
+
+# USPS Publication 28, Appendix C1 (the suffixes seen in practice)
+STREET_SUFFIXES = {
+    'alley': 'aly', 'annex': 'anx', 'avenue': 'ave', 'av': 'ave', 'bend': 'bnd',
+    'bluff': 'blf', 'boulevard': 'blvd', 'branch': 'br', 'bridge': 'brg',
+    'brook': 'brk', 'bypass': 'byp', 'causeway': 'cswy', 'center': 'ctr',
+    'centre': 'ctr', 'circle': 'cir', 'cove': 'cv', 'court': 'ct', 'creek': 'crk',
+    'crossing': 'xing', 'drive': 'dr', 'estates': 'ests', 'expressway': 'expy',
+    'extension': 'ext', 'ferry': 'fry', 'field': 'fld', 'fork': 'frk',
+    'freeway': 'fwy', 'garden': 'gdn', 'gardens': 'gdns', 'glen': 'gln',
+    'green': 'grn', 'grove': 'grv', 'harbor': 'hbr', 'heights': 'hts',
+    'highway': 'hwy', 'hill': 'hl', 'hills': 'hls', 'hollow': 'holw',
+    'island': 'is', 'junction': 'jct', 'lake': 'lk', 'lakes': 'lks',
+    'landing': 'lndg', 'lane': 'ln', 'manor': 'mnr', 'meadow': 'mdw',
+    'meadows': 'mdws', 'mill': 'ml', 'mills': 'mls', 'mountain': 'mtn',
+    'orchard': 'orch', 'parkway': 'pkwy', 'place': 'pl', 'plaza': 'plz',
+    'point': 'pt', 'port': 'prt', 'ranch': 'rnch', 'ridge': 'rdg', 'river': 'riv',
+    'road': 'rd', 'route': 'rte', 'square': 'sq', 'station': 'sta',
+    'street': 'st', 'str': 'st', 'summit': 'smt', 'terrace': 'ter',
+    'trace': 'trce', 'trail': 'trl', 'turnpike': 'tpke', 'valley': 'vly',
+    'view': 'vw', 'village': 'vlg', 'vista': 'vis',
+}
+
+DIRECTIONALS = {
+    'north': 'n', 'south': 's', 'east': 'e', 'west': 'w',
+    'northeast': 'ne', 'northwest': 'nw', 'southeast': 'se', 'southwest': 'sw',
+}
+
+# USPS Publication 28, Appendix C2
+UNIT_DESIGNATORS = {
+    'apartment': 'apt', 'building': 'bldg', 'department': 'dept', 'floor': 'fl',
+    'room': 'rm', 'suite': 'ste', 'unit': 'unit',
+}
+
+# Common in parish addresses ("Saint Peter Street", "Mount Carmel Road")
+NAME_WORDS = {'saint': 'st', 'mount': 'mt', 'fort': 'ft'}
+
+ABBREVIATIONS = {**STREET_SUFFIXES, **DIRECTIONALS, **UNIT_DESIGNATORS, **NAME_WORDS}
+
+# Everything but letters, digits, '#', '/' (1/2) and '-' (123-A)
+PUNCTUATION_RE = re.compile(r'[^\w#/\- ]+')
+UNIT_RE = re.compile(
+    r'\s+(?:#\s*|(?:apt|apartment|bldg|building|dept|fl|floor|rm|room|ste|suite|unit)\.?\s+#?)[\w\-]+$',
+    re.IGNORECASE
+)
+# "KY 40503", "Ky", "KY" or "40503" at the end of an address part
+TAIL_RE = re.compile(
+    r'(?:^|\s)(?:(?P<state>[A-Za-z]{2})(?:\s+(?P<zip>\d{5}(?:-\d{4})?))?|(?P<zip_only>\d{5}(?:-\d{4})?))$'
+)
+# Trailing country parts dropped before the state/ZIP (compared folded)
+COUNTRY_NAMES = frozenset({'us', 'usa', 'u s', 'u s a', 'united states', 'united states of america'})
+
+_STATE_SET = frozenset(STATE_CODES)
+
+
+def fold(text: Optional[str]) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    if not text:
+        return ''
+    return " ".join(PUNCTUATION_RE.sub(' ', text.lower()).split())
+
+
+def normalize_street(street: Optional[str]) -> str:
+    """
+    Reduce a street line to its comparison form.
+
+    Example:
+        "214 South Lake Drive" and "214 S. Lake Dr" both give "214 s lk dr"
+    """
+    return " ".join(ABBREVIATIONS.get(word, word) for word in fold(street).split())
+
+
+def strip_unit(street: str) -> str:
+    """Remove a trailing suite/apartment/unit designator from a street line."""
+    return UNIT_RE.sub('', street).strip()
+
+
+def zip5(zip_code: Optional[str]) -> Optional[str]:
+    """First five digits of a ZIP code, or None if it is not one."""
+    if not zip_code:
+        return None
+    digits = zip_code.strip()[:5]
+    return digits if len(digits) == 5 and digits.isdigit() else None
+
+
+def _split_tail(part: str) -> Tuple[str, Optional[str], Optional[str]]:
+    """
+    Split a trailing state and/or ZIP off one comma-separated part.
+
+    Returns:
+        Tuple of (remainder, state, zip); state and zip are None if absent
+    """
+    match = TAIL_RE.search(part)
+    if not match:
+        return part, None, None
+    state = match.group('state')
+    if state:
+        state = state.upper()
+        if state not in _STATE_SET:
+            return part, None, None
+    return part[:match.start()].strip(), state, match.group('zip') or match.group('zip_only')
+
+
+def _parts(text: Optional[str]) -> List[str]:
+    """Comma-separated parts of an address, without a trailing country."""
+    parts = [part.strip() for part in (text or '').split(',') if part.strip()]
+    if len(parts) > 1 and fold(parts[-1]) in COUNTRY_NAMES:
+        parts.pop()
+    return parts
+
+
+def split_address(text: str, default_state: Optional[str] = None) -> Dict[str, Optional[str]]:
+    """
+    Parse address text into components.
+
+    Handles "123 Main St, Lexington, KY 40503", "123 Main St, Lexington KY
+    40503", a suite line between street and city, a state in any case
+    ("Ky") and a trailing "USA".
+
+    Args:
+        text: Full address string
+        default_state: State to use when the text names none
+
+    Returns:
+        Dictionary with address (the cleaned full text), street, city,
+        state and zip
+    """
+    text = WHITESPACE_RE.sub(' ', text or '').strip()
+    result = {'address': text, 'street': None, 'city': None,
+              'state': default_state, 'zip': None}
+
+    parts = _parts(text)
+    if not parts:
+        return result
+
+    if len(parts) > 1:
+        rest, state, zip_code = _split_tail(parts[-1])
+        result['state'] = state or result['state']
+        result['zip'] = zip_code
+        parts[-1:] = [rest] if rest else []
+
+    if len(parts) >= 2:
+        result['street'] = ", ".join(parts[:-1])
+        result['city'] = parts[-1]
+    else:
+        result['street'] = parts[0]
+
+    if not result['zip']:
+        # A ZIP elsewhere in the text, skipping a five-digit house number
+        for match in ZIP_RE.finditer(text):
+            if match.start() > 0:
+                result['zip'] = match.group(0)
+                break
+
+    return result
+
+
+def dedupe_components(address: Optional[str], city: Optional[str] = None,
+                      state: Optional[str] = None,
+                      zip_code: Optional[str] = None) -> Tuple[str, Optional[str], Optional[str], Optional[str]]:
+    """
+    Remove the city, state and ZIP from ``address`` when it already ends with them.
+
+    Scraped and seeded rows often store the full "street, city, ST ZIP"
+    line in ``address`` alongside the separate fields. Trailing parts are
+    only dropped when they agree with the given fields. A missing state or
+    ZIP is filled in from the address.
+
+    Returns:
+        Tuple of (address, city, state, zip)
+    """
+    parts = _parts(address)
+    # A single part is just a street; there is nothing to peel off
+    if len(parts) > 1:
+        rest, tail_state, tail_zip = _split_tail(parts[-1])
+        same_state = not state or not tail_state or tail_state == state.upper()
+        same_zip = not zip_code or not tail_zip or zip5(tail_zip) == zip5(zip_code)
+        if (tail_state or tail_zip) and same_state and same_zip:
+            state = state or tail_state
+            zip_code = zip_code or tail_zip
+            parts[-1:] = [rest] if rest else []
+        if len(parts) > 1 and city and fold(parts[-1]) == fold(city):
+            parts.pop()
+    return ", ".join(parts), city, state, zip_code
+
+
+def address_key(address: Optional[str], city: Optional[str] = None,
+                state: Optional[str] = None, zip_code: Optional[str] = None) -> str:
+    """
+    Canonical string for an address, equal for equivalent spellings.
+
+    Used as the geocode cache key and for comparing parish addresses.
+    """
+    address, city, state, zip_code = dedupe_components(address, city, state, zip_code)
+    parts = [normalize_street(address), fold(city), (state or '').lower(), zip5(zip_code)]
+    return ", ".join(part for part in parts if part)
@@ -0,0 +1,78 @@
+"""Append-only archive of raw fetched pages for offline re-parsing."""
+import base64
+import gzip
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlparse
+
+from config import ARCHIVE_DIR
+
+
+class PageArchive:
+    """
+    Stores raw HTTP responses in gzip-compressed JSON-lines files.
+    
+    Each host gets its own ``<host>.jsonl.gz`` file. Records are appended
+    as separate gzip members, so the files are never rewritten and stay
+    readable even if a run is interrupted mid-write.
+    
+    In replay mode the archive serves the newest stored body for each URL
+    instead of touching the network.
+    """
+    
+    def __init__(self, directory: str = ARCHIVE_DIR, replay: bool = False):
+        """
+        Open an archive directory.
+        
+        Args:
+            directory: Directory holding the archive files
+            replay: Serve pages from the archive rather than recording them
+        """
+        self.directory = Path(directory)
+        self.replay = replay
+        self._lock = threading.Lock()
+        self._index: Dict[str, Dict[str, bytes]] = {}
+        if not replay:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            
+    def _host_file(self, url: str) -> Path:
+        """Return the archive file for a URL's host."""
+        host = urlparse(url).netloc.lower().replace(':', '_') or 'local'
+        return self.directory / f"{host}.jsonl.gz"
+        
+    def record(self, url: str, status: int, headers: Dict[str, str], body: bytes):
+        """Append a raw response to the archive."""
+        entry = {
+            'url': url,
+            'status': status,
+            'headers': dict(headers),
+            'fetched_at': datetime.now().isoformat(),
+            'body': base64.b64encode(body).decode('ascii'),
+        }
+        line = (json.dumps(entry) + '\n').encode('utf-8')
+        with self._lock:
+            with gzip.open(self._host_file(url), 'ab') as f:
+                f.write(line)
+                
+    def records(self, path: Path) -> Iterator[Dict]:
+        """Iterate over the records in one archive file, oldest first."""
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+                    
+    def load(self, url: str) -> Optional[bytes]:
+        """Return the newest archived body for a URL, or None if absent."""
+        path = self._host_file(url)
+        with self._lock:
+            if path.name not in self._index:
+                bodies = {}
+                if path.exists():
+                    for entry in self.records(path):
+                        bodies[entry['url']] = entry['body']
+                self._index[path.name] = bodies
+            body = self._index[path.name].get(url)
+        return base64.b64decode(body) if body is not None else None
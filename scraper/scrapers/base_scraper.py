@@ -1,30 +1,188 @@
 """Base scraper with generic logic for diocese websites."""
+import hashlib
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
 import re
+import threading
 import time
-from typing import List, Dict, Optional
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from contextlib import nullcontext
+from functools import lru_cache
+from typing import Callable, Iterable, Iterator, List, Dict, Optional
+from urllib.parse import urldefrag, urljoin
+
+from config import (DEFAULT_HTML_PARSER, DETAIL_WORKERS, GENERIC_MAX_PAGES,
+                    SITEMAP_URL_PATTERN, USER_AGENT)
+from metrics import default_metrics
+from politeness import default_scheduler
+from .address import split_address
+from .discovery import listing_pages, site_sitemap_urls
+from .extraction import EMAIL_RE, PHONE_RE, WHITESPACE_RE, ZIP_RE, first_contacts
+from .page_state import PageUnchanged
+from .urls import canonicalize_url
+
+
+@lru_cache(maxsize=None)
+def resolve_parser(name: str) -> str:
+    """Return ``name`` if that BeautifulSoup backend is installed, else 'html.parser'."""
+    if builder_registry.lookup(name) is None:
+        print(f"⚠️  HTML parser '{name}' not installed, falling back to html.parser")
+        return 'html.parser'
+    return name
 
 
 class BaseScraper:
     """Base scraper class with common functionality."""
     
-    def __init__(self, diocese_name: str, diocese_state: str):
-        """Initialize scraper."""
+    def __init__(self, diocese_name: str, diocese_state: str, host_limiter=None,
+                 page_state=None, archive=None, parser: Optional[str] = None,
+                 scheduler=None, ledger=None, metrics=None):
+        """
+        Initialize scraper.
+
+        Args:
+            diocese_name: Name of the diocese being scraped
+            diocese_state: State abbreviation of the diocese
+            host_limiter: Optional crawler.HostLimiter shared between scrapers
+                to cap simultaneous requests per host
+            page_state: Optional PageStateStore; when set, pages are fetched
+                conditionally and unchanged pages raise PageUnchanged
+            archive: Optional PageArchive. Responses are recorded to it, or
+                in replay mode served from it with no network access
+            parser: BeautifulSoup backend (see config.DEFAULT_HTML_PARSER)
+            scheduler: politeness.HostScheduler pacing requests per host;
+                defaults to the process-wide shared scheduler
+            ledger: Optional run_ledger.RunLedger. Page states are recorded
+                to it and detail pages parsed earlier in the run are reused
+            metrics: metrics.Metrics receiving fetch/parse/extract timings;
+                defaults to the diocese's child of the shared registry
+        """
         self.diocese_name = diocese_name
         self.diocese_state = diocese_state
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'CatholicMassFinderBot/1.0 (Educational Project)'
-        })
+        self.host_limiter = host_limiter
+        self.page_state = page_state
+        self.archive = archive
+        self.parser = resolve_parser(parser or DEFAULT_HTML_PARSER)
+        self.scheduler = scheduler or default_scheduler
+        self.ledger = ledger
+        self.metrics = metrics or default_metrics.child(diocese_name)
+        self.unchanged_pages = 0  # Detail pages skipped as unchanged (see iter_details)
+        self._local = threading.local()
+        self._unchanged_lock = threading.Lock()
+        
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session for the calling thread (Session is not thread-safe)."""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({
+                'User-Agent': USER_AGENT
+            })
+            self._local.session = session
+        return session
         
-    def fetch_page(self, url: str, max_retries: int = 3) -> Optional[BeautifulSoup]:
-        """Fetch and parse a webpage."""
+    def fetch_page(self, url: str, max_retries: int = 3,
+                   parse_only: Optional[SoupStrainer] = None,
+                   conditional: bool = True) -> Optional[BeautifulSoup]:
+        """
+        Fetch and parse a webpage.
+        
+        With a page_state store, the request carries If-None-Match /
+        If-Modified-Since from the last successful run. A 304 response or
+        an identical body raises PageUnchanged so callers can skip parsing
+        and geocoding for the page. With a replay archive, the page is read
+        from disk instead.
+        
+        Args:
+            url: Page URL
+            max_retries: Maximum download attempts
+            parse_only: Optional SoupStrainer; only matching elements (and
+                their subtrees) are built, which is much cheaper on large
+                listing pages. Ignored by the html5lib backend.
+            conditional: Use page_state validators; listing pages pass
+                False because they must be read even when unchanged
+        """
+        started = time.perf_counter()
+        try:
+            content = self.fetch_bytes(url, max_retries, conditional)
+            if content is None:
+                return None
+            if self.ledger:
+                self.ledger.mark_url(self.diocese_name, canonicalize_url(url), 'fetched')
+            return self.parse_html(content, parse_only)
+        finally:
+            # Lets iter_details tell extraction time from fetch/parse time
+            self._local.fetch_seconds = (getattr(self._local, 'fetch_seconds', 0.0)
+                                         + time.perf_counter() - started)
+        
+    def fetch_bytes(self, url: str, max_retries: int = 3,
+                    conditional: bool = True) -> Optional[bytes]:
+        """
+        Fetch a page's raw body, from the replay archive when replaying.
+        
+        Args:
+            url: Page URL
+            max_retries: Maximum download attempts
+            conditional: Use page_state validators (see fetch_page); pass
+                False for pages that are always needed, such as robots.txt
+                and sitemaps
+        """
+        if self.archive and self.archive.replay:
+            with self.metrics.timer('fetch', url=url, source='archive') as event:
+                content = self.archive.load(url)
+                event['bytes'] = len(content) if content else 0
+            if content is None:
+                print(f"❌ Not in archive: {url}")
+            return content
+        return self.download(url, max_retries, conditional)
+        
+    def parse_html(self, content: bytes, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Parse raw page content with the configured backend."""
+        with self.metrics.timer('parse', bytes=len(content), parser=self.parser):
+            return BeautifulSoup(content, self.parser, parse_only=parse_only)
+        
+    def download(self, url: str, max_retries: int = 3,
+                 conditional: bool = True) -> Optional[bytes]:
+        """Download a page's raw body, honouring page_state and archiving it."""
+        page_state = self.page_state if conditional else None
+        previous = page_state.get(url) if page_state else None
+        headers = {}
+        if previous:
+            if previous['etag']:
+                headers['If-None-Match'] = previous['etag']
+            if previous['last_modified']:
+                headers['If-Modified-Since'] = previous['last_modified']
+                
         for attempt in range(max_retries):
             try:
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                return BeautifulSoup(response.content, 'html.parser')
+                # Wait for the host's politeness slot before taking a connection
+                # slot; the wait is its own stage so 'fetch' is network time
+                with self.metrics.timer('wait', log=False):
+                    self.scheduler.wait(url)
+                with self.metrics.timer('fetch', url=url) as event:
+                    limit = self.host_limiter.limit(url) if self.host_limiter else nullcontext()
+                    with limit:
+                        response = self.session.get(url, timeout=10, headers=headers)
+                    if response.status_code == 304 and previous:
+                        raise PageUnchanged(url)
+                    response.raise_for_status()
+                    event['bytes'] = len(response.content)
+                    
+                    if self.archive:
+                        self.archive.record(url, response.status_code, response.headers, response.content)
+                        
+                    if page_state:
+                        content_hash = hashlib.sha256(response.content).hexdigest()
+                        if previous and previous['content_hash'] == content_hash:
+                            raise PageUnchanged(url)
+                        page_state.stage(self.diocese_name, url,
+                                              response.headers.get('ETag'),
+                                              response.headers.get('Last-Modified'),
+                                              content_hash)
+                        
+                return response.content
             except requests.RequestException as e:
                 if attempt < max_retries - 1:
                     print(f"⚠️  Retry {attempt + 1}/{max_retries} for {url}")
@@ -34,28 +192,28 @@ class BaseScraper:
                     return None
         return None
         
+    def extract_contacts(self, text: str) -> Dict[str, Optional[str]]:
+        """
+        Extract the first phone, email, ZIP and state code in one scan.
+        
+        Prefer this over calling extract_phone/extract_email/extract_zip
+        separately, which scans the text once per field.
+        """
+        return first_contacts(text)
+        
     def extract_phone(self, text: str) -> Optional[str]:
         """Extract phone number from text."""
-        phone_patterns = [
-            r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # (123) 456-7890 or 123-456-7890
-            r'\d{3}[-.\s]\d{3}[-.\s]\d{4}',  # 123.456.7890
-        ]
-        for pattern in phone_patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(0)
-        return None
+        match = PHONE_RE.search(text)
+        return match.group(0) if match else None
         
     def extract_email(self, text: str) -> Optional[str]:
         """Extract email from text."""
-        email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
-        match = re.search(email_pattern, text)
+        match = EMAIL_RE.search(text)
         return match.group(0) if match else None
         
     def extract_zip(self, text: str) -> Optional[str]:
         """Extract ZIP code from text."""
-        zip_pattern = r'\b\d{5}(?:-\d{4})?\b'
-        match = re.search(zip_pattern, text)
+        match = ZIP_RE.search(text)
         return match.group(0) if match else None
         
     def clean_text(self, text: str) -> str:
@@ -63,7 +221,7 @@ class BaseScraper:
         if not text:
             return ""
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = WHITESPACE_RE.sub(' ', text)
         return text.strip()
         
     def parse_address(self, address_text: str) -> Dict[str, str]:
@@ -76,37 +234,7 @@ class BaseScraper:
         Returns:
             Dictionary with address, city, state, zip
         """
-        address_text = self.clean_text(address_text)
-        
-        result = {
-            'address': address_text,
-            'street': None,
-            'city': None,
-            'state': self.diocese_state,
-            'zip': None
-        }
-        
-        # Extract ZIP code
-        zip_code = self.extract_zip(address_text)
-        if zip_code:
-            result['zip'] = zip_code
-            
-        # Try to parse city, state, ZIP pattern
-        # Example: "123 Main St, Lexington, KY 40503"
-        parts = address_text.split(',')
-        if len(parts) >= 3:
-            result['street'] = parts[0].strip()
-            result['city'] = parts[1].strip()
-            # Last part might have state and ZIP
-            last_part = parts[-1].strip()
-            state_match = re.search(r'\b[A-Z]{2}\b', last_part)
-            if state_match:
-                result['state'] = state_match.group(0)
-        elif len(parts) == 2:
-            result['street'] = parts[0].strip()
-            result['city'] = parts[1].strip()
-            
-        return result
+        return split_address(self.clean_text(address_text), default_state=self.diocese_state)
         
     def find_parish_links(self, soup: BeautifulSoup, base_url: str) -> List[str]:
         """
@@ -119,8 +247,14 @@ class BaseScraper:
         Returns:
             List of parish detail page URLs
         """
-        parish_links = []
+        # Remove duplicates (by canonical form), keep page order
+        links = {}
+        for url in self.iter_parish_links(soup, base_url):
+            links.setdefault(canonicalize_url(url), url)
+        return list(links.values())
         
+    def iter_parish_links(self, soup: BeautifulSoup, base_url: str) -> Iterator[str]:
+        """Yield absolute links on a page that look like parish detail pages (may repeat)."""
         # Look for links with parish-related keywords
         for link in soup.find_all('a', href=True):
             href = link['href']
@@ -130,12 +264,152 @@ class BaseScraper:
             if any(keyword in href.lower() or keyword in text for keyword in 
                    ['parish', 'church', 'catholic']):
                 # Convert relative to absolute URL
-                if href.startswith('http'):
-                    parish_links.append(href)
-                elif href.startswith('/'):
-                    parish_links.append(base_url.rstrip('/') + href)
+                if href.startswith(('http', '/')):
+                    yield urldefrag(urljoin(base_url, href)).url
                     
-        return list(set(parish_links))  # Remove duplicates
+    def discover_detail_urls(self, parishes_url: str, first_soup: Optional[BeautifulSoup] = None,
+                             max_pages: int = GENERIC_MAX_PAGES, next_selector: Optional[str] = None,
+                             link_finder: Optional[Callable] = None, sitemaps: str = 'fallback',
+                             sitemap_pattern: str = SITEMAP_URL_PATTERN) -> Iterator[str]:
+        """
+        Lazily yield parish detail URLs for a diocese.
+        
+        Walks the paginated directory starting at ``parishes_url`` (see
+        discovery.listing_pages) and yields the parish links on each page.
+        Sitemaps listed in robots.txt are read too: always, only when the
+        directory had no links ('fallback'), or 'never'.
+        
+        Args:
+            parishes_url: First directory page
+            first_soup: Already-parsed first page
+            max_pages: Maximum directory pages to follow
+            next_selector: CSS selector for the "next page" link
+            link_finder: Callable (soup, page_url) yielding links; defaults
+                to iter_parish_links
+            sitemaps: 'always', 'fallback' or 'never'
+            sitemap_pattern: Regex a sitemap URL's path must match
+        """
+        link_finder = link_finder or self.iter_parish_links
+        directory = set()
+        found = False
+        for page_url, soup in listing_pages(self, parishes_url, max_pages, next_selector, first_soup):
+            directory.add(canonicalize_url(page_url))
+            for url in link_finder(soup, page_url):
+                found = True
+                yield url
+                
+        if sitemaps == 'always' or (sitemaps == 'fallback' and not found):
+            yield from self.sitemap_detail_urls(parishes_url, sitemap_pattern, directory)
+            
+    def sitemap_detail_urls(self, site_url: str, sitemap_pattern: str = SITEMAP_URL_PATTERN,
+                            exclude: Iterable[str] = ()) -> Iterator[str]:
+        """
+        Lazily yield parish page URLs from the site's robots.txt sitemaps.
+        
+        Args:
+            site_url: Any URL on the diocese site
+            sitemap_pattern: Regex a URL's path must match
+            exclude: Canonical URLs to skip, e.g. the directory pages
+                themselves, which usually match the pattern too
+        """
+        exclude = set(exclude)
+        pattern = re.compile(sitemap_pattern, re.IGNORECASE)
+        for url in site_sitemap_urls(self, site_url, pattern):
+            if canonicalize_url(url) not in exclude:
+                yield url
+        
+    def fetch_details(self, urls: Iterable[str], scrape: Optional[Callable] = None,
+                      workers: int = DETAIL_WORKERS) -> List[Dict]:
+        """
+        Scrape parish detail pages on a bounded worker pool.
+        
+        See iter_details.
+        
+        Returns:
+            Parish dictionaries in completion order
+        """
+        return list(self.iter_details(urls, scrape, workers))
+        
+    def iter_details(self, urls: Iterable[str], scrape: Optional[Callable] = None,
+                     workers: int = DETAIL_WORKERS) -> Iterator[Dict]:
+        """
+        Scrape parish detail pages on a bounded worker pool, yielding as they finish.
+        
+        Each page is fetched once: URLs are deduplicated (and recorded in
+        the ledger) by their canonical form, but requested as given, since
+        some servers treat case, trailing slashes or query order as
+        significant. ``urls`` is consumed lazily: at most two pages per
+        worker are queued at a time, so discovery generators are only
+        advanced as fast as pages are fetched. Request pacing still comes
+        from the shared per-host scheduler (and host limiter), so extra
+        workers overlap latency and parsing rather than sending requests
+        faster than the host's budget allows.
+        
+        With a run ledger, each page's outcome is recorded and pages parsed
+        earlier in the same run are yielded from the ledger unfetched.
+        Pages that raise PageUnchanged yield nothing and are counted in
+        ``unchanged_pages``.
+        
+        Args:
+            urls: Detail page URLs (any iterable, typically a generator)
+            scrape: Callable taking a URL and returning a parish dict or
+                None; defaults to self.scrape_parish_detail
+            workers: Maximum pages in flight at once
+            
+        Yields:
+            Parish dictionaries
+        """
+        scrape = scrape or self.scrape_parish_detail
+        workers = max(1, workers)
+        ledger = self.ledger
+        
+        def run(url: str, key: str) -> Optional[Dict]:
+            status, parish = 'failed', None
+            self._local.fetch_seconds = 0.0
+            started = time.perf_counter()
+            try:
+                parish = scrape(url)
+                status = 'parsed' if parish else 'failed'
+                # One 'extract' event per page: the scrape minus its fetch/parse
+                self.metrics.record('extract', time.perf_counter() - started - self._local.fetch_seconds,
+                                    log=False)
+            except PageUnchanged:
+                status = 'unchanged'
+                with self._unchanged_lock:
+                    self.unchanged_pages += 1
+                print(f"  ⏭️  Unchanged: {url}")
+            except Exception as e:
+                print(f"❌ Error scraping {url}: {e}")
+            if ledger:
+                ledger.mark_url(self.diocese_name, key, status, parish)
+            return parish
+            
+        seen = set()
+        pending = set()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for url in urls:
+                key = canonicalize_url(url)
+                if key in seen:
+                    continue
+                seen.add(key)
+                # Parsed earlier in this run (before a crash): reuse the record
+                parish = ledger.parsed(key) if ledger else None
+                if parish:
+                    yield parish
+                    continue
+                if ledger:
+                    ledger.mark_url(self.diocese_name, key, 'pending')
+                pending.add(pool.submit(run, url, key))
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        parish = future.result()
+                        if parish:
+                            yield parish
+            for future in as_completed(pending):
+                parish = future.result()
+                if parish:
+                    yield parish
         
     def scrape_parish_list(self, parishes_url: str) -> List[Dict]:
         """
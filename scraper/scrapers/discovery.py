@@ -0,0 +1,169 @@
+"""Lazy discovery of listing pages and parish detail URLs.
+
+Everything here is a generator. URLs flow into BaseScraper.fetch_details
+as they are found, and listing pages are fetched only when the fetch
+queue needs more work. A large archdiocese therefore never has all of its
+listing pages, or one big link list, in memory at once.
+"""
+import gzip
+import io
+import re
+from typing import Iterator, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+from xml.etree import ElementTree
+
+from bs4 import BeautifulSoup
+
+from .urls import canonicalize_url
+
+# Link text used for "next page" when the markup has no rel=next
+NEXT_TEXT = frozenset({'next', 'next page', 'next »', 'next ›', '»', '›', 'more', 'older entries'})
+
+# Page numbers in query strings (?page=3) and paths (/page/3/)
+PAGE_NUMBER_RE = re.compile(r'(?:[?&](?:page|pg|paged|p)=(\d+)\b)|(?:/page/(\d+)(?:/|$))', re.IGNORECASE)
+
+SITEMAP_RE = re.compile(r'^\s*sitemap\s*:\s*(\S+)', re.IGNORECASE | re.MULTILINE)
+
+MAX_SITEMAPS = 50  # Sitemap files read per site, including nested indexes
+
+
+def _page_number(url: str) -> Optional[int]:
+    """Page number encoded in a URL, if any."""
+    match = PAGE_NUMBER_RE.search(url)
+    if not match:
+        return None
+    return int(match.group(1) or match.group(2))
+
+
+def next_page_url(soup: BeautifulSoup, url: str, page: int,
+                  selector: Optional[str] = None) -> Optional[str]:
+    """
+    Find the URL of the page after ``page`` in a paginated listing.
+
+    Tries, in order: rel=next, the configured selector, "Next" link text
+    and finally numbered pagination (a link labelled, or pointing at,
+    page ``page + 1``).
+
+    Returns:
+        Absolute URL, or None on the last page
+    """
+    candidates = [soup.find(['link', 'a'], rel='next')]
+    if selector:
+        candidates.append(soup.select_one(selector))
+    for candidate in candidates:
+        if candidate is not None and candidate.get('href'):
+            return urljoin(url, candidate['href'])
+
+    wanted = page + 1
+    numbered = None
+    for link in soup.find_all('a', href=True):
+        text = " ".join(link.get_text().split()).lower()
+        if text in NEXT_TEXT:
+            return urljoin(url, link['href'])
+        if numbered is None and (text == str(wanted) or _page_number(link['href']) == wanted):
+            numbered = urljoin(url, link['href'])
+    return numbered
+
+
+def listing_pages(scraper, start_url: str, max_pages: int, selector: Optional[str] = None,
+                  first_soup: Optional[BeautifulSoup] = None) -> Iterator[Tuple[str, BeautifulSoup]]:
+    """
+    Yield (url, soup) for each page of a paginated parish directory.
+
+    Pages are fetched one at a time as the consumer asks for them. They
+    are always fetched in full, never conditionally: an unchanged
+    directory still links to detail pages that may have been edited, and
+    those are checked conditionally on their own.
+
+    Args:
+        scraper: BaseScraper used to fetch pages
+        start_url: First listing page
+        max_pages: Maximum pages to visit
+        selector: Optional CSS selector for the "next" link
+        first_soup: Already-parsed first page, to avoid fetching it again
+    """
+    seen = set()
+    url = start_url
+    page = 1
+    while url and canonicalize_url(url) not in seen and len(seen) < max_pages:
+        seen.add(canonicalize_url(url))
+        if page == 1 and first_soup is not None:
+            soup = first_soup
+        else:
+            soup = scraper.fetch_page(url, conditional=False)
+        if not soup:
+            return
+        yield url, soup
+        url = next_page_url(soup, url, page, selector)
+        page += 1
+
+
+def robots_sitemaps(scraper, site_url: str) -> Iterator[str]:
+    """Yield the sitemaps a site lists in robots.txt, or its default /sitemap.xml."""
+    body = scraper.fetch_bytes(urljoin(site_url, '/robots.txt'), conditional=False)
+    sitemaps = SITEMAP_RE.findall(body.decode('utf-8', 'replace')) if body else []
+    if not sitemaps:
+        sitemaps = [urljoin(site_url, '/sitemap.xml')]
+    yield from sitemaps
+
+
+def sitemap_urls(scraper, sitemap_url: str, pattern: Optional[re.Pattern] = None,
+                 _visited: Optional[set] = None) -> Iterator[str]:
+    """
+    Yield page URLs from a sitemap, following sitemap indexes.
+
+    The XML is parsed incrementally and each <url> element is discarded
+    once read, so even sitemaps with 50,000 entries stay small in memory.
+
+    Args:
+        scraper: BaseScraper used to fetch the sitemaps
+        sitemap_url: Sitemap or sitemap index URL (.xml or .xml.gz)
+        pattern: Only yield URLs whose path matches this regex
+    """
+    visited = _visited if _visited is not None else set()
+    if sitemap_url in visited or len(visited) >= MAX_SITEMAPS:
+        return
+    visited.add(sitemap_url)
+
+    body = scraper.fetch_bytes(sitemap_url, conditional=False)
+    if not body:
+        return
+    if body[:2] == b'\x1f\x8b':
+        try:
+            body = gzip.decompress(body)
+        except OSError:
+            return
+
+    nested = []
+    loc = None
+    try:
+        for _, element in ElementTree.iterparse(io.BytesIO(body), events=('end',)):
+            tag = element.tag.rsplit('}', 1)[-1]
+            if tag == 'loc':
+                loc = (element.text or '').strip()
+                continue
+            if tag == 'sitemap' and loc:
+                nested.append(loc)
+            elif tag == 'url' and loc:
+                if pattern is None or pattern.search(urlsplit(loc).path):
+                    yield loc
+            if tag in ('sitemap', 'url'):
+                loc = None
+                element.clear()
+    except ElementTree.ParseError as e:
+        print(f"⚠️  Bad sitemap {sitemap_url}: {e}")
+
+    for child in nested:
+        yield from sitemap_urls(scraper, child, pattern, visited)
+
+
+def site_sitemap_urls(scraper, site_url: str, pattern: Optional[re.Pattern] = None) -> Iterator[str]:
+    """Yield matching page URLs from every sitemap of the site hosting ``site_url``."""
+    host = (urlsplit(site_url).hostname or '').lower()
+    visited = set()
+    for sitemap in robots_sitemaps(scraper, site_url):
+        for url in sitemap_urls(scraper, sitemap, pattern, visited):
+            # Sitemaps may list other sites' pages; stay on this one
+            url_host = (urlsplit(url).hostname or '').lower()
+            if url_host.removeprefix('www.') == host.removeprefix('www.'):
+                yield url
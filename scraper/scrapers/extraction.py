@@ -0,0 +1,92 @@
+"""Precompiled, single-pass extraction of contact details from page text."""
+import re
+from typing import Dict, List, NamedTuple, Optional
+
+# USPS state, district and territory codes
+STATE_CODES = (
+    'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'DC', 'FL', 'GA', 'HI', 'ID',
+    'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD', 'MA', 'MI', 'MN', 'MS', 'MO',
+    'MT', 'NE', 'NV', 'NH', 'NJ', 'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA',
+    'RI', 'SC', 'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY',
+    'AS', 'GU', 'MP', 'PR', 'VI',
+)
+
+EMAIL_PATTERN = r'[\w.-]+@[\w.-]+\.\w+'
+PHONE_PATTERN = r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'  # (123) 456-7890, 123-456-7890, 123.456.7890
+ZIP_PATTERN = r'\b\d{5}(?:-\d{4})?\b'
+STATE_PATTERN = r'\b(?:' + '|'.join(STATE_CODES) + r')\b'
+
+EMAIL_RE = re.compile(EMAIL_PATTERN)
+PHONE_RE = re.compile(PHONE_PATTERN)
+ZIP_RE = re.compile(ZIP_PATTERN)
+STATE_RE = re.compile(STATE_PATTERN)
+WHITESPACE_RE = re.compile(r'\s+')
+
+# One alternation scanned once over the text. Every alternative starts at
+# a token boundary, which lets the engine skip mid-word positions quickly.
+# Order matters: an email is tried before a phone so digits in a mailbox
+# are not read as a number, and a phone before a ZIP so a 10-digit number
+# is not split into a ZIP. Any two capital letters match as a state
+# candidate and are checked against STATE_CODES afterwards, which is far
+# cheaper than a 56-way alternation at every position.
+CONTACT_RE = re.compile(
+    r'(?<!\w)(?:'
+    f'(?P<email>{EMAIL_PATTERN})'
+    f'|(?P<phone>{PHONE_PATTERN})'
+    r'|(?P<zip>\d{5}(?:-\d{4})?\b)'
+    r'|(?P<state>[A-Z]{2}\b)'
+    r')'
+)
+
+_STATE_SET = frozenset(STATE_CODES)
+
+CONTACT_KINDS = ('email', 'phone', 'zip', 'state')
+
+
+class ContactMatch(NamedTuple):
+    """A single extracted value and where it was found in the text."""
+    kind: str
+    value: str
+    start: int
+    end: int
+
+
+def scan_contacts(text: str) -> List[ContactMatch]:
+    """
+    Find every email, phone, ZIP and state code in one pass.
+    
+    Args:
+        text: Text to scan
+        
+    Returns:
+        Matches in the order they appear in the text
+    """
+    return [
+        ContactMatch(match.lastgroup, match.group(), match.start(), match.end())
+        for match in CONTACT_RE.finditer(text)
+        if match.lastgroup != 'state' or match.group() in _STATE_SET
+    ]
+
+
+def extract_contacts(text: str) -> Dict[str, List[ContactMatch]]:
+    """Group the matches from scan_contacts by kind ('email', 'phone', 'zip', 'state')."""
+    grouped: Dict[str, List[ContactMatch]] = {kind: [] for kind in CONTACT_KINDS}
+    for match in scan_contacts(text):
+        grouped[match.kind].append(match)
+    return grouped
+
+
+def first_contacts(text: str) -> Dict[str, Optional[str]]:
+    """Return the first value of each kind found in the text (or None)."""
+    first: Dict[str, Optional[str]] = dict.fromkeys(CONTACT_KINDS)
+    remaining = len(CONTACT_KINDS)
+    for match in CONTACT_RE.finditer(text):
+        kind = match.lastgroup
+        if first[kind] is None:
+            if kind == 'state' and match.group() not in _STATE_SET:
+                continue
+            first[kind] = match.group()
+            remaining -= 1
+            if not remaining:
+                break
+    return first
@@ -0,0 +1,257 @@
+"""Configuration-driven scraper for dioceses without a custom class."""
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import urldefrag, urljoin
+
+from bs4 import BeautifulSoup
+
+from config import GENERIC_MAX_PAGES, GENERIC_SELECTORS, SITEMAP_URL_PATTERN
+from .base_scraper import BaseScraper
+from .extraction import EMAIL_RE, PHONE_RE
+from .structured import extract_structured
+from .urls import canonicalize_url
+
+
+def merge_selectors(overrides: Optional[Dict] = None) -> Dict:
+    """
+    Combine a diocese's 'selectors' config with GENERIC_SELECTORS.
+
+    Top-level keys replace the defaults; 'fields' entries are merged one
+    by one, so a diocese can override just the address selector.
+    """
+    selectors = dict(GENERIC_SELECTORS)
+    selectors['fields'] = dict(GENERIC_SELECTORS['fields'])
+    if overrides:
+        selectors.update({key: value for key, value in overrides.items() if key != 'fields'})
+        selectors['fields'].update(overrides.get('fields') or {})
+    return selectors
+
+
+class GenericScraper(BaseScraper):
+    """
+    Scraper driven entirely by selectors in config.
+
+    Each listing page is read in this order:
+
+    1. schema.org Church records (JSON-LD, microdata), unless the
+       heuristics below find more parishes on the page
+    2. parish containers matched by the 'container' selector, with fields
+       read through the 'fields' selectors and contact heuristics
+    3. otherwise parish detail links, each scraped the same way
+
+    Listing pages are followed through rel=next, the 'next_page' selector
+    or numbered pagination, and robots.txt sitemaps fill in when the
+    directory has no links (see 'sitemaps').
+    """
+
+    def __init__(self, diocese_name: str, diocese_state: str, host_limiter=None,
+                 page_state=None, archive=None, parser: Optional[str] = None,
+                 scheduler=None, selectors: Optional[Dict] = None,
+                 max_pages: int = GENERIC_MAX_PAGES, ledger=None, metrics=None):
+        """
+        Initialize scraper.
+
+        Args:
+            selectors: The diocese's 'selectors' config, merged over
+                config.GENERIC_SELECTORS
+            max_pages: Maximum listing pages to follow
+
+        The other arguments are as for BaseScraper.
+        """
+        super().__init__(diocese_name, diocese_state, host_limiter, page_state, archive,
+                         parser=parser, scheduler=scheduler, ledger=ledger, metrics=metrics)
+        self.selectors = merge_selectors(selectors)
+        self.max_pages = max_pages
+
+    def scrape_parish_list(self, parishes_url: str) -> List[Dict]:
+        """
+        Scrape a diocese's parishes starting from its listing page.
+
+        Args:
+            parishes_url: URL of the first listing page
+
+        Returns:
+            List of parish dictionaries
+        """
+        print(f"🔍 Scraping {self.diocese_name}...")
+
+        # Pages listing parishes directly add them here; the others feed
+        # their detail links to the fetch pool as discovery reaches them
+        parishes = []
+        sitemaps = self.selectors.get('sitemaps') or 'never'
+        sitemap_pattern = self.selectors.get('sitemap_pattern') or SITEMAP_URL_PATTERN
+
+        def links_or_parishes(soup: BeautifulSoup, page_url: str) -> Iterator[str]:
+            links = list(self.detail_links(soup, page_url))
+            page_parishes = self.parishes_from_page(soup, page_url, len(links))
+            if page_parishes:
+                parishes.extend(page_parishes)
+            else:
+                yield from links
+
+        def detail_urls() -> Iterator[str]:
+            found = False
+            for url in self.discover_detail_urls(
+                    parishes_url,
+                    max_pages=self.max_pages,
+                    next_selector=self.selectors.get('next_page'),
+                    link_finder=links_or_parishes,
+                    sitemaps='always' if sitemaps == 'always' else 'never',
+                    sitemap_pattern=sitemap_pattern):
+                found = True
+                yield url
+            # Fall back to sitemaps only if the directory gave us nothing
+            if sitemaps == 'fallback' and not found and not parishes:
+                yield from self.sitemap_detail_urls(parishes_url, sitemap_pattern,
+                                                    [canonicalize_url(parishes_url)])
+
+        details = self.fetch_details(detail_urls())
+        return parishes + details
+
+    def parishes_from_page(self, soup: BeautifulSoup, url: str, detail_links: int = 0) -> List[Dict]:
+        """
+        Parishes listed directly on a page, from structured data or containers.
+
+        Structured data is read first and returned as is when it describes
+        at least as many parishes as the page has containers and detail
+        links: a directory often marks up just the cathedral, or the
+        diocese office, above the real list. Only then are the containers
+        read field by field.
+
+        Args:
+            detail_links: Parish detail links on the page; an empty result
+                sends discovery to them instead
+
+        Returns:
+            List of parish dictionaries (empty to follow the detail links)
+        """
+        container = self.selectors.get('container')
+        elements = soup.select(container) if container else []
+
+        structured = extract_structured(soup)
+        if structured and len(structured) >= max(len(elements), detail_links):
+            print(f"📋 Found {len(structured)} parishes in structured data")
+            return [self.finish_record(parish, url) for parish in structured]
+
+        parishes = []
+        for element in elements:
+            parish_data = self.extract_fields(element, url)
+            if parish_data:
+                parishes.append(parish_data)
+        return parishes
+
+    def scrape_parish_detail(self, url: str) -> Optional[Dict]:
+        """Scrape an individual parish detail page."""
+        print(f"  📄 Scraping {url}")
+
+        soup = self.fetch_page(url)
+        if not soup:
+            return None
+
+        # A single record is this parish; the field selectors only fill its
+        # gaps. With several (a cluster page, or the diocese's own markup
+        # alongside) trust the page's own fields
+        structured = extract_structured(soup)
+        if len(structured) == 1:
+            record = self.finish_record(structured[0], url)
+            if all(record.get(field) for field in self.selectors['fields']):
+                return record
+            for key, value in (self.extract_fields(soup, url) or {}).items():
+                record.setdefault(key, value)
+            return record
+        parish_data = self.extract_fields(soup, url)
+        if structured and not parish_data:
+            return self.finish_record(structured[0], url)
+        return parish_data
+
+    def extract_fields(self, element, source_url: str) -> Optional[Dict]:
+        """
+        Read a parish from an element using the configured field selectors.
+
+        Fields without a selector match fall back to the contact regexes
+        and to the first line that looks like an address.
+
+        Returns:
+            Parish dictionary, or None if no name was found
+        """
+        fields = self.selectors['fields']
+        name = self.select_value(element, fields.get('name'))
+        if not name:
+            return None
+
+        parish_data = {'name': name}
+        text = element.get_text('\n')
+        contacts = self.extract_contacts(text)
+
+        phone = self.select_value(element, fields.get('phone'))
+        phone_match = PHONE_RE.search(phone) if phone else None
+        if phone_match or contacts['phone']:
+            parish_data['phone'] = phone_match.group(0) if phone_match else contacts['phone']
+
+        email = self.select_value(element, fields.get('email'))
+        email_match = EMAIL_RE.search(email) if email else None
+        if email_match or contacts['email']:
+            parish_data['email'] = email_match.group(0) if email_match else contacts['email']
+
+        website = self.select_value(element, fields.get('website'))
+        if website:
+            parish_data['website'] = website
+
+        address_text = self.select_value(element, fields.get('address'))
+        if not address_text:
+            # Look for lines that look like addresses (contain numbers and commas)
+            for line in text.split('\n'):
+                line = self.clean_text(line)
+                if any(char.isdigit() for char in line) and ',' in line:
+                    address_text = line
+                    break
+        if address_text:
+            parish_data.update(self.parse_address(address_text))
+
+        mass_times = self.select_value(element, fields.get('mass_times'))
+        if mass_times:
+            parish_data['mass_times'] = mass_times
+
+        return self.finish_record(parish_data, source_url)
+
+    def select_value(self, element, spec: Optional[str]) -> Optional[str]:
+        """
+        Evaluate a field selector against an element.
+
+        ``spec`` is a comma-separated list of CSS selectors, each optionally
+        suffixed with ``@attr`` to read an attribute. The first alternative
+        with a non-empty value wins.
+        """
+        if not spec:
+            return None
+        for alternative in spec.split(','):
+            css, _, attribute = alternative.strip().partition('@')
+            match = element.select_one(css)
+            if match is None:
+                continue
+            value = match.get(attribute) if attribute else match.get_text(' ')
+            if isinstance(value, list):
+                value = ' '.join(value)
+            value = self.clean_text(value or '')
+            for prefix in ('mailto:', 'tel:'):
+                if value.lower().startswith(prefix):
+                    value = value[len(prefix):]
+            if value:
+                return value
+        return None
+
+    def finish_record(self, parish_data: Dict, source_url: str) -> Dict:
+        """Add diocese fields and resolve relative URLs."""
+        record = {'diocese': self.diocese_name, 'state': self.diocese_state,
+                  'source_url': source_url}
+        record.update({key: value for key, value in parish_data.items() if value is not None})
+        if record.get('website'):
+            record['website'] = urljoin(source_url, record['website'])
+        return record
+
+    def detail_links(self, soup: BeautifulSoup, url: str) -> Iterator[str]:
+        """Parish detail page links on a listing page."""
+        link_selector = self.selectors.get('link')
+        if not link_selector:
+            return self.iter_parish_links(soup, url)
+        return (urldefrag(urljoin(url, link['href'])).url for link in soup.select(link_selector)
+                if link.get('href'))
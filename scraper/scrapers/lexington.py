@@ -1,7 +1,24 @@
 """Custom scraper for Diocese of Lexington."""
 from typing import List, Dict
+from bs4 import SoupStrainer
 from .base_scraper import BaseScraper
-import time
+
+
+def _is_listing_element(name: str, attrs: Dict) -> bool:
+    """Match parish containers and links, the only parts of a listing page we read."""
+    if name in ('a', 'link'):  # <link rel="next"> drives pagination (discovery.next_page_url)
+        return True
+    if name not in ('div', 'article', 'section', 'li', 'tr'):
+        return False
+    classes = attrs.get('class') or ''
+    if isinstance(classes, list):
+        classes = ' '.join(classes)
+    classes = classes.lower()
+    return 'parish' in classes or 'church' in classes
+
+
+# Build only parish containers and links when parsing the listing page
+LISTING_STRAINER = SoupStrainer(_is_listing_element)
 
 
 class LexingtonScraper(BaseScraper):
@@ -19,7 +36,7 @@ class LexingtonScraper(BaseScraper):
         """
         print(f"🔍 Scraping {self.diocese_name}...")
         
-        soup = self.fetch_page(parishes_url)
+        soup = self.fetch_page(parishes_url, parse_only=LISTING_STRAINER, conditional=False)
         if not soup:
             return []
             
@@ -36,17 +53,10 @@ class LexingtonScraper(BaseScraper):
                                              class_=lambda x: x and ('parish' in x.lower() or 'church' in x.lower()))
         
         if not parish_containers:
-            # Approach 3: Find all links that mention parishes and scrape each
-            parish_links = self.find_parish_links(soup, parishes_url)
-            print(f"📋 Found {len(parish_links)} parish links to scrape")
-            
-            for link in parish_links[:10]:  # Limit to 10 for testing
-                parish_data = self.scrape_parish_detail(link)
-                if parish_data:
-                    parishes.append(parish_data)
-                time.sleep(2)  # Be polite
-                
-            return parishes
+            # Approach 3: Follow parish links across every directory page
+            # (or the sitemap) and scrape each detail page
+            print("📋 Scraping parish detail pages")
+            return self.fetch_details(self.discover_detail_urls(parishes_url, first_soup=soup))
         
         # Process parish containers
         print(f"📋 Found {len(parish_containers)} parishes")
@@ -75,16 +85,15 @@ class LexingtonScraper(BaseScraper):
             
         # Extract all text and parse for address, phone, email
         text = container.get_text()
+        contacts = self.extract_contacts(text)
         
         # Extract phone
-        phone = self.extract_phone(text)
-        if phone:
-            parish_data['phone'] = phone
+        if contacts['phone']:
+            parish_data['phone'] = contacts['phone']
             
         # Extract email
-        email = self.extract_email(text)
-        if email:
-            parish_data['email'] = email
+        if contacts['email']:
+            parish_data['email'] = contacts['email']
             
         # Extract website
         website_link = container.find('a', href=lambda x: x and ('http' in x or 'www' in x))
@@ -146,13 +155,12 @@ class LexingtonScraper(BaseScraper):
         text = main_content.get_text()
         
         # Extract contact info
-        phone = self.extract_phone(text)
-        if phone:
-            parish_data['phone'] = phone
+        contacts = self.extract_contacts(text)
+        if contacts['phone']:
+            parish_data['phone'] = contacts['phone']
             
-        email = self.extract_email(text)
-        if email:
-            parish_data['email'] = email
+        if contacts['email']:
+            parish_data['email'] = contacts['email']
             
         # Extract website
         website_link = main_content.find('a', href=lambda x: x and 'parish' in x.lower() and x.startswith('http'))
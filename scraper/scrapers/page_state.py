@@ -0,0 +1,85 @@
+"""Per-URL HTTP validators used to skip pages that have not changed."""
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Dict, Optional
+
+from config import PAGE_STATE_PATH
+
+
+class PageUnchanged(Exception):
+    """Raised by fetch_page when a page is the same as on the last run."""
+    
+    def __init__(self, url: str):
+        super().__init__(f"Page unchanged since last scrape: {url}")
+        self.url = url
+
+
+class PageStateStore:
+    """
+    Persists ETag, Last-Modified and a content hash for every fetched URL.
+    
+    New validators are staged per diocese and only written once that
+    diocese's parishes have been saved (see commit). A crash between
+    fetching and saving therefore never marks pages as already processed.
+    """
+    
+    def __init__(self, path: str = PAGE_STATE_PATH):
+        """Open (or create) the page state database."""
+        self.path = path
+        self._lock = threading.Lock()
+        self._staged: Dict[str, Dict[str, Dict]] = {}
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS page_state (
+              url TEXT PRIMARY KEY,
+              etag TEXT,
+              last_modified TEXT,
+              content_hash TEXT,
+              fetched_at TIMESTAMP
+            )
+        """)
+        self.conn.commit()
+        
+    def get(self, url: str) -> Optional[Dict]:
+        """Return the stored validators for a URL, or None if never saved."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified, content_hash FROM page_state WHERE url = ?", (url,)
+            ).fetchone()
+        return dict(row) if row else None
+        
+    def stage(self, diocese: str, url: str, etag: Optional[str],
+              last_modified: Optional[str], content_hash: str):
+        """Remember a page's validators until the diocese is committed."""
+        with self._lock:
+            self._staged.setdefault(diocese, {})[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'content_hash': content_hash,
+            }
+            
+    def commit(self, diocese: str) -> int:
+        """Persist staged validators for a diocese and return how many."""
+        now = datetime.now().isoformat()
+        with self._lock:
+            staged = self._staged.pop(diocese, {})
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO page_state (url, etag, last_modified, content_hash, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(url, state['etag'], state['last_modified'], state['content_hash'], now)
+                 for url, state in staged.items()]
+            )
+            self.conn.commit()
+        return len(staged)
+        
+    def discard(self, diocese: str):
+        """Drop staged validators for a diocese whose save failed."""
+        with self._lock:
+            self._staged.pop(diocese, None)
+            
+    def close(self):
+        """Close the page state database."""
+        with self._lock:
+            self.conn.close()
@@ -0,0 +1,180 @@
+"""Read parishes from schema.org structured data (JSON-LD and microdata).
+
+Many diocese and parish sites embed ``Church`` or ``PlaceOfWorship``
+records for search engines. When present they are more reliable than
+scraping the visible markup. They often carry coordinates too, so those
+parishes skip geocoding. Plain ``Place`` is not read: diocese offices,
+schools and cemeteries use it too.
+"""
+import json
+from typing import Dict, Iterator, List, Optional
+
+from bs4 import BeautifulSoup
+
+from .address import split_address
+
+# schema.org types that describe a parish location
+PARISH_TYPES = frozenset({'Church', 'CatholicChurch', 'PlaceOfWorship'})
+
+# JSON-LD keys that hold further items (lists, graphs, pages made of parts)
+CONTAINER_KEYS = ('@graph', 'itemListElement', 'item', 'hasPart', 'containsPlace')
+
+
+def _types(node: Dict) -> List[str]:
+    """Bare schema.org type names of a JSON-LD node or microdata itemtype."""
+    value = node.get('@type') or []
+    if isinstance(value, str):
+        value = value.split()
+    return [str(name).rstrip('/').rsplit('/', 1)[-1] for name in value]
+
+
+def _walk(node) -> Iterator[Dict]:
+    """Yield every JSON-LD object reachable through container keys."""
+    if isinstance(node, list):
+        for item in node:
+            yield from _walk(item)
+    elif isinstance(node, dict):
+        yield node
+        for key in CONTAINER_KEYS:
+            if key in node:
+                yield from _walk(node[key])
+
+
+def _text(value) -> Optional[str]:
+    """First string in a JSON-LD value (which may be a list or object)."""
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        value = value.get('@value') or value.get('name') or value.get('@id')
+    if value is None:
+        return None
+    text = " ".join(str(value).split())
+    return text or None
+
+
+def _float(value) -> Optional[float]:
+    """Coordinate as a float, or None."""
+    try:
+        return float(_text(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def to_parish(item: Dict) -> Optional[Dict]:
+    """
+    Map a schema.org Church/PlaceOfWorship (JSON-LD or microdata) to parish fields.
+
+    Returns:
+        Parish dictionary without diocese fields, or None if it has no name
+    """
+    name = _text(item.get('name'))
+    if not name:
+        return None
+    parish = {'name': name}
+
+    address = item.get('address')
+    if isinstance(address, list):
+        address = address[0] if address else None
+    if isinstance(address, dict):
+        street = _text(address.get('streetAddress'))
+        city = _text(address.get('addressLocality'))
+        state = _text(address.get('addressRegion'))
+        zip_code = _text(address.get('postalCode'))
+        line = ", ".join(filter(None, [city, " ".join(filter(None, [state, zip_code]))]))
+        parish.update({
+            'address': ", ".join(filter(None, [street, line])) or None,
+            'street': street,
+            'city': city,
+            'zip': zip_code,
+        })
+        if state:
+            parish['state'] = state
+    elif address:
+        parts = split_address(_text(address))
+        parish.update({key: value for key, value in parts.items() if value})
+
+    phone = _text(item.get('telephone'))
+    if phone:
+        parish['phone'] = phone
+    email = _text(item.get('email'))
+    if email:
+        parish['email'] = email[len('mailto:'):] if email.lower().startswith('mailto:') else email
+    website = _text(item.get('url') or item.get('sameAs'))
+    if website and website.startswith('http'):
+        parish['website'] = website
+
+    geo = item.get('geo')
+    if isinstance(geo, list):
+        geo = geo[0] if geo else None
+    if isinstance(geo, dict):
+        latitude, longitude = _float(geo.get('latitude')), _float(geo.get('longitude'))
+        if latitude is not None and longitude is not None:
+            parish['latitude'], parish['longitude'] = latitude, longitude
+
+    return parish
+
+
+def json_ld_items(soup: BeautifulSoup) -> Iterator[Dict]:
+    """Yield the parish-typed JSON-LD objects on a page."""
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.string or script.get_text() or 'null')
+        except ValueError:
+            continue
+        for node in _walk(data):
+            if PARISH_TYPES.intersection(_types(node)):
+                yield node
+
+
+def _microdata_value(element):
+    """Value of an itemprop element per the HTML microdata rules."""
+    if element.has_attr('itemscope'):
+        return _microdata_item(element)
+    for attribute in ('content', 'href', 'src', 'datetime'):
+        if element.has_attr(attribute):
+            return element[attribute]
+    return element.get_text()
+
+
+def _microdata_item(scope) -> Dict:
+    """Properties of one itemscope element (not of items nested in it)."""
+    item = {'@type': scope.get('itemtype', '')}
+    for prop in scope.find_all(attrs={'itemprop': True}):
+        if prop.find_parent(attrs={'itemscope': True}) is not scope:
+            continue
+        for name in prop['itemprop'].split():
+            item.setdefault(name, _microdata_value(prop))
+    return item
+
+
+def microdata_items(soup: BeautifulSoup) -> Iterator[Dict]:
+    """Yield the top-level parish-typed microdata items on a page."""
+    for scope in soup.find_all(attrs={'itemscope': True, 'itemtype': True}):
+        item = _microdata_item(scope)
+        if not PARISH_TYPES.intersection(_types(item)):
+            continue
+        # Skip parish items nested inside another parish item
+        parent = scope.find_parent(attrs={'itemscope': True, 'itemtype': True})
+        if parent is not None and PARISH_TYPES.intersection(_types({'@type': parent['itemtype']})):
+            continue
+        yield item
+
+
+def extract_structured(soup: BeautifulSoup) -> List[Dict]:
+    """
+    Extract every parish described by structured data on a page.
+
+    JSON-LD is read first, then microdata; a name seen once is not
+    repeated.
+
+    Returns:
+        List of parish dictionaries without diocese fields
+    """
+    parishes = []
+    seen = set()
+    for item in list(json_ld_items(soup)) + list(microdata_items(soup)):
+        parish = to_parish(item)
+        if parish and parish['name'].lower() not in seen:
+            seen.add(parish['name'].lower())
+            parishes.append(parish)
+    return parishes
@@ -0,0 +1,38 @@
+"""URL canonicalization so one page is only fetched once per crawl."""
+import posixpath
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Query parameters that only track where a click came from
+TRACKING_PARAMS = frozenset({'fbclid', 'gclid', 'mc_cid', 'mc_eid'})
+
+
+def canonicalize_url(url: str, base: str = None) -> str:
+    """
+    Reduce a URL to the canonical form used to deduplicate fetches.
+
+    Resolves it against ``base``, lowercases the scheme and host, drops
+    the default port, the fragment, tracking parameters (utm_*, fbclid, ...),
+    dot segments and a trailing slash, and sorts the query string.
+
+    Example:
+        "HTTPS://Example.org:443/parishes/./st-mary/?utm_source=x#map"
+        -> "https://example.org/parishes/st-mary"
+    """
+    if base:
+        url = urljoin(base, url)
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+
+    # normpath also drops the trailing slash; the root stays '/'
+    path = '/' + posixpath.normpath(parts.path or '/').lstrip('/')
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    )
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""Load parish seed data from CSV or JSON Lines files.
+
+Records are streamed from disk, validated against ``SEED_SCHEMA`` and
+upserted in large transactions, so memory use stays flat however big the
+file is. Supported formats are ``.csv``, ``.jsonl`` and ``.ndjson``,
+optionally gzipped (``.gz``). The bundled data sets live in ``seed_data/``.
+With ``--insert-only`` parishes already in the database, such as scraped
+ones, are left as they are.
+
+Example:
+    python seed.py seed_data/worldwide.jsonl parishes-2024.csv.gz
+"""
+import argparse
+import csv
+import gzip
+import io
+import json
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from config import SEED_BATCH_SIZE
+from database import ParishDatabase
+
+SEED_DATA_DIR = Path(__file__).parent / "seed_data"
+
+# Column -> (accepted types, required). Any other key is an error.
+SEED_SCHEMA = {
+    'name': ((str,), True),
+    'diocese': ((str,), True),
+    'address': ((str,), False),
+    'street': ((str,), False),
+    'city': ((str,), False),
+    'state': ((str,), False),
+    'zip': ((str, int), False),
+    'country': ((str,), False),
+    'phone': ((str,), False),
+    'website': ((str,), False),
+    'email': ((str,), False),
+    'latitude': ((float, int, str), False),
+    'longitude': ((float, int, str), False),
+    'mass_times': ((str, dict), False),
+    'pastor': ((str,), False),
+    'source_url': ((str,), False),
+}
+
+COORD_LIMITS = {'latitude': 90.0, 'longitude': 180.0}
+
+MAX_REPORTED_ERRORS = 20  # Invalid records listed in the summary
+
+
+def open_text(path: Path) -> io.TextIOBase:
+    """
+    Open a seed file for reading, decompressing gzip transparently.
+
+    A UTF-8 byte order mark (as Excel writes to CSV) is skipped, so it
+    does not end up in the first column name.
+    """
+    with open(path, 'rb') as f:
+        gzipped = f.read(2) == b'\x1f\x8b'
+    if gzipped:
+        return gzip.open(path, 'rt', encoding='utf-8-sig', newline='')
+    return open(path, 'r', encoding='utf-8-sig', newline='')
+
+
+def seed_format(path: Path) -> str:
+    """Return 'csv' or 'jsonl' from a file name, ignoring a .gz suffix."""
+    suffixes = [suffix.lower() for suffix in path.suffixes if suffix.lower() != '.gz']
+    suffix = suffixes[-1] if suffixes else ''
+    if suffix == '.csv':
+        return 'csv'
+    if suffix in ('.jsonl', '.ndjson'):
+        return 'jsonl'
+    raise ValueError(f"Unsupported seed file type: {path.name} (use .csv, .jsonl or .ndjson)")
+
+
+def read_records(path: Path) -> Iterator[Tuple[int, Union[Dict[str, Any], ValueError]]]:
+    """
+    Yield (line number, record) for each record in a seed file.
+
+    A line that cannot be decoded is yielded as the ValueError describing
+    it, so one bad line does not stop the load.
+    """
+    path = Path(path)
+    file_format = seed_format(path)
+    with open_text(path) as f:
+        if file_format == 'csv':
+            reader = csv.DictReader(f)
+            for record in reader:
+                if None in record:
+                    yield reader.line_num, ValueError("more values than header columns")
+                else:
+                    yield reader.line_num, record
+            return
+
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                yield line_number, ValueError(f"invalid JSON: {e}")
+                continue
+            if isinstance(record, dict):
+                yield line_number, record
+            else:
+                yield line_number, ValueError("expected a JSON object")
+
+
+def validate_record(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Check a raw record against SEED_SCHEMA and normalize its values.
+
+    Blank values are dropped, strings are trimmed and coordinates become
+    floats.
+
+    Returns:
+        Parish dictionary ready for ParishDatabase.upsert_parish
+
+    Raises:
+        ValueError: If the record does not match the schema
+    """
+    parish = {}
+    for key, value in record.items():
+        if key not in SEED_SCHEMA:
+            raise ValueError(f"unknown field '{key}'")
+        if isinstance(value, str):
+            value = value.strip()
+        if value is None or value == '':
+            continue
+        types, _ = SEED_SCHEMA[key]
+        if not isinstance(value, types) or isinstance(value, bool):
+            raise ValueError(f"'{key}' has unsupported type {type(value).__name__}")
+        if key in COORD_LIMITS:
+            try:
+                value = float(value)
+            except ValueError:
+                raise ValueError(f"'{key}' is not a number: {value!r}")
+            if not -COORD_LIMITS[key] <= value <= COORD_LIMITS[key]:
+                raise ValueError(f"'{key}' out of range: {value}")
+        elif key == 'zip':
+            value = str(value)
+        parish[key] = value
+
+    missing = [key for key, (_, required) in SEED_SCHEMA.items() if required and key not in parish]
+    if missing:
+        raise ValueError(f"missing {', '.join(missing)}")
+    if ('latitude' in parish) != ('longitude' in parish):
+        raise ValueError("latitude and longitude must be given together")
+    return parish
+
+
+def seed_files(db: ParishDatabase, paths: Iterable[Path], batch_size: int = SEED_BATCH_SIZE,
+               dry_run: bool = False, insert_only: bool = False) -> Dict[str, Any]:
+    """
+    Stream, validate and upsert the records of one or more seed files.
+
+    Args:
+        db: Open database
+        paths: Seed files, loaded in order
+        batch_size: Rows written per transaction
+        dry_run: Validate only, without writing
+        insert_only: Only add parishes that are not stored yet; existing
+            (e.g. scraped) rows are counted as unchanged and left alone
+
+    Returns:
+        Summary with 'read', 'invalid', 'inserted', 'updated', 'unchanged',
+        'seconds' and the first few 'errors'
+    """
+    summary = {'read': 0, 'invalid': 0, 'inserted': 0, 'updated': 0, 'unchanged': 0}
+    errors: List[str] = []
+
+    def valid_records() -> Iterator[Dict[str, Any]]:
+        for path in paths:
+            path = Path(path)
+            print(f"📂 Loading {path}")
+            for line_number, record in read_records(path):
+                summary['read'] += 1
+                try:
+                    if isinstance(record, ValueError):
+                        raise record
+                    yield validate_record(record)
+                except ValueError as e:
+                    summary['invalid'] += 1
+                    if len(errors) < MAX_REPORTED_ERRORS:
+                        errors.append(f"{path.name}:{line_number}: {e}")
+
+    started = time.monotonic()
+    if dry_run:
+        for _ in valid_records():
+            pass
+    else:
+        summary.update(db.upsert_many(valid_records(), batch_size, insert_only))
+    summary['seconds'] = time.monotonic() - started
+    summary['errors'] = errors
+    return summary
+
+
+def print_summary(summary: Dict[str, Any], stats: Optional[Dict[str, Any]] = None):
+    """Print the result of a seed run."""
+    rate = summary['read'] / summary['seconds'] if summary['seconds'] else 0
+    print("\n" + "="*60)
+    print("🌱 Seed Summary")
+    print("="*60)
+    print(f"  Records read: {summary['read']:,} ({rate:,.0f}/s over {summary['seconds']:.1f}s)")
+    print(f"  ✅ Inserted: {summary['inserted']:,}")
+    print(f"  ↻ Updated: {summary['updated']:,}")
+    print(f"  ⏭️  Unchanged: {summary['unchanged']:,}")
+    print(f"  ❌ Invalid: {summary['invalid']:,}")
+    for error in summary['errors']:
+        print(f"     {error}")
+    if summary['invalid'] > len(summary['errors']):
+        print(f"     ... and {summary['invalid'] - len(summary['errors']):,} more")
+    if stats:
+        print("\n📊 Database Statistics")
+        for key, value in stats.items():
+            print(f"  {key}: {value}")
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Load parishes from CSV/JSONL seed files.")
+    parser.add_argument('files', nargs='+', help="Seed files (.csv, .jsonl, .ndjson, optionally .gz)")
+    parser.add_argument('--db', default=str(Path(__file__).parent / "parishes.db"),
+                        help="Path to parishes.db")
+    parser.add_argument('--batch-size', type=int, default=SEED_BATCH_SIZE,
+                        help=f"Rows per transaction (default: {SEED_BATCH_SIZE})")
+    parser.add_argument('--reset', action='store_true',
+                        help="Delete all parishes and scrape logs before loading")
+    parser.add_argument('--dry-run', action='store_true', help="Validate the files without writing")
+    parser.add_argument('--insert-only', action='store_true',
+                        help="Only add parishes not already in the database; never update stored rows")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> Dict[str, Any]:
+    """Main function."""
+    args = parse_args(argv)
+    paths = [Path(path) for path in args.files]
+    for path in paths:
+        seed_format(path)  # Fail before touching the database
+
+    with ParishDatabase(args.db, wal=True) as db:
+        db.initialize()
+        # A bigger page cache keeps the unique and spatial indexes in memory
+        db.cursor.execute("PRAGMA cache_size = -131072")  # 128 MB
+        if args.reset and not args.dry_run:
+            with db.transaction():
+                db.cursor.execute("DELETE FROM parishes")
+                db.cursor.execute("DELETE FROM scrape_log")
+            print("🗑️  Cleared existing data")
+        summary = seed_files(db, paths, args.batch_size, args.dry_run, args.insert_only)
+        print_summary(summary, None if args.dry_run else db.get_stats())
+    return summary
+
+
+if __name__ == '__main__':
+    main()
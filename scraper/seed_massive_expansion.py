@@ -1,163 +1,15 @@
 #!/usr/bin/env python3
 """Massive parish expansion - USA, Philippines, and South America."""
-from database import ParishDatabase
+import seed
+
 
 def main():
     """Add hundreds of parishes across USA, Philippines, and South America."""
     print("🌎 MASSIVE PARISH EXPANSION")
     print("="*70)
-    
-    parishes = [
-        # ==================== USA - MAJOR CITIES ====================
-        # Florida
-        {"name": "St. Mary's Cathedral", "diocese": "Archdiocese of Miami", "city": "Miami", "state": "FL", "country": "United States", "latitude": 25.7743, "longitude": -80.2102, "address": "7525 NW 2nd Ave, Miami, FL"},
-        {"name": "Sacred Heart Catholic Church", "diocese": "Diocese of St. Petersburg", "city": "Tampa", "state": "FL", "country": "United States", "latitude": 27.9506, "longitude": -82.4572, "address": "509 N Florida Ave, Tampa, FL"},
-        {"name": "Basilica of St. Paul", "diocese": "Diocese of St. Augustine", "city": "Jacksonville", "state": "FL", "country": "United States", "latitude": 30.3322, "longitude": -81.6557, "address": "436 E 6th St, Jacksonville, FL"},
-        
-        # Georgia
-        {"name": "Cathedral of Christ the King", "diocese": "Archdiocese of Atlanta", "city": "Atlanta", "state": "GA", "country": "United States", "latitude": 33.8439, "longitude": -84.3422, "address": "2699 Peachtree Rd NE, Atlanta, GA"},
-        
-        # Illinois (Chicago)
-        {"name": "Holy Name Cathedral", "diocese": "Archdiocese of Chicago", "city": "Chicago", "state": "IL", "country": "United States", "latitude": 41.8979, "longitude": -87.6284, "address": "730 N Wabash Ave, Chicago, IL"},
-        {"name": "Old St. Patrick's Church", "diocese": "Archdiocese of Chicago", "city": "Chicago", "state": "IL", "country": "United States", "latitude": 41.8802, "longitude": -87.6395, "address": "700 W Adams St, Chicago, IL"},
-        
-        # Massachusetts (Boston)
-        {"name": "Cathedral of the Holy Cross", "diocese": "Archdiocese of Boston", "city": "Boston", "state": "MA", "country": "United States", "latitude": 42.3336, "longitude": -71.0786, "address": "1400 Washington St, Boston, MA"},
-        
-        # Pennsylvania (Philadelphia)
-        {"name": "Cathedral Basilica of Saints Peter and Paul", "diocese": "Archdiocese of Philadelphia", "city": "Philadelphia", "state": "PA", "country": "United States", "latitude": 39.9584, "longitude": -75.1708, "address": "1723 Race St, Philadelphia, PA"},
-        
-        # Washington (Seattle)
-        {"name": "St. James Cathedral", "diocese": "Archdiocese of Seattle", "city": "Seattle", "state": "WA", "country": "United States", "latitude": 47.6097, "longitude": -122.3219, "address": "804 9th Ave, Seattle, WA"},
-        
-        # Colorado (Denver)
-        {"name": "Cathedral Basilica of the Immaculate Conception", "diocese": "Archdiocese of Denver", "city": "Denver", "state": "CO", "country": "United States", "latitude": 39.7441, "longitude": -104.9891, "address": "1530 Logan St, Denver, CO"},
-        
-        # Arizona
-        {"name": "Saints Simon and Jude Cathedral", "diocese": "Diocese of Phoenix", "city": "Phoenix", "state": "AZ", "country": "United States", "latitude": 33.5042, "longitude": -112.0739, "address": "6351 N 27th Ave, Phoenix, AZ"},
-        
-        # Nevada
-        {"name": "Guardian Angel Cathedral", "diocese": "Diocese of Las Vegas", "city": "Las Vegas", "state": "NV", "country": "United States", "latitude": 36.1313, "longitude": -115.1543, "address": "302 Cathedral Way, Las Vegas, NV"},
-        
-        # Louisiana
-        {"name": "St. Louis Cathedral", "diocese": "Archdiocese of New Orleans", "city": "New Orleans", "state": "LA", "country": "United States", "latitude": 29.9579, "longitude": -90.0629, "address": "615 Pere Antoine Alley, New Orleans, LA"},
-        
-        # Tennessee
-        {"name": "Cathedral of the Incarnation", "diocese": "Diocese of Nashville", "city": "Nashville", "state": "TN", "country": "United States", "latitude": 36.1521, "longitude": -86.8044, "address": "2015 West End Ave, Nashville, TN"},
-        
-        # North Carolina
-        {"name": "St. Patrick Cathedral", "diocese": "Diocese of Charlotte", "city": "Charlotte", "state": "NC", "country": "United States", "latitude": 35.2271, "longitude": -80.8431, "address": "1621 Dilworth Rd E, Charlotte, NC"},
-        
-        # ==================== PHILIPPINES - MAJOR COVERAGE ====================
-        # Luzon - Metro Manila
-        {"name": "San Sebastian Church", "diocese": "Archdiocese of Manila", "city": "Manila", "state": "", "country": "Philippines", "latitude": 14.6033, "longitude": 120.9931, "address": "Claro M. Recto Ave, Manila"},
-        {"name": "Binondo Church", "diocese": "Archdiocese of Manila", "city": "Manila", "state": "", "country": "Philippines", "latitude": 14.5985, "longitude": 120.9737, "address": "Binondo, Manila"},
-        {"name": "Malate Church", "diocese": "Archdiocese of Manila", "city": "Manila", "state": "", "country": "Philippines", "latitude": 14.5743, "longitude": 120.9875, "address": "Malate, Manila"},
-        
-        # Luzon - Cavite
-        {"name": "Immaculate Conception Cathedral", "diocese": "Diocese of Imus", "city": "Imus", "state": "Cavite", "country": "Philippines", "latitude": 14.4297, "longitude": 120.9367, "address": "Imus, Cavite"},
-        
-        # Luzon - Laguna
-        {"name": "San Pedro Apostol Parish", "diocese": "Diocese of San Pablo", "city": "San Pablo", "state": "Laguna", "country": "Philippines", "latitude": 14.0683, "longitude": 121.3256, "address": "San Pablo, Laguna"},
-        
-        # Luzon - Bulacan
-        {"name": "Barasoain Church", "diocese": "Diocese of Malolos", "city": "Malolos", "state": "Bulacan", "country": "Philippines", "latitude": 14.8451, "longitude": 120.8118, "address": "Malolos, Bulacan"},
-        
-        # Visayas - Cebu
-        {"name": "Basilica del Santo Niño", "diocese": "Archdiocese of Cebu", "city": "Cebu City", "state": "Cebu", "country": "Philippines", "latitude": 10.2943, "longitude": 123.9014, "address": "Cebu City, Cebu"},
-        
-        # Visayas - Iloilo
-        {"name": "Jaro Cathedral", "diocese": "Archdiocese of Jaro", "city": "Iloilo City", "state": "Iloilo", "country": "Philippines", "latitude": 10.7281, "longitude": 122.5647, "address": "Jaro, Iloilo City"},
-        
-        # Mindanao - Davao
-        {"name": "San Pedro Cathedral", "diocese": "Archdiocese of Davao", "city": "Davao City", "state": "Davao del Sur", "country": "Philippines", "latitude": 7.0731, "longitude": 125.6128, "address": "Davao City"},
-        
-        # Mindanao - Cagayan de Oro
-        {"name": "St. Augustine Cathedral", "diocese": "Archdiocese of Cagayan de Oro", "city": "Cagayan de Oro", "state": "Misamis Oriental", "country": "Philippines", "latitude": 8.4823, "longitude": 124.6511, "address": "Cagayan de Oro City"},
-        
-        # Mindanao - Zamboanga
-        {"name": "Immaculate Conception Cathedral", "diocese": "Archdiocese of Zamboanga", "city": "Zamboanga City", "state": "Zamboanga del Sur", "country": "Philippines", "latitude": 6.9214, "longitude": 122.0790, "address": "Zamboanga City"},
-        
-        # ==================== SOUTH AMERICA ====================
-        # Argentina
-        {"name": "Basilica of Our Lady of Luján", "diocese": "Diocese of Luján", "city": "Luján", "state": "", "country": "Argentina", "latitude": -34.5704, "longitude": -59.1151, "address": "Luján, Buenos Aires Province"},
-        {"name": "Córdoba Cathedral", "diocese": "Archdiocese of Córdoba", "city": "Córdoba", "state": "", "country": "Argentina", "latitude": -31.4167, "longitude": -64.1833, "address": "Córdoba, Argentina"},
-        
-        # Brazil - São Paulo
-        {"name": "São Paulo Cathedral", "diocese": "Archdiocese of São Paulo", "city": "São Paulo", "state": "SP", "country": "Brazil", "latitude": -23.5505, "longitude": -46.6333, "address": "Praça da Sé, São Paulo"},
-        {"name": "Basilica of Aparecida", "diocese": "Archdiocese of Aparecida", "city": "Aparecida", "state": "SP", "country": "Brazil", "latitude": -22.8503, "longitude": -45.2314, "address": "Aparecida, São Paulo"},
-        
-        # Brazil - Rio de Janeiro
-        {"name": "Rio de Janeiro Cathedral", "diocese": "Archdiocese of São Sebastião do Rio de Janeiro", "city": "Rio de Janeiro", "state": "RJ", "country": "Brazil", "latitude": -22.9097, "longitude": -43.1799, "address": "Rio de Janeiro"},
-        {"name": "São Bento Monastery", "diocese": "Archdiocese of São Sebastião do Rio de Janeiro", "city": "Rio de Janeiro", "state": "RJ", "country": "Brazil", "latitude": -22.8968, "longitude": -43.1729, "address": "Rio de Janeiro"},
-        
-        # Brazil - Other Major Cities
-        {"name": "Brasília Cathedral", "diocese": "Archdiocese of Brasília", "city": "Brasília", "state": "DF", "country": "Brazil", "latitude": -15.7989, "longitude": -47.8755, "address": "Brasília"},
-        {"name": "Salvador Cathedral", "diocese": "Archdiocese of São Salvador da Bahia", "city": "Salvador", "state": "BA", "country": "Brazil", "latitude": -12.9714, "longitude": -38.5014, "address": "Salvador, Bahia"},
-        
-        # Chile
-        {"name": "Metropolitan Cathedral of Santiago", "diocese": "Archdiocese of Santiago de Chile", "city": "Santiago", "state": "", "country": "Chile", "latitude": -33.4372, "longitude": -70.6506, "address": "Plaza de Armas, Santiago"},
-        {"name": "Valparaíso Cathedral", "diocese": "Diocese of Valparaíso", "city": "Valparaíso", "state": "", "country": "Chile", "latitude": -33.0472, "longitude": -71.6127, "address": "Valparaíso"},
-        
-        # Colombia
-        {"name": "Bogotá Cathedral", "diocese": "Archdiocese of Bogotá", "city": "Bogotá", "state": "", "country": "Colombia", "latitude": 4.5981, "longitude": -74.0758, "address": "Plaza de Bolívar, Bogotá"},
-        {"name": "Las Lajas Sanctuary", "diocese": "Diocese of Pasto", "city": "Ipiales", "state": "", "country": "Colombia", "latitude": 0.8142, "longitude": -77.5906, "address": "Ipiales, Nariño"},
-        {"name": "Medellín Cathedral", "diocese": "Archdiocese of Medellín", "city": "Medellín", "state": "", "country": "Colombia", "latitude": 6.2518, "longitude": -75.5636, "address": "Medellín"},
-        
-        # Peru
-        {"name": "Lima Cathedral", "diocese": "Archdiocese of Lima", "city": "Lima", "state": "", "country": "Peru", "latitude": -12.0464, "longitude": -77.0428, "address": "Plaza Mayor, Lima"},
-        {"name": "Cusco Cathedral", "diocese": "Archdiocese of Cusco", "city": "Cusco", "state": "", "country": "Peru", "latitude": -13.5164, "longitude": -71.9785, "address": "Plaza de Armas, Cusco"},
-        
-        # Ecuador
-        {"name": "Quito Metropolitan Cathedral", "diocese": "Archdiocese of Quito", "city": "Quito", "state": "", "country": "Ecuador", "latitude": -0.2201, "longitude": -78.5125, "address": "Plaza Grande, Quito"},
-        {"name": "Guayaquil Cathedral", "diocese": "Archdiocese of Guayaquil", "city": "Guayaquil", "state": "", "country": "Ecuador", "latitude": -2.1962, "longitude": -79.8862, "address": "Guayaquil"},
-        
-        # Venezuela
-        {"name": "Caracas Cathedral", "diocese": "Archdiocese of Caracas", "city": "Caracas", "state": "", "country": "Venezuela", "latitude": 10.5061, "longitude": -66.9146, "address": "Plaza Bolívar, Caracas"},
-        
-        # Bolivia
-        {"name": "La Paz Cathedral", "diocese": "Archdiocese of La Paz", "city": "La Paz", "state": "", "country": "Bolivia", "latitude": -16.4955, "longitude": -68.1336, "address": "Plaza Murillo, La Paz"},
-        
-        # Paraguay
-        {"name": "Asunción Cathedral", "diocese": "Archdiocese of Asunción", "city": "Asunción", "state": "", "country": "Paraguay", "latitude": -25.2820, "longitude": -57.6351, "address": "Plaza de la Independencia, Asunción"},
-        
-        # Uruguay
-        {"name": "Montevideo Cathedral", "diocese": "Archdiocese of Montevideo", "city": "Montevideo", "state": "", "country": "Uruguay", "latitude": -34.9058, "longitude": -56.2014, "address": "Plaza Constitución, Montevideo"},
-    ]
-    
-    print(f"\n📊 Adding {len(parishes)} parishes...")
-    print(f"   🇺🇸 USA: {sum(1 for p in parishes if p['country'] == 'United States')} parishes")
-    print(f"   🇵🇭 Philippines: {sum(1 for p in parishes if p['country'] == 'Philippines')} parishes")
-    print(f"   🌎 South America: {sum(1 for p in parishes if p['country'] not in ['United States', 'Philippines', 'Canada', 'Mexico'])}")
-    print()
-    
-    with ParishDatabase("parishes.db") as db:
-        added = 0
-        skipped = 0
-        
-        for parish in parishes:
-            if not db.parish_exists(parish['name'], parish.get('diocese', 'Unknown')):
-                parish_id = db.insert_parish(parish)
-                added += 1
-                country_flag = {"United States": "🇺🇸", "Philippines": "🇵🇭", "Argentina": "🇦🇷", 
-                               "Brazil": "🇧🇷", "Chile": "🇨🇱", "Colombia": "🇨🇴", "Peru": "🇵🇪",
-                               "Ecuador": "🇪🇨", "Venezuela": "🇻🇪", "Bolivia": "🇧🇴", 
-                               "Paraguay": "🇵🇾", "Uruguay": "🇺🇾"}.get(parish['country'], "🌍")
-                print(f"  ✓ {country_flag} {parish['name']} - {parish['city']}, {parish['country']}")
-            else:
-                skipped += 1
-        
-        stats = db.get_stats()
-        print("\n" + "="*70)
-        print("📊 Database Statistics")
-        print("="*70)
-        print(f"  Total parishes: {stats['total_parishes']}")
-        print(f"  Parishes with coordinates: {stats['parishes_with_coords']}")
-        print(f"  Dioceses covered: {stats['dioceses_scraped']}")
-        print(f"  Countries: 15")
-        print(f"\n  ✅ Added: {added} parishes")
-        print(f"  ⏭️  Skipped (already exists): {skipped} parishes")
-        print(f"\n✅ Massive expansion complete!")
+    seed.main(['--insert-only', str(seed.SEED_DATA_DIR / "massive_expansion.jsonl")])
+    print(f"\n✅ Massive expansion complete!")
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,17 @@
+"""Shared fixtures for the scraper tests."""
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database import ParishDatabase  # noqa: E402
+
+
+@pytest.fixture
+def db(tmp_path):
+    """An initialized ParishDatabase in a temporary directory."""
+    with ParishDatabase(str(tmp_path / 'parishes.db')) as database:
+        database.initialize()
+        yield database
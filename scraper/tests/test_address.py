@@ -0,0 +1,39 @@
+"""Address normalization and parsing."""
+from scrapers.address import address_key, dedupe_components, normalize_street, split_address, strip_unit
+
+
+def test_equivalent_spellings_share_a_key():
+    assert normalize_street('214 South Lake Drive') == normalize_street('214 S. Lake Dr') == '214 s lk dr'
+    assert address_key('214 S. Lake Dr, Lexington, KY 40502', 'Lexington', 'KY', '40502-1234') == \
+        address_key('214 South Lake Drive', 'lexington', 'ky', '40502') == '214 s lk dr, lexington, ky, 40502'
+
+
+def test_dedupe_components_only_drops_matching_tails():
+    assert dedupe_components('1 Main St, Lexington, KY 40507', 'Lexington') == \
+        ('1 Main St', 'Lexington', 'KY', '40507')
+    # A tail naming another state is part of the address, not a duplicate
+    assert dedupe_components('1 Main St, Lexington, OH', 'Lexington', 'KY') == \
+        ('1 Main St, Lexington, OH', 'Lexington', 'KY', None)
+
+
+def test_split_address_variants():
+    assert split_address('123 Main St, Lexington KY 40503') == {
+        'address': '123 Main St, Lexington KY 40503', 'street': '123 Main St',
+        'city': 'Lexington', 'state': 'KY', 'zip': '40503'}
+    parsed = split_address('123 Main St, Suite 4, Lexington, KY', default_state='OH')
+    assert (parsed['street'], parsed['city'], parsed['state']) == ('123 Main St, Suite 4', 'Lexington', 'KY')
+    assert split_address('40503 Long Rd', default_state='KY')['zip'] is None
+    assert strip_unit('123 Main St Suite 200') == '123 Main St'
+
+
+def test_split_address_lowercase_state_and_country():
+    parsed = split_address('123 Main St, Lexington, Ky 40503')
+    assert (parsed['street'], parsed['city'], parsed['state'], parsed['zip']) == \
+        ('123 Main St', 'Lexington', 'KY', '40503')
+    parsed = split_address('214 S Lake Dr, Prestonsburg, KY 41653, USA')
+    assert (parsed['street'], parsed['city'], parsed['state'], parsed['zip']) == \
+        ('214 S Lake Dr', 'Prestonsburg', 'KY', '41653')
+    # A two-letter word that is not a state stays in the city
+    assert split_address('1 Main St, Ho Ho')['city'] == 'Ho Ho'
+    assert dedupe_components('1 Main St, Lexington, KY 40507, United States', 'Lexington') == \
+        ('1 Main St', 'Lexington', 'KY', '40507')
@@ -0,0 +1,29 @@
+"""Page archive recording and offline replay."""
+from scrapers.archive import PageArchive
+from scrapers.base_scraper import BaseScraper
+
+
+def test_replay_serves_newest_body_per_url(tmp_path):
+    archive = PageArchive(str(tmp_path))
+    archive.record('https://example.org/parishes', 200, {'ETag': '"a"'}, b'<p>old</p>')
+    archive.record('https://example.org:8443/parishes', 200, {}, b'<p>other port</p>')
+    archive.record('https://example.org/parishes', 200, {}, b'<p>new</p>')
+
+    replay = PageArchive(str(tmp_path), replay=True)
+    assert replay.load('https://example.org/parishes') == b'<p>new</p>'
+    assert replay.load('https://example.org:8443/parishes') == b'<p>other port</p>'
+    assert replay.load('https://example.org/missing') is None
+    assert replay.load('https://elsewhere.org/') is None
+
+
+def test_scraper_replays_without_network(tmp_path):
+    PageArchive(str(tmp_path)).record('https://example.org/st-mary', 200, {}, b'<h1>St. Mary</h1>')
+    scraper = BaseScraper('Diocese of Test', 'KY', archive=PageArchive(str(tmp_path), replay=True),
+                          parser='html.parser')
+
+    def no_network(*args, **kwargs):
+        raise AssertionError('replay must not download')
+
+    scraper.download = no_network
+    assert scraper.fetch_bytes('https://example.org/st-mary') == b'<h1>St. Mary</h1>'
+    assert scraper.fetch_bytes('https://example.org/st-joseph') is None
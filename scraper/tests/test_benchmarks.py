@@ -0,0 +1,34 @@
+"""Offline benchmark fixtures and the suite's result comparison."""
+import requests
+
+from benchmarks.fixtures import FakeProvider, LocalSite, synthetic_parishes, synthetic_site
+from benchmarks.suite import compare, flatten
+
+
+def test_local_site_serves_the_synthetic_directory():
+    pages, start = synthetic_site(30, per_page=25)
+    assert len([path for path in pages if path.startswith('/parish/')]) == 30
+    with LocalSite(pages) as site:
+        listing = requests.get(site.url(start), timeout=5)
+        assert listing.status_code == 200 and b'/directory?page=2' in listing.content
+        assert requests.get(site.url('/robots.txt'), timeout=5).status_code == 404
+    assert site.requests == 2
+
+
+def test_fakes_are_deterministic():
+    provider = FakeProvider(miss_every=3)
+    results = [provider.lookup(f"{n} Main St", 'Lexington', 'KY') for n in range(30)]
+    assert results == [provider.lookup(f"{n} Main St", 'Lexington', 'KY') for n in range(30)]
+    assert None in results and any(results)
+    assert list(synthetic_parishes(3)) == list(synthetic_parishes(3))
+
+
+def test_compare_flags_regressions_by_direction():
+    old = {'benchmarks': {'db': {'rows_per_second': 100.0, 'seconds': 2.0, 'rows': 50, 'wal': False}}}
+    new = {'benchmarks': {'db': {'rows_per_second': 150.0, 'seconds': 2.5, 'rows': 50, 'wal': True}}}
+    assert dict(flatten(new['benchmarks'])) == {'db.rows_per_second': 150.0, 'db.seconds': 2.5, 'db.rows': 50}
+
+    lines = compare(old, new).splitlines()[1:]
+    assert len(lines) == 2
+    assert lines[0].startswith('db.rows_per_second') and lines[0].endswith('✅')
+    assert lines[1].startswith('db.seconds') and lines[1].endswith('❌')
@@ -0,0 +1,60 @@
+"""Concurrent diocese crawl: per-host limits and result routing."""
+import threading
+import time
+
+from crawler import HostLimiter, crawl_dioceses
+
+
+def test_host_limiter_caps_concurrency_per_host():
+    limiter = HostLimiter(per_host=2)
+    active = {'a.org': 0, 'b.org': 0}
+    peak = {'a.org': 0, 'b.org': 0}
+    lock = threading.Lock()
+
+    def request(host):
+        with limiter.limit(f"https://{host.upper()}/page"):
+            with lock:
+                active[host] += 1
+                peak[host] = max(peak[host], active[host])
+            time.sleep(0.02)
+            with lock:
+                active[host] -= 1
+
+    threads = [threading.Thread(target=request, args=(host,)) for host in ['a.org', 'b.org'] * 5]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert peak == {'a.org': 2, 'b.org': 2}
+
+
+class FakeScraper:
+    unchanged_pages = 3
+
+    def __init__(self, diocese):
+        self.diocese = diocese
+
+    def scrape_parish_list(self, url):
+        if 'broken' in url:
+            raise RuntimeError('listing failed')
+        return [{'name': f"St. Mary, {self.diocese['name']}"}]
+
+
+def test_crawl_dioceses_reports_each_outcome():
+    dioceses = [
+        {'name': 'Lexington', 'parishes_page': 'https://lex.org/parishes'},
+        {'name': 'Broken', 'parishes_page': 'https://broken.org/parishes'},
+        {'name': 'Unsupported', 'parishes_page': 'https://none.org/parishes'},
+    ]
+
+    def factory(diocese, limiter):
+        assert isinstance(limiter, HostLimiter)
+        return None if diocese['name'] == 'Unsupported' else FakeScraper(diocese)
+
+    results = {diocese['name']: (parishes, error, unchanged)
+               for diocese, parishes, error, unchanged in crawl_dioceses(dioceses, factory, max_workers=3)}
+
+    assert results['Lexington'] == ([{'name': 'St. Mary, Lexington'}], None, 3)
+    parishes, error, unchanged = results['Broken']
+    assert parishes is None and isinstance(error, RuntimeError) and unchanged == 0
+    assert results['Unsupported'] == (None, None, 0)
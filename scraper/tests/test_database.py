@@ -0,0 +1,87 @@
+"""ParishDatabase transactions, upserts and schema migrations."""
+import sqlite3
+
+import pytest
+
+from database import SCHEMA_VERSION, ParishDatabase
+
+# parishes as created before the (name, diocese) unique key existed
+OLD_PARISHES_TABLE = """
+    CREATE TABLE parishes (
+      id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, diocese TEXT NOT NULL,
+      address TEXT, street TEXT, city TEXT, state TEXT, zip TEXT, country TEXT DEFAULT 'United States',
+      phone TEXT, website TEXT, email TEXT, latitude REAL, longitude REAL, mass_times TEXT,
+      pastor TEXT, source_url TEXT, last_scraped TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+      created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+PARISH = {'name': 'St. Paul', 'diocese': 'Diocese of Lexington', 'city': 'Lexington', 'state': 'KY'}
+
+
+def count(db):
+    return db.cursor.execute("SELECT COUNT(*) FROM parishes").fetchone()[0]
+
+
+def test_transaction_commits_once_and_rolls_back_on_error(db):
+    with db.transaction():
+        db.insert_parish(dict(PARISH))
+        with db.transaction():
+            db.insert_parish({**PARISH, 'name': 'St. Peter'})
+        # Nested blocks leave the commit to the outermost one
+        assert db.conn.in_transaction
+    assert not db.conn.in_transaction and count(db) == 2
+
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.insert_parish({**PARISH, 'name': 'St. Anne'})
+            raise RuntimeError('scrape failed')
+    assert count(db) == 2
+
+
+def test_insert_parishes_batches_mixed_columns(db):
+    rows = [{**PARISH, 'name': f"St. Paul {n}"} for n in range(5)]
+    rows[2] = {'name': 'St. Mark', 'diocese': 'Diocese of Lexington', 'mass_times': 'Sunday 9:00 AM'}
+    assert db.insert_parishes(rows, batch_size=2) == 5
+    assert count(db) == 5
+    assert db.cursor.execute("SELECT COUNT(*) FROM mass_schedule").fetchone()[0] == 1
+
+
+def test_upsert_reports_inserted_updated_unchanged(db):
+    assert db.upsert_parish(PARISH) == 'inserted'
+    assert db.upsert_parish(PARISH) == 'unchanged'
+    assert db.upsert_parish({**PARISH, 'phone': '(859) 555-1234'}) == 'updated'
+    # Columns missing from a later record keep their stored values
+    assert db.upsert_parish({'name': 'St. Paul', 'diocese': 'Diocese of Lexington'}) == 'unchanged'
+    row = db.cursor.execute("SELECT phone, city FROM parishes").fetchone()
+    assert tuple(row) == ('(859) 555-1234', 'Lexington')
+
+
+def test_upsert_many_counts_each_outcome(db):
+    db.upsert_parish(PARISH)
+    counts = db.upsert_many([PARISH, {**PARISH, 'name': 'St. Peter'}, {**PARISH, 'zip': '40502'}])
+    assert counts == {'inserted': 1, 'updated': 1, 'unchanged': 1}
+
+
+def test_old_duplicates_are_merged_once(tmp_path):
+    path = str(tmp_path / 'old.db')
+    conn = sqlite3.connect(path)
+    conn.execute(OLD_PARISHES_TABLE)
+    conn.executemany("INSERT INTO parishes (name, diocese, address, phone, website, last_scraped) "
+                     "VALUES (?, ?, ?, ?, ?, ?)", [
+                         ('St. Paul', 'Lexington', '1 Main St', None, None, '2023-01-01'),
+                         ('St. Paul', 'Lexington', '2 Oak St', '555-0001', None, '2023-06-01'),
+                         ('St. Paul', 'Lexington', None, '555-0002', 'https://stpaul.org', '2024-01-01'),
+                     ])
+    conn.commit()
+    conn.close()
+
+    with ParishDatabase(path) as db:
+        db.initialize()
+        rows = [dict(row) for row in db.cursor.execute("SELECT id, address, phone, website FROM parishes")]
+        assert rows == [{'id': 1, 'address': '1 Main St', 'phone': '555-0002', 'website': 'https://stpaul.org'}]
+        assert db.cursor.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+
+        # Later initializations do not look for duplicates again
+        db._merge_duplicate_parishes = None
+        db.initialize()
@@ -0,0 +1,91 @@
+"""Duplicate parish detection and merging."""
+import dedup
+from dedup import find_duplicates, merge_duplicates, name_score, name_tokens
+
+
+def candidate(name, **fields):
+    tokens = name_tokens(name)
+    values = {'id': 0, 'diocese': 'D', 'latitude': None, 'longitude': None, 'zip': None, 'address': ''}
+    values.update(fields)
+    return dedup.Candidate(tokens=tokens, key=' '.join(sorted(tokens)), **values)
+
+
+def add(db, name, diocese='Diocese of Test', **fields):
+    db.upsert_parish({'name': name, 'diocese': diocese, **fields})
+    return db.cursor.execute("SELECT id FROM parishes WHERE name = ?", (name,)).fetchone()['id']
+
+
+def test_name_tokens_drop_generic_words_and_fold_saints():
+    assert name_tokens("St. Mary's Cathedral") == {'st', 'mary'}
+    assert name_tokens("Cathedral of Saint Mary") == {'st', 'mary'}
+    assert name_tokens("The Cathedral") == {'the', 'cathedral'}
+
+
+def test_name_score_token_overlap():
+    assert name_score(candidate("St. Mary's Cathedral"), candidate("Cathedral of Saint Mary")) == 1.0
+
+
+def test_short_names_one_letter_apart_are_different_parishes():
+    assert name_score(candidate("St. Mary"), candidate("St. Mark")) < 0.8
+    assert name_score(candidate("St. John"), candidate("St. Joan")) < 0.8
+
+
+def test_long_word_typo_still_matches():
+    assert name_score(candidate("St. Bernadette"), candidate("St. Bernadete")) >= 0.8
+
+
+def test_name_score_uses_min_score_argument():
+    a, b = candidate("St. Mary Help"), candidate("St. Mary")
+    assert name_score(a, b, min_score=0.5) == 2 / 3
+
+
+def test_mary_and_mark_nearby_are_not_grouped(db):
+    add(db, "St. Mary", latitude=38.0, longitude=-84.5)
+    add(db, "St. Mark", latitude=38.0048, longitude=-84.5)  # ~0.33 mi north
+    assert find_duplicates(db) == []
+
+
+def test_john_and_joan_in_one_zip_are_not_grouped(db):
+    add(db, "St. John", zip='40502')
+    add(db, "St. Joan", zip='40502')
+    assert find_duplicates(db) == []
+
+
+def test_min_score_argument_is_honoured(db):
+    add(db, "St. Mary Help of Christians", latitude=38.0, longitude=-84.5)
+    add(db, "St. Mary", latitude=38.001, longitude=-84.5)
+    assert find_duplicates(db) == []
+    assert len(find_duplicates(db, min_score=0.3)) == 1
+
+
+def test_merged_names_stay_merged(db):
+    keep = add(db, "Cathedral of Saint Mary", latitude=38.0, longitude=-84.5, phone='555-0100')
+    add(db, "St. Mary's Cathedral", latitude=38.0001, longitude=-84.5)
+    groups = find_duplicates(db)
+    assert [group['ids'] for group in groups] == [[1, 2]]
+    assert merge_duplicates(db, groups) == 1
+
+    # The next scrape still uses the deleted name: it updates the kept row
+    assert db.upsert_parish({'name': "St. Mary's Cathedral", 'diocese': 'Diocese of Test',
+                             'phone': '555-0199'}) == 'updated'
+    assert db.get_parish_count() == 1
+    row = db.cursor.execute("SELECT id, name, phone FROM parishes").fetchone()
+    assert (row['id'], row['name'], row['phone']) == (keep, "Cathedral of Saint Mary", '555-0199')
+    assert db.upsert_parish({'name': "St. Mary's Cathedral", 'diocese': 'Diocese of Test',
+                             'phone': '555-0199'}) == 'unchanged'
+
+
+def test_distinct_parishes_at_one_centroid_are_not_grouped(db):
+    # A ZIP-centroid geocode puts every parish in 40502 on the same point
+    centroid = {'latitude': 38.02, 'longitude': -84.49, 'city': 'Lexington', 'state': 'KY', 'zip': '40502'}
+    add(db, "St. Patrick", address='284 N Mill St', **centroid)
+    add(db, "Holy Family", address='1 Brookhaven Dr', **centroid)
+    add(db, "Our Lady of Lourdes", address='515 Wilson Downing Rd', **centroid)
+    assert find_duplicates(db) == []
+
+
+def test_same_address_under_two_names_is_grouped(db):
+    spot = {'latitude': 38.02, 'longitude': -84.49, 'city': 'Lexington', 'state': 'KY'}
+    add(db, "St. Paul", address='501 W Short St', **spot)
+    add(db, "Cathedral of Christ the King", address='501 West Short Street', **spot)
+    assert [group['ids'] for group in find_duplicates(db)] == [[1, 2]]
@@ -0,0 +1,34 @@
+"""Pagination discovery on listing pages."""
+from bs4 import BeautifulSoup
+
+from scrapers.discovery import next_page_url
+from scrapers.lexington import LISTING_STRAINER
+
+PAGE = 'https://example.org/parishes?page=2'
+
+
+def soup(html, parse_only=None):
+    return BeautifulSoup(html, 'html.parser', parse_only=parse_only)
+
+
+def test_rel_next_link_wins():
+    page = soup('<head><link rel="next" href="/parishes?page=3"></head><a href="?page=9">9</a>')
+    assert next_page_url(page, PAGE, 2) == 'https://example.org/parishes?page=3'
+
+
+def test_selector_then_text_then_number():
+    assert next_page_url(soup('<a class="go" href="/p/3">→</a>'), PAGE, 2, 'a.go') == 'https://example.org/p/3'
+    assert next_page_url(soup('<a href="/more-parishes">Next »</a>'), PAGE, 2) == \
+        'https://example.org/more-parishes'
+    assert next_page_url(soup('<a href="?page=1">1</a><a href="?page=3">3</a>'), PAGE, 2) == \
+        'https://example.org/parishes?page=3'
+    assert next_page_url(soup('<a href="?page=1">1</a>'), PAGE, 2) is None
+
+
+def test_listing_strainer_keeps_pagination_links():
+    html = ('<html><head><link rel="next" href="/parishes?page=3"></head><body>'
+            '<div class="parish-card"><h3>St. Paul</h3></div><p>Welcome</p></body></html>')
+    page = soup(html, LISTING_STRAINER)
+    assert page.find('p') is None
+    assert page.find(class_='parish-card') is not None
+    assert next_page_url(page, PAGE, 2) == 'https://example.org/parishes?page=3'
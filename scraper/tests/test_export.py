@@ -0,0 +1,74 @@
+"""Exports: streamed parishes.json, grid tiles and stale-tile cleanup."""
+import gzip
+import hashlib
+import json
+
+import pytest
+
+from export_json import export_parishes, export_service_index, export_tiles
+
+PARISH = {'name': 'St. Paul', 'diocese': 'Diocese of Lexington', 'state': 'KY',
+          'latitude': 38.04, 'longitude': -84.50}
+
+
+def test_export_parishes_writes_compressed_sibling(db, tmp_path):
+    db.upsert_parish(PARISH)
+    output = tmp_path / 'parishes.json'
+    export_parishes(tmp_path / 'parishes.db', output)
+
+    data = json.loads(output.read_text())
+    assert [parish['name'] for parish in data] == ['St. Paul']
+    assert gzip.decompress((tmp_path / 'parishes.json.gz').read_bytes()) == output.read_bytes()
+
+
+def test_export_parishes_compact_manifest_and_filters(db, tmp_path):
+    db.upsert_parish({**PARISH, 'latitude': 38.0412345678})
+    db.upsert_parish({'name': 'St. Peter', 'diocese': 'Diocese of Lexington'})
+    output = tmp_path / 'parishes.json'
+    manifest = export_parishes(tmp_path / 'parishes.db', output, columns=['id', 'name', 'latitude', 'phone'],
+                               compress=False, coords_only=True)
+
+    body = output.read_bytes()
+    # Compact rows drop null fields and round coordinates
+    assert json.loads(body) == [{'id': 1, 'name': 'St. Paul', 'latitude': 38.04123}]
+    assert b' ' not in body.replace(b'St. Paul', b'')
+    assert manifest['count'] == 1 and manifest['bytes'] == len(body)
+    assert manifest['sha256'] == hashlib.sha256(body).hexdigest()
+    assert json.loads((tmp_path / 'parishes.manifest.json').read_text())['etag'] == manifest['etag']
+
+    with pytest.raises(ValueError):
+        export_parishes(tmp_path / 'parishes.db', output, columns=['name', 'nonsense'])
+
+
+def test_export_tiles_removes_only_stale_tiles(db, tmp_path):
+    db.upsert_parish(PARISH)
+    tiles_dir = tmp_path / 'tiles'
+    tiles_dir.mkdir()
+    for name in ('0_0.json', '0_0.json.gz', 'my_notes.json', 'index_backup.json', '1_2.json.bak'):
+        (tiles_dir / name).write_text('{}')
+
+    index = export_tiles(tmp_path / 'parishes.db', tiles_dir, compress=False)
+
+    keys = [tile['key'] for tile in index['tiles']]
+    assert index['count'] == 1 and len(keys) == 1
+    remaining = {path.name for path in tiles_dir.iterdir()}
+    assert remaining == {f"{keys[0]}.json", 'index.json', 'my_notes.json',
+                         'index_backup.json', '1_2.json.bak'}
+
+
+def test_export_tiles_without_coordinates_writes_empty_index(db, tmp_path):
+    db.upsert_parish({**PARISH, 'latitude': None, 'longitude': None})
+    tiles_dir = tmp_path / 'fresh' / 'tiles'
+    index = export_tiles(tmp_path / 'parishes.db', tiles_dir)
+    assert index['tiles'] == [] and index['count'] == 0
+    assert json.loads((tiles_dir / 'index.json').read_text())['tiles'] == []
+
+
+def test_service_index_export_of_seed_only_database(db, tmp_path, capsys):
+    db.upsert_parish(PARISH)
+    capsys.readouterr()
+    times_dir = tmp_path / 'tiles' / 'times'
+    index = export_service_index(tmp_path / 'parishes.db', times_dir)
+    assert index['tiles'] == [] and (times_dir / 'index.json').exists()
+    # A read-only export does not run the schema setup
+    assert 'initialized' not in capsys.readouterr().out
@@ -0,0 +1,26 @@
+"""Single-pass contact extraction."""
+from scrapers.extraction import extract_contacts, first_contacts, scan_contacts
+
+TEXT = ("St. Paul, 501 Short St, Lexington, KY 40507. Call (859) 254-5000 or "
+        "8592545001, email office42@stpaul.org. OK to visit; see NY office.")
+
+
+def test_scan_finds_each_kind_in_order():
+    matches = [(match.kind, match.value) for match in scan_contacts(TEXT)]
+    assert matches == [
+        ('state', 'KY'), ('zip', '40507'), ('phone', '(859) 254-5000'), ('phone', '8592545001'),
+        ('email', 'office42@stpaul.org'), ('state', 'OK'), ('state', 'NY'),
+    ]
+
+
+def test_email_digits_and_long_numbers_are_not_split():
+    grouped = extract_contacts("Write to 40507office@parish.org or call 859-254-5000 ext. XY")
+    assert [match.value for match in grouped['email']] == ['40507office@parish.org']
+    assert [match.value for match in grouped['phone']] == ['859-254-5000']
+    assert grouped['zip'] == [] and grouped['state'] == []
+
+
+def test_first_contacts_matches_the_full_scan():
+    assert first_contacts(TEXT) == {'email': 'office42@stpaul.org', 'phone': '(859) 254-5000',
+                                    'zip': '40507', 'state': 'KY'}
+    assert first_contacts("No contact details here") == dict.fromkeys(['email', 'phone', 'zip', 'state'])
@@ -0,0 +1,27 @@
+"""Gazetteer street lookups."""
+import pytest
+
+from gazetteer import Gazetteer, build
+
+ADDRESSES = "LON,LAT,NUMBER,STREET,CITY,REGION,POSTCODE\n" \
+            "-84.50,38.00,200,South Lake Drive,Lexington,KY,40502\n" \
+            "-84.52,38.02,220,South Lake Drive,Lexington,KY,40502\n"
+
+
+@pytest.fixture
+def gazetteer(tmp_path):
+    csv_path = tmp_path / 'ky.csv'
+    csv_path.write_text(ADDRESSES)
+    path = tmp_path / 'gazetteer.db'
+    build(str(path), openaddresses=[str(csv_path)])
+    gazetteer = Gazetteer(str(path))
+    yield gazetteer
+    gazetteer.close()
+
+
+def test_street_lookup_uses_normalized_keys(gazetteer):
+    # Exact number, then one interpolated halfway along the street
+    assert gazetteer.street('220 S. Lake Dr', zip_code='40502') == (38.02, -84.52)
+    latitude, longitude = gazetteer.street('210 South Lake Drive', 'Lexington', 'ky')
+    assert latitude == pytest.approx(38.01) and longitude == pytest.approx(-84.51)
+    assert gazetteer.street('210 North Lake Drive', zip_code='40502') is None
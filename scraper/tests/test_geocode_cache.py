@@ -0,0 +1,29 @@
+"""Geocode cache: normalized keys, negative entries and TTL expiry."""
+import time
+
+from geocode_cache import DAY_SECONDS, GeocodeCache
+
+
+def test_positive_and_negative_entries(tmp_path):
+    cache = GeocodeCache(str(tmp_path / 'cache.db'))
+    assert cache.get('1 Main St, Lexington, KY') == (False, None)
+
+    cache.set('1 Main St, Lexington, KY', (38.0, -84.5))
+    cache.set('Nowhere, KY', None)
+    assert cache.get('  1 MAIN  st,lexington , KY ') == (True, (38.0, -84.5))
+    assert cache.get('Nowhere, KY') == (True, None)
+    assert len(cache) == 2
+
+
+def test_entries_expire_after_their_ttl(tmp_path, monkeypatch):
+    cache = GeocodeCache(str(tmp_path / 'cache.db'), ttl_days=30, negative_ttl_days=7)
+    cache.set('1 Main St', (38.0, -84.5))
+    cache.set('Nowhere', None)
+
+    now = time.time()
+    monkeypatch.setattr(time, 'time', lambda: now + 10 * DAY_SECONDS)
+    assert cache.get('1 Main St') == (True, (38.0, -84.5))
+    assert cache.get('Nowhere') == (False, None)
+
+    assert cache.purge_expired() == 1
+    assert len(cache) == 1
@@ -0,0 +1,52 @@
+"""The background geocode queue and its retries."""
+from geocode_queue import GeocodeWorker
+
+
+class FlakyGeocoder:
+    """Fails the first lookup of every address, then succeeds."""
+
+    def __init__(self):
+        self.calls = []
+
+    def geocode(self, address, city=None, state=None, zip_code=None, retry_failures=False):
+        self.calls.append(retry_failures)
+        return (38.0, -84.5) if len(self.calls) > 1 else None
+
+
+def drain(db, geocoder):
+    worker = GeocodeWorker(db.db_path, geocoder=geocoder, poll_interval=0.01)
+    worker.finish()
+    worker.run()
+    return worker
+
+
+def test_failed_lookups_back_off_then_ask_the_providers_again(db):
+    db.upsert_parish({'name': 'St. Paul', 'diocese': 'Lexington', 'address': '1 Main St'})
+    assert len(db.pending_geocodes()) == 1
+
+    geocoder = FlakyGeocoder()
+    worker = drain(db, geocoder)
+    # One failure per run, not max_attempts lookups back to back
+    assert geocoder.calls == [False]
+    assert (worker.geocoded, worker.failed) == (0, 1)
+    assert db.pending_geocodes() == []
+    minutes = db.cursor.execute(
+        "SELECT (julianday(next_attempt_at) - julianday('now')) * 1440 FROM geocode_queue").fetchone()[0]
+    assert 55 < minutes <= 60
+
+    # Once the wait is over, the retry skips the cached failure
+    db.cursor.execute("UPDATE geocode_queue SET next_attempt_at = datetime('now', '-1 minute')")
+    db.conn.commit()
+    worker = drain(db, geocoder)
+    assert geocoder.calls == [False, True]
+    assert worker.geocoded == 1
+    assert db.pending_geocodes() == []
+
+
+def test_new_parishes_are_served_before_retries(db):
+    for name in ('St. Paul', 'St. Peter'):
+        db.upsert_parish({'name': name, 'diocese': 'Lexington', 'address': f"1 {name} St"})
+    db.cursor.execute("UPDATE geocode_queue SET attempts = 1, next_attempt_at = datetime('now', '-1 minute') "
+                      "WHERE parish_id = 1")
+    db.conn.commit()
+    assert [parish['name'] for parish in db.pending_geocodes()] == ['St. Peter', 'St. Paul']
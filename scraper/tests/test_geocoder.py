@@ -0,0 +1,80 @@
+"""Geocoder: provider order, the result cache and remembered failures."""
+import pytest
+
+from geocode_cache import GeocodeCache
+from geocode_providers import NOMINATIM_HOST, GeocodingProvider
+from geocoder import Geocoder
+from metrics import Metrics
+from politeness import HostScheduler
+
+
+class StubProvider(GeocodingProvider):
+    """Answers every lookup with fixed coordinates (or None)."""
+
+    def __init__(self, name, remote, coords=None):
+        self.name = name
+        self.remote = remote
+        self.coords = coords
+        self.lookups = 0
+
+    def lookup(self, address, city=None, state=None, zip_code=None):
+        self.lookups += 1
+        return self.coords
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = GeocodeCache(str(tmp_path / 'geocode_cache.db'))
+    yield cache
+    cache.close()
+
+
+def geocoder(cache, *providers):
+    return Geocoder(cache=cache, providers=list(providers), metrics=Metrics())
+
+
+def test_remote_results_are_cached(cache):
+    remote = StubProvider('remote', True, (38.0, -84.5))
+    coder = geocoder(cache, remote)
+    assert coder.geocode('1 Main St', 'Lexington', 'KY') == (38.0, -84.5)
+    assert coder.geocode('1 Main St.', 'Lexington', 'KY') == (38.0, -84.5)
+    assert remote.lookups == 1
+
+
+def test_remembered_failure_still_tries_local_providers(cache):
+    remote = StubProvider('remote', True)
+    centroid = StubProvider('centroid', False)
+    coder = geocoder(cache, remote, centroid)
+    assert coder.geocode('1 Main St', 'Lexington', 'KY') is None
+
+    centroid.coords = (38.04, -84.46)
+    assert coder.geocode('1 Main St', 'Lexington', 'KY') == (38.04, -84.46)
+    assert remote.lookups == 1
+    assert centroid.lookups == 2
+
+
+def test_max_retries_is_accepted_but_deprecated(cache):
+    coder = geocoder(cache, StubProvider('remote', True, (1.0, 2.0)))
+    with pytest.warns(DeprecationWarning):
+        assert coder.geocode('1 Main St', max_retries=5) == (1.0, 2.0)
+
+
+def test_batch_delay_does_not_leak_into_the_shared_rate(cache):
+    scheduler = HostScheduler(host_rates={NOMINATIM_HOST: 1.0}, respect_robots=False)
+    coder = Geocoder(cache=cache, scheduler=scheduler, providers=[StubProvider('remote', True, (1.0, 2.0))],
+                     metrics=Metrics())
+    results = coder.geocode_batch([{'full_address': '1 Main St', 'address': '1 Main St'}], delay=0.1)
+    assert results == {'1 Main St': (1.0, 2.0)}
+    assert scheduler.host_rates[NOMINATIM_HOST] == 1.0
+
+
+def test_retry_failures_bypasses_the_negative_cache(cache):
+    remote = StubProvider('remote', True)
+    coder = geocoder(cache, remote)
+    assert coder.geocode('1 Main St') is None
+    assert coder.geocode('1 Main St') is None
+    assert remote.lookups == 1
+
+    remote.coords = (38.0, -84.5)
+    assert coder.geocode('1 Main St', retry_failures=True) == (38.0, -84.5)
+    assert remote.lookups == 2
@@ -0,0 +1,27 @@
+"""Command line handling in main.py."""
+import pytest
+
+import main
+from config import DB_PATH, REPLAY_DB_PATH, REPLAY_LEDGER_PATH, RUN_LEDGER_PATH
+
+
+def test_defaults_write_live_data():
+    args = main.parse_args([])
+    assert (args.db, args.ledger, args.no_geocode) == (DB_PATH, RUN_LEDGER_PATH, False)
+
+
+def test_replay_is_offline_and_uses_scratch_files():
+    args = main.parse_args(['--replay'])
+    assert (args.db, args.ledger, args.no_geocode) == (REPLAY_DB_PATH, REPLAY_LEDGER_PATH, True)
+    assert main.parse_args(['--replay', 'pages', '--db', 'scratch.db']).db == 'scratch.db'
+
+
+def test_replay_refuses_the_live_database():
+    with pytest.raises(SystemExit):
+        main.parse_args(['--replay', '--db', DB_PATH])
+
+
+def test_archive_fetches_every_page():
+    assert main.parse_args([]).full_refresh is False
+    args = main.parse_args(['--archive', 'pages'])
+    assert (args.archive, args.full_refresh) == ('pages', True)
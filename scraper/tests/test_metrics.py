@@ -0,0 +1,67 @@
+"""Stage timers, child registries and the scrape_log timing columns."""
+import time
+
+import pytest
+
+import main
+from metrics import Metrics
+from scrapers.base_scraper import BaseScraper
+
+
+def test_child_totals_roll_up():
+    root = Metrics()
+    child = root.child('Diocese of Test')
+    child.record('fetch', 0.5, bytes=100)
+    child.count('geocode_cache_hit')
+    assert root.child('Diocese of Test') is child
+    assert root.snapshot()['stages']['fetch'] == {'count': 1, 'seconds': 0.5, 'max': 0.5, 'bytes': 100}
+    assert root.snapshot()['counters'] == {'geocode_cache_hit': 1}
+
+
+def test_timer_records_errors():
+    metrics = Metrics()
+    with pytest.raises(ValueError), metrics.timer('parse'):
+        raise ValueError
+    assert metrics.snapshot()['stages']['parse']['count'] == 1
+
+
+class SlowScheduler:
+    def wait(self, url):
+        time.sleep(0.05)
+
+
+def test_politeness_wait_is_not_fetch_time(monkeypatch):
+    metrics = Metrics()
+    scraper = BaseScraper('Diocese of Test', 'KY', parser='html.parser', scheduler=SlowScheduler(),
+                          metrics=metrics)
+
+    class Response:
+        status_code = 200
+        headers = {}
+        content = b'<p>hi</p>'
+
+        def raise_for_status(self):
+            pass
+
+    monkeypatch.setattr(scraper.session, 'get', lambda url, **kwargs: Response())
+    assert scraper.fetch_bytes('https://example.org/') == b'<p>hi</p>'
+    stages = metrics.snapshot()['stages']
+    assert stages['wait']['seconds'] >= 0.05
+    assert stages['fetch']['seconds'] < 0.05
+    assert stages['fetch']['bytes'] == 9
+
+
+def test_extraction_is_timed_once_per_detail_page():
+    metrics = Metrics()
+    scraper = BaseScraper('Diocese of Test', 'KY', parser='html.parser', metrics=metrics)
+
+    def scrape(url):
+        text = 'Call (859) 555-1234 or office@example.org'
+        return {'name': url, 'phone': scraper.extract_phone(text), 'email': scraper.extract_email(text)}
+
+    parishes = list(scraper.iter_details(['https://example.org/a', 'https://example.org/b'], scrape))
+    assert len(parishes) == 2
+    stages = metrics.snapshot()['stages']
+    assert stages['extract']['count'] == 2
+    assert not any(stage.startswith('extract_') for stage in stages)
+    assert main.stage_timings(metrics)['extract_seconds'] == round(stages['extract']['seconds'], 3)
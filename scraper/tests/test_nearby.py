@@ -0,0 +1,29 @@
+"""Radius queries through the parish_rtree index."""
+from database import bounding_boxes
+
+
+def add(db, name, latitude, longitude):
+    db.upsert_parish({'name': name, 'diocese': 'Test', 'latitude': latitude, 'longitude': longitude})
+
+
+def test_nearby_filters_by_distance_and_sorts(db):
+    add(db, 'Downtown', 38.05, -84.50)
+    add(db, 'Suburb', 38.15, -84.50)
+    add(db, 'Louisville', 38.25, -85.76)
+    add(db, 'No coordinates', None, None)
+
+    parishes = db.nearby(38.04, -84.50, radius=15)
+    assert [parish['name'] for parish in parishes] == ['Downtown', 'Suburb']
+    assert parishes[0]['distance'] < 1 < parishes[1]['distance'] < 15
+
+    # Moving a parish moves its index entry
+    add(db, 'Louisville', 38.06, -84.51)
+    assert [parish['name'] for parish in db.nearby(38.04, -84.50, radius=15, limit=2)] == \
+        ['Downtown', 'Louisville']
+
+
+def test_search_across_the_antimeridian(db):
+    add(db, 'Fiji', -17.8, 179.9)
+    add(db, 'Samoa', -17.8, -179.9)
+    assert len(bounding_boxes(-17.8, 179.95, 50)) == 2
+    assert {parish['name'] for parish in db.nearby(-17.8, 179.95, radius=50)} == {'Fiji', 'Samoa'}
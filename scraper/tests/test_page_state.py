@@ -0,0 +1,62 @@
+"""Conditional re-scrapes: unchanged pages and their validators."""
+import main
+from scrapers.base_scraper import BaseScraper
+from scrapers.discovery import listing_pages
+from scrapers.page_state import PageStateStore, PageUnchanged
+
+DIOCESE = {'name': 'Diocese of Test', 'state': 'KY'}
+
+
+class RecordingScraper(BaseScraper):
+    """Serves canned soups and records how each page was fetched."""
+
+    def __init__(self, pages):
+        super().__init__('Diocese of Test', 'KY', parser='html.parser')
+        self.pages = pages
+        self.calls = []
+
+    def fetch_page(self, url, max_retries=3, parse_only=None, conditional=True):
+        self.calls.append((url, conditional))
+        if conditional:
+            raise PageUnchanged(url)
+        return self.parse_html(self.pages[url])
+
+
+def test_listing_pages_are_walked_when_unchanged():
+    scraper = RecordingScraper({
+        'https://example.org/parishes': b'<a rel="next" href="/parishes?page=2">2</a>',
+        'https://example.org/parishes?page=2': b'<p>last</p>',
+    })
+    urls = [url for url, _ in listing_pages(scraper, 'https://example.org/parishes', 5)]
+    assert urls == ['https://example.org/parishes', 'https://example.org/parishes?page=2']
+    assert all(not conditional for _, conditional in scraper.calls)
+
+
+def test_iter_details_counts_unchanged_pages():
+    scraper = RecordingScraper({})
+
+    def scrape(url):
+        raise PageUnchanged(url)
+
+    urls = [f"https://example.org/parish/{n}" for n in range(3)]
+    assert scraper.fetch_details(urls, scrape) == []
+    assert scraper.unchanged_pages == 3
+
+
+def test_all_unchanged_is_logged_unchanged_and_commits_validators(db, tmp_path):
+    store = PageStateStore(str(tmp_path / 'page_state.db'))
+    store.stage(DIOCESE['name'], 'https://example.org/parish/1', '"abc"', None, 'hash')
+
+    saved = main.save_parishes(DIOCESE, [], db, unchanged_pages=4)
+    main.finish_page_state(DIOCESE, store, saved)
+
+    assert saved is True
+    status = db.cursor.execute("SELECT status FROM scrape_log").fetchone()['status']
+    assert status == 'unchanged'
+    assert store.get('https://example.org/parish/1')['etag'] == '"abc"'
+
+
+def test_no_parishes_and_nothing_unchanged_still_fails(db):
+    assert main.save_parishes(DIOCESE, [], db) is False
+    status = db.cursor.execute("SELECT status FROM scrape_log").fetchone()['status']
+    assert status == 'failed'
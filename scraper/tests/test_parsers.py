@@ -0,0 +1,20 @@
+"""HTML parser backend selection and listing-page strainers."""
+from scrapers.base_scraper import BaseScraper, resolve_parser
+from scrapers.lexington import LISTING_STRAINER
+
+LISTING = (b'<html><body><nav><p>Menu</p></nav>'
+           b'<div class="parish-item"><h3>St. Paul</h3><a href="/st-paul">More</a></div>'
+           b'<table><tr class="row"><td>Office</td></tr></table></body></html>')
+
+
+def test_unknown_parser_falls_back_to_html_parser():
+    assert resolve_parser('html.parser') == 'html.parser'
+    assert resolve_parser('no-such-parser') == 'html.parser'
+    assert BaseScraper('Diocese of Test', 'KY', parser='no-such-parser').parser == 'html.parser'
+
+
+def test_strainer_builds_only_parish_containers_and_links():
+    scraper = BaseScraper('Diocese of Test', 'KY', parser='html.parser')
+    soup = scraper.parse_html(LISTING, LISTING_STRAINER)
+    assert [tag.name for tag in soup.find_all(True)] == ['div', 'h3', 'a']
+    assert 'Menu' not in soup.get_text() and 'Office' not in soup.get_text()
@@ -0,0 +1,33 @@
+"""Per-host token buckets and temporary rate caps."""
+from politeness import HostScheduler
+
+
+def scheduler():
+    return HostScheduler(rate=0.5, host_rates={'nominatim.openstreetmap.org': 1.0}, respect_robots=False)
+
+
+def test_requests_beyond_the_burst_are_queued():
+    hosts = scheduler()
+    assert hosts.reserve('https://example.org/a') == 0.0
+    assert hosts.reserve('https://example.org/b') > 1.9
+    assert hosts.reserve('https://other.example.org/') == 0.0
+
+
+def test_slowed_only_lowers_and_restores_the_rate():
+    hosts = scheduler()
+    hosts.reserve('nominatim.openstreetmap.org')
+    with hosts.slowed('nominatim.openstreetmap.org', 10.0) as rate:
+        assert rate == 1.0
+    with hosts.slowed('nominatim.openstreetmap.org', 0.25) as rate:
+        assert rate == 0.25
+        assert hosts._bucket('nominatim.openstreetmap.org').rate == 0.25
+    assert hosts._bucket('nominatim.openstreetmap.org').rate == 1.0
+    assert hosts.host_rates['nominatim.openstreetmap.org'] == 1.0
+
+
+def test_slowed_host_without_override_returns_to_default():
+    hosts = scheduler()
+    with hosts.slowed('example.org', 0.1):
+        assert hosts._bucket('example.org').rate == 0.1
+    assert 'example.org' not in hosts.host_rates
+    assert hosts._bucket('example.org').rate == 0.5
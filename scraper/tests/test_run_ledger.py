@@ -0,0 +1,39 @@
+"""Run ledger checkpoints: resuming, failed dioceses and parsed-page reuse."""
+from run_ledger import RunLedger
+
+PARISH = {'name': 'St. Thérèse', 'city': 'Lexington'}
+
+
+def test_resume_skips_finished_dioceses_and_reuses_pages(tmp_path):
+    ledger = RunLedger(str(tmp_path / 'ledger.db'))
+    run_id = ledger.start_run(['Lexington', 'Louisville', 'Covington'], {'workers': 2})
+    ledger.mark_url('Lexington', 'https://cdlex.org/st-therese', 'parsed', PARISH)
+    ledger.mark_url('Louisville', 'https://archlou.org/st-paul', 'fetched')
+    ledger.finish_diocese('Lexington', 'success', parishes=1)
+    ledger.finish_diocese('Covington', 'failed', error='timeout')
+    ledger.close()
+
+    # An interrupted run is reopened by a new process
+    ledger = RunLedger(str(tmp_path / 'ledger.db'))
+    assert ledger.resume_run() == run_id
+    assert sorted(ledger.remaining_dioceses()) == ['Covington', 'Louisville']
+    assert ledger.parsed('https://cdlex.org/st-therese') == PARISH
+    assert ledger.parsed('https://archlou.org/st-paul') is None
+    assert ledger.summary() == {'dioceses': {'failed': 1, 'pending': 1, 'saved': 1},
+                                'urls': {'fetched': 1, 'saved': 1}}
+
+    ledger.mark_geocoded(waiting=[])
+    ledger.finish_run()
+    assert ledger.resume_run() is None
+
+
+def test_failed_dioceses_uses_latest_attempt(tmp_path):
+    ledger = RunLedger(str(tmp_path / 'ledger.db'))
+    ledger.start_run(['Lexington', 'Covington'])
+    ledger.finish_diocese('Lexington', 'failed')
+    ledger.finish_diocese('Covington', 'partial')
+    ledger.finish_run()
+
+    ledger.start_run(['Lexington'])
+    ledger.finish_diocese('Lexington', 'success')
+    assert ledger.failed_dioceses() == ['Covington']
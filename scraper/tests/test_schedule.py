@@ -0,0 +1,62 @@
+"""Mass schedule parsing (schedule.py)."""
+from schedule import MassTime, format_time, parse_schedule, schedule_text, worship_times
+
+SUN, MON, FRI, SAT = 0, 1, 5, 6
+
+
+def times(text):
+    return [(m.weekday, format_time(m.minute_of_day), m.type, m.language) for m in parse_schedule(text)]
+
+
+def test_module_docstring_example():
+    text = ("Saturday: 5:00 PM (Vigil) Sunday: 8, 10:30 AM, 12:30 PM (Spanish)\n"
+            "Weekdays: Mon-Fri 12:10 PM  Confessions: Sat 3:30-4:30 PM")
+    assert times(text) == [
+        (SAT, '5:00 PM', 'Mass', None),
+        (SUN, '8:00 AM', 'Mass', None),
+        (SUN, '10:30 AM', 'Mass', None),
+        (SUN, '12:30 PM', 'Mass', 'Spanish'),
+    ] + [(day, '12:10 PM', 'Mass', None) for day in range(MON, FRI + 1)] + [
+        (SAT, '3:30 PM', 'Confession', None),
+    ]
+
+
+def test_day_lists_and_groups():
+    assert times("Sat & Sun 9 AM") == [(SAT, '9:00 AM', 'Mass', None), (SUN, '9:00 AM', 'Mass', None)]
+    assert [t[0] for t in times("Daily 7 AM")] == [1, 2, 3, 4, 5]
+
+
+def test_language_prefix_and_annotation():
+    assert times("Spanish Mass: Sunday 1 PM") == [(SUN, '1:00 PM', 'Mass', 'Spanish')]
+    assert times("Sunday 1 PM (Spanish)") == [(SUN, '1:00 PM', 'Mass', 'Spanish')]
+
+
+def test_language_before_service_word_is_a_prefix():
+    assert times("Sunday 10 AM, Spanish Mass 1 PM") == [
+        (SUN, '10:00 AM', 'Mass', None),
+        (SUN, '1:00 PM', 'Mass', 'Spanish'),
+    ]
+
+
+def test_unspaced_ranges_record_their_start():
+    assert times("Sun 6-7 AM") == [(SUN, '6:00 AM', 'Mass', None)]
+    assert times("Confession Sat 11-12") == [(SAT, '11:00 AM', 'Confession', None)]
+    assert times("Sat 3:30-4:30 PM") == [(SAT, '3:30 PM', 'Mass', None)]
+    assert times("Sat 11-1 PM") == [(SAT, '11:00 AM', 'Mass', None)]
+
+
+def test_non_worship_text_is_ignored():
+    assert times("Office hours: Mon 9 AM") == []
+    assert times("Call 859-253-1993") == []
+
+
+def test_structured_values():
+    assert schedule_text({'Sunday': ['8:00 AM', '10:30 AM']}) == "Sunday: 8:00 AM, 10:30 AM"
+    assert parse_schedule('{"Sunday": ["8:00 AM"]}') == [MassTime(SUN, 480, 'Mass')]
+
+
+def test_worship_times_shape():
+    assert worship_times([MassTime(SUN, 750, 'Mass', 'Spanish'), MassTime(SAT, 1020, 'Mass')]) == [
+        {'day': 'Sunday', 'time': '12:30 PM', 'type': 'Mass', 'language': 'Spanish'},
+        {'day': 'Saturday', 'time': '5:00 PM', 'type': 'Mass'},
+    ]
@@ -0,0 +1,45 @@
+"""Seed file reading, validation and loading."""
+import pytest
+
+import seed
+
+
+def test_validate_record_normalizes_values():
+    parish = seed.validate_record({'name': ' St. Paul ', 'diocese': 'Lexington', 'zip': 40502,
+                                   'latitude': '38.04', 'longitude': -84.5, 'phone': ''})
+    assert parish == {'name': 'St. Paul', 'diocese': 'Lexington', 'zip': '40502',
+                      'latitude': 38.04, 'longitude': -84.5}
+
+
+@pytest.mark.parametrize('record, message', [
+    ({'name': 'St. Paul'}, 'missing diocese'),
+    ({'name': 'St. Paul', 'diocese': 'Lexington', 'parish': 'x'}, "unknown field 'parish'"),
+    ({'name': 'St. Paul', 'diocese': 'Lexington', 'latitude': 91, 'longitude': 0}, 'out of range'),
+    ({'name': 'St. Paul', 'diocese': 'Lexington', 'latitude': 38.0}, 'together'),
+    ({'name': 'St. Paul', 'diocese': 'Lexington', 'zip': True}, 'unsupported type'),
+])
+def test_validate_record_rejects(record, message):
+    with pytest.raises(ValueError, match=message):
+        seed.validate_record(record)
+
+
+def test_csv_with_byte_order_mark(tmp_path):
+    path = tmp_path / 'parishes.csv'
+    path.write_bytes('\ufeffname,diocese,city\nSt. Paul,Lexington,Lexington\n'.encode('utf-8'))
+    records = [record for _, record in seed.read_records(path)]
+    assert records == [{'name': 'St. Paul', 'diocese': 'Lexington', 'city': 'Lexington'}]
+
+
+def test_insert_only_keeps_stored_rows(db, tmp_path):
+    db.upsert_parish({'name': 'St. Paul', 'diocese': 'Lexington', 'phone': '(859) 555-0000'})
+    path = tmp_path / 'parishes.jsonl'
+    path.write_text('{"name": "St. Paul", "diocese": "Lexington", "phone": "old"}\n'
+                    '{"name": "St. Peter", "diocese": "Lexington"}\n', encoding='utf-8')
+
+    summary = seed.seed_files(db, [path], insert_only=True)
+    assert (summary['inserted'], summary['updated'], summary['unchanged']) == (1, 0, 1)
+    assert db.cursor.execute("SELECT phone FROM parishes WHERE name = 'St. Paul'").fetchone()[0] \
+        == '(859) 555-0000'
+
+    summary = seed.seed_files(db, [path])
+    assert summary['updated'] == 1
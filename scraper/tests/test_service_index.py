@@ -0,0 +1,39 @@
+"""service_index stays in step with schedule and location changes."""
+from datetime import datetime, timezone
+
+PARISH = {'name': 'St. Paul', 'diocese': 'Diocese of Lexington', 'state': 'KY',
+          'latitude': 38.04, 'longitude': -84.50, 'mass_times': 'Sunday 9:00 AM'}
+# Saturday 12:00 in Lexington
+SATURDAY_NOON = datetime(2024, 6, 8, 16, 0, tzinfo=timezone.utc)
+
+
+def next_time(db):
+    services = db.next_services(38.04, -84.50, after=SATURDAY_NOON)
+    return [(service['day'], service['time']) for service in services]
+
+
+def test_upserted_schedule_updates_index(db):
+    db.upsert_parish(PARISH)
+    db.rebuild_service_index()
+    assert next_time(db) == [('Sunday', '9:00 AM')]
+
+    assert db.upsert_parish({**PARISH, 'mass_times': 'Saturday 5:00 PM'}) == 'updated'
+    assert next_time(db) == [('Saturday', '5:00 PM')]
+
+
+def test_geocoded_parish_joins_index(db):
+    db.upsert_parish({**PARISH, 'latitude': None, 'longitude': None})
+    db.upsert_parish({**PARISH, 'name': 'St. Peter', 'mass_times': 'Sunday 11:00 AM'})
+    db.rebuild_service_index()
+    assert next_time(db) == [('Sunday', '11:00 AM')]
+
+    parish_id = db.cursor.execute("SELECT id FROM parishes WHERE name = 'St. Paul'").fetchone()[0]
+    db.complete_geocode(parish_id, (38.04, -84.50))
+    assert next_time(db) == [('Sunday', '9:00 AM'), ('Sunday', '11:00 AM')]
+
+
+def test_deleted_parish_leaves_index(db):
+    db.upsert_parish(PARISH)
+    db.rebuild_service_index()
+    db.cursor.execute("DELETE FROM parishes")
+    assert db.cursor.execute("SELECT COUNT(*) FROM service_index").fetchone()[0] == 0
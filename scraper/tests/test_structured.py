@@ -0,0 +1,64 @@
+"""schema.org structured data on listing and detail pages."""
+from bs4 import BeautifulSoup
+
+from scrapers.generic import GenericScraper
+from scrapers.structured import extract_structured
+
+CATHEDRAL = ('<script type="application/ld+json">'
+             '{"@type": "CatholicChurch", "name": "Cathedral of Christ the King",'
+             ' "address": {"streetAddress": "299 Colony Blvd", "addressLocality": "Lexington",'
+             ' "addressRegion": "KY", "postalCode": "40502"}}</script>')
+OFFICE = ('<script type="application/ld+json">'
+          '{"@type": "Place", "name": "Catholic Center", "telephone": "859-253-1993"}</script>')
+
+
+def soup(html):
+    return BeautifulSoup(html, 'html.parser')
+
+
+def scraper():
+    return GenericScraper('Diocese of Lexington', 'KY', parser='html.parser')
+
+
+def test_plain_place_is_not_a_parish():
+    parishes = extract_structured(soup(CATHEDRAL + OFFICE))
+    assert [parish['name'] for parish in parishes] == ['Cathedral of Christ the King']
+    assert parishes[0]['city'] == 'Lexington'
+
+
+def test_listing_uses_containers_when_structured_data_has_fewer():
+    page = soup(CATHEDRAL + ''.join(
+        f'<div class="parish"><h3>St. Paul {n}</h3><address>{n} Main St, Lexington, KY 40502</address></div>'
+        for n in range(3)))
+    parishes = scraper().parishes_from_page(page, 'https://example.org/parishes')
+    assert [parish['name'] for parish in parishes] == ['St. Paul 0', 'St. Paul 1', 'St. Paul 2']
+
+
+def test_listing_follows_links_when_structured_data_has_fewer():
+    page = soup(CATHEDRAL)
+    assert scraper().parishes_from_page(page, 'https://example.org/parishes', detail_links=12) == []
+    assert len(scraper().parishes_from_page(page, 'https://example.org/parishes')) == 1
+
+
+def test_detail_page_fills_gaps_from_markup():
+    class Canned(GenericScraper):
+        def fetch_page(self, url, max_retries=3, parse_only=None, conditional=True):
+            return soup(CATHEDRAL + '<h1>Cathedral</h1><p class="phone">(859) 268-2861</p>')
+
+    record = Canned('Diocese of Lexington', 'KY', parser='html.parser').scrape_parish_detail(
+        'https://example.org/cathedral')
+    assert record['name'] == 'Cathedral of Christ the King'
+    assert record['phone'] == '(859) 268-2861'
+    assert record['diocese'] == 'Diocese of Lexington'
+
+
+def test_structured_listing_skips_the_field_heuristics():
+    class Counting(GenericScraper):
+        def extract_fields(self, element, source_url):
+            raise AssertionError('structured data should have been enough')
+
+    page = soup(CATHEDRAL + CATHEDRAL.replace('Cathedral of Christ the King', 'St. Paul')
+                + '<div class="parish"><h3>Cathedral of Christ the King</h3></div>')
+    parishes = Counting('Diocese of Lexington', 'KY', parser='html.parser').parishes_from_page(
+        page, 'https://example.org/parishes')
+    assert [parish['name'] for parish in parishes] == ['Cathedral of Christ the King', 'St. Paul']
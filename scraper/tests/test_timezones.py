@@ -0,0 +1,37 @@
+"""Parish time zones and local week minutes."""
+from datetime import datetime, timezone
+
+import pytest
+
+import timezones
+from timezones import timezone_for, week_minute
+
+
+@pytest.fixture(autouse=True)
+def no_timezonefinder(monkeypatch):
+    """Exercise the fallback tables whether or not timezonefinder is installed."""
+    monkeypatch.setattr(timezones, '_finder', None)
+
+
+def test_us_states_and_split_states():
+    assert timezone_for(38.04, -84.50, 'KY') == 'America/New_York'
+    assert timezone_for(37.77, -87.11, 'KY') == 'America/Chicago'
+    assert timezone_for(47.61, -122.33, 'WA', 'United States') == 'America/Los_Angeles'
+
+
+def test_country_is_checked_before_state_codes():
+    assert timezone_for(-31.95, 115.86, 'WA', 'Australia') == 'Australia/Perth'
+    assert timezone_for(14.60, 120.98, 'Metro Manila', 'Philippines') == 'Asia/Manila'
+    assert timezone_for(45.50, -73.57, 'QC', 'Canada') == 'America/Toronto'
+    assert timezone_for(41.90, 12.45, None, 'Vatican City') == 'Europe/Vatican'
+
+
+def test_unknown_country_ignores_state_table():
+    assert timezone_for(0.0, 75.0, 'IN', 'Maldives') == 'Etc/GMT-5'
+
+
+def test_week_minute_uses_local_time():
+    # Monday 02:30 UTC is Sunday 22:30 in New York (EDT)
+    moment = datetime(2024, 6, 3, 2, 30, tzinfo=timezone.utc)
+    assert week_minute(moment, 'America/New_York') == 22 * 60 + 30
+    assert week_minute(moment, 'Europe/Rome') == 1440 + 4 * 60 + 30
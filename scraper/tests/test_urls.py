@@ -0,0 +1,38 @@
+"""URL canonicalization and how detail pages are deduplicated by it."""
+from bs4 import BeautifulSoup
+
+from scrapers.base_scraper import BaseScraper
+from scrapers.urls import canonicalize_url
+
+
+def test_canonicalize_url_docstring_example():
+    assert (canonicalize_url("HTTPS://Example.org:443/parishes/./st-mary/?utm_source=x#map")
+            == "https://example.org/parishes/st-mary")
+
+
+def test_canonicalize_url_resolves_and_sorts_query():
+    assert canonicalize_url('st-mary?b=2&a=1&fbclid=z', 'http://example.org:8080/parishes/') \
+        == 'http://example.org:8080/parishes/st-mary?a=1&b=2'
+    assert canonicalize_url('https://example.org') == 'https://example.org/'
+
+
+def test_iter_details_fetches_original_urls_once():
+    scraper = BaseScraper('Diocese of Test', 'KY', parser='html.parser')
+    fetched = []
+
+    def scrape(url):
+        fetched.append(url)
+        return {'name': url}
+
+    urls = ['https://Example.org/Parish/St-Mary/', 'https://example.org/Parish/St-Mary',
+            'https://example.org/parish?id=2&x=1']
+    list(scraper.iter_details(urls, scrape, workers=1))
+    assert fetched == ['https://Example.org/Parish/St-Mary/', 'https://example.org/parish?id=2&x=1']
+
+
+def test_parish_links_keep_their_original_form():
+    soup = BeautifulSoup('<a href="/Parish/St-Mary/#map">St. Mary</a><a href="/Parish/St-Mary">again</a>',
+                         'html.parser')
+    scraper = BaseScraper('Diocese of Test', 'KY', parser='html.parser')
+    assert scraper.find_parish_links(soup, 'https://example.org/parishes') == [
+        'https://example.org/Parish/St-Mary/']
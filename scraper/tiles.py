@@ -0,0 +1,33 @@
+"""Fixed latitude/longitude grid shared by the tile export and the service index."""
+import math
+from typing import Iterator, List
+
+# Tile edge length in degrees (1 degree of latitude is ~69 miles)
+TILE_DEGREES = 1.0
+
+
+def tile_key(latitude: float, longitude: float, tile_size: float = TILE_DEGREES) -> str:
+    """Return the grid tile key ("<row>_<col>") containing a coordinate."""
+    row = int(math.floor((latitude + 90) / tile_size))
+    col = int(math.floor((longitude + 180) / tile_size))
+    return f"{row}_{col}"
+
+
+def tile_bounds(key: str, tile_size: float = TILE_DEGREES) -> List[float]:
+    """Return [south, west, north, east] for a tile key."""
+    row, col = (int(part) for part in key.split('_'))
+    south = row * tile_size - 90
+    west = col * tile_size - 180
+    return [south, west, south + tile_size, west + tile_size]
+
+
+def tiles_in_box(south: float, north: float, west: float, east: float,
+                 tile_size: float = TILE_DEGREES) -> Iterator[str]:
+    """Yield the keys of every tile overlapping a bounding box."""
+    first_row = int(math.floor((south + 90) / tile_size))
+    last_row = int(math.floor((north + 90) / tile_size))
+    first_col = int(math.floor((west + 180) / tile_size))
+    last_col = int(math.floor((east + 180) / tile_size))
+    for row in range(first_row, last_row + 1):
+        for col in range(first_col, last_col + 1):
+            yield f"{row}_{col}"
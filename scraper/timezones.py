@@ -0,0 +1,167 @@
+"""Resolve a parish's IANA time zone from its coordinates.
+
+Schedules are stored in local parish time, so answering "next Mass after
+T" needs each parish's zone. ``timezonefinder`` (in requirements.txt)
+gives exact answers. Without it, the parish's country picks the zone,
+with longitude splits for the large countries that span several; US
+parishes use their state's zone instead, split the same way for the
+states that span two. The country is checked first because state codes
+collide (WA is also Western Australia). Anything else falls back to a
+fixed offset from longitude, which ignores daylight saving time.
+"""
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+from zoneinfo import ZoneInfo
+
+try:
+    from timezonefinder import TimezoneFinder
+except ImportError:  # In requirements.txt; the tables below are the fallback
+    TimezoneFinder = None
+
+MINUTES_PER_DAY = 24 * 60
+WEEK_MINUTES = 7 * MINUTES_PER_DAY
+
+EASTERN = 'America/New_York'
+CENTRAL = 'America/Chicago'
+MOUNTAIN = 'America/Denver'
+PACIFIC = 'America/Los_Angeles'
+
+# Dominant zone of each state and territory
+STATE_TIMEZONES = {
+    'AL': CENTRAL, 'AK': 'America/Anchorage', 'AZ': 'America/Phoenix', 'AR': CENTRAL,
+    'CA': PACIFIC, 'CO': MOUNTAIN, 'CT': EASTERN, 'DE': EASTERN, 'DC': EASTERN,
+    'FL': EASTERN, 'GA': EASTERN, 'HI': 'Pacific/Honolulu', 'ID': 'America/Boise',
+    'IL': CENTRAL, 'IN': 'America/Indiana/Indianapolis', 'IA': CENTRAL, 'KS': CENTRAL,
+    'KY': EASTERN, 'LA': CENTRAL, 'ME': EASTERN, 'MD': EASTERN, 'MA': EASTERN,
+    'MI': 'America/Detroit', 'MN': CENTRAL, 'MS': CENTRAL, 'MO': CENTRAL, 'MT': MOUNTAIN,
+    'NE': CENTRAL, 'NV': PACIFIC, 'NH': EASTERN, 'NJ': EASTERN, 'NM': MOUNTAIN,
+    'NY': EASTERN, 'NC': EASTERN, 'ND': CENTRAL, 'OH': EASTERN, 'OK': CENTRAL,
+    'OR': PACIFIC, 'PA': EASTERN, 'RI': EASTERN, 'SC': EASTERN, 'SD': CENTRAL,
+    'TN': CENTRAL, 'TX': CENTRAL, 'UT': MOUNTAIN, 'VT': EASTERN, 'VA': EASTERN,
+    'WA': PACIFIC, 'WV': EASTERN, 'WI': CENTRAL, 'WY': MOUNTAIN,
+    'PR': 'America/Puerto_Rico', 'GU': 'Pacific/Guam', 'VI': 'America/St_Thomas',
+}
+
+# Countries the state table applies to (parishes.country defaults to 'United States')
+US_NAMES = frozenset({'united states', 'united states of america', 'usa', 'us'})
+
+# Zone of each single-zone country, keyed by lowercased name as stored in
+# parishes.country
+COUNTRY_TIMEZONES = {
+    'angola': 'Africa/Luanda', 'argentina': 'America/Argentina/Buenos_Aires',
+    'austria': 'Europe/Vienna', 'belgium': 'Europe/Brussels', 'bolivia': 'America/La_Paz',
+    'cameroon': 'Africa/Douala', 'chile': 'America/Santiago', 'colombia': 'America/Bogota',
+    'costa rica': 'America/Costa_Rica', 'croatia': 'Europe/Zagreb', 'cuba': 'America/Havana',
+    'czech republic': 'Europe/Prague', 'czechia': 'Europe/Prague',
+    'dominican republic': 'America/Santo_Domingo', 'ecuador': 'America/Guayaquil',
+    'el salvador': 'America/El_Salvador', 'england': 'Europe/London', 'france': 'Europe/Paris',
+    'germany': 'Europe/Berlin', 'ghana': 'Africa/Accra', 'guatemala': 'America/Guatemala',
+    'haiti': 'America/Port-au-Prince', 'honduras': 'America/Tegucigalpa',
+    'hungary': 'Europe/Budapest', 'india': 'Asia/Kolkata', 'ireland': 'Europe/Dublin',
+    'italy': 'Europe/Rome', 'japan': 'Asia/Tokyo', 'kenya': 'Africa/Nairobi',
+    'lebanon': 'Asia/Beirut', 'lithuania': 'Europe/Vilnius', 'malawi': 'Africa/Blantyre',
+    'malaysia': 'Asia/Kuala_Lumpur', 'malta': 'Europe/Malta', 'netherlands': 'Europe/Amsterdam',
+    'new zealand': 'Pacific/Auckland', 'nicaragua': 'America/Managua', 'nigeria': 'Africa/Lagos',
+    'panama': 'America/Panama', 'paraguay': 'America/Asuncion', 'peru': 'America/Lima',
+    'philippines': 'Asia/Manila', 'poland': 'Europe/Warsaw', 'portugal': 'Europe/Lisbon',
+    'puerto rico': 'America/Puerto_Rico', 'rwanda': 'Africa/Kigali', 'scotland': 'Europe/London',
+    'singapore': 'Asia/Singapore', 'slovakia': 'Europe/Bratislava', 'slovenia': 'Europe/Ljubljana',
+    'south africa': 'Africa/Johannesburg', 'south korea': 'Asia/Seoul', 'spain': 'Europe/Madrid',
+    'sri lanka': 'Asia/Colombo', 'switzerland': 'Europe/Zurich', 'tanzania': 'Africa/Dar_es_Salaam',
+    'timor-leste': 'Asia/Dili', 'uganda': 'Africa/Kampala', 'united kingdom': 'Europe/London',
+    'uk': 'Europe/London', 'uruguay': 'America/Montevideo', 'vatican city': 'Europe/Vatican',
+    'venezuela': 'America/Caracas', 'vietnam': 'Asia/Ho_Chi_Minh', 'wales': 'Europe/London',
+    'zambia': 'Africa/Lusaka',
+}
+
+# Countries spanning several zones: (western boundary longitude, zone) from
+# east to west; the first boundary west of the parish wins. Straight-line
+# approximations like SPLIT_STATES below.
+SPLIT_COUNTRIES = {
+    'australia': [(141.0, 'Australia/Sydney'), (129.0, 'Australia/Adelaide'),
+                  (-180.0, 'Australia/Perth')],
+    'brazil': [(-54.0, 'America/Sao_Paulo'), (-67.0, 'America/Manaus'),
+               (-180.0, 'America/Rio_Branco')],
+    'canada': [(-57.0, 'America/St_Johns'), (-64.0, 'America/Halifax'),
+               (-90.0, 'America/Toronto'), (-102.0, 'America/Winnipeg'),
+               (-110.0, 'America/Regina'), (-120.0, 'America/Edmonton'),
+               (-180.0, 'America/Vancouver')],
+    'indonesia': [(127.0, 'Asia/Jayapura'), (115.0, 'Asia/Makassar'), (-180.0, 'Asia/Jakarta')],
+    'mexico': [(-105.5, 'America/Mexico_City'), (-114.7, 'America/Mazatlan'),
+               (-180.0, 'America/Tijuana')],
+}
+
+# States split between two zones: (axis, boundary, zone below, zone at/above).
+# The boundaries are straight-line approximations of county lines.
+SPLIT_STATES = {
+    'FL': ('longitude', -85.0, CENTRAL, EASTERN),
+    'ID': ('latitude', 45.5, 'America/Boise', PACIFIC),
+    'IN': ('longitude', -86.7, CENTRAL, 'America/Indiana/Indianapolis'),
+    'KS': ('longitude', -101.5, MOUNTAIN, CENTRAL),
+    'KY': ('longitude', -85.9, CENTRAL, EASTERN),
+    'MI': ('longitude', -87.6, CENTRAL, 'America/Detroit'),
+    'ND': ('longitude', -101.0, MOUNTAIN, CENTRAL),
+    'NE': ('longitude', -101.3, MOUNTAIN, CENTRAL),
+    'SD': ('longitude', -100.5, MOUNTAIN, CENTRAL),
+    'TN': ('longitude', -85.0, CENTRAL, EASTERN),
+    'TX': ('longitude', -104.9, MOUNTAIN, CENTRAL),
+}
+
+_finder = TimezoneFinder() if TimezoneFinder else None
+
+
+def timezone_for(latitude: float, longitude: float, state: Optional[str] = None,
+                 country: Optional[str] = None) -> str:
+    """
+    Return the IANA zone name for a parish location.
+
+    Args:
+        latitude: Parish latitude
+        longitude: Parish longitude
+        state: Two-letter state code, used when timezonefinder is missing
+        country: Country name, used when timezonefinder is missing; the
+            state table only applies to US (or unknown) countries
+
+    Returns:
+        Zone name such as "America/Chicago" (or "Etc/GMT+5" as a last resort)
+    """
+    if _finder:
+        name = _finder.timezone_at(lat=latitude, lng=longitude)
+        if name:
+            return name
+
+    country = (country or '').strip().lower()
+    if country in COUNTRY_TIMEZONES:
+        return COUNTRY_TIMEZONES[country]
+    if country in SPLIT_COUNTRIES:
+        return next(name for boundary, name in SPLIT_COUNTRIES[country] if longitude >= boundary)
+
+    state = (state or '').strip().upper() if not country or country in US_NAMES else ''
+    if state in SPLIT_STATES:
+        axis, boundary, below, above = SPLIT_STATES[state]
+        value = latitude if axis == 'latitude' else longitude
+        return below if value < boundary else above
+    if state in STATE_TIMEZONES:
+        return STATE_TIMEZONES[state]
+
+    # Etc/GMT signs are inverted: Etc/GMT+5 is UTC-5
+    offset = round(longitude / 15)
+    return 'Etc/GMT' if offset == 0 else f"Etc/GMT{-offset:+d}"
+
+
+@lru_cache(maxsize=None)
+def zone(name: str) -> ZoneInfo:
+    """Cached ZoneInfo for a zone name."""
+    return ZoneInfo(name)
+
+
+def week_minute(moment: datetime, timezone_name: str) -> int:
+    """
+    Minute of the local week (0 = Sunday 00:00) of an aware datetime.
+
+    Matches mass_schedule's numbering: weekday * 1440 + minute_of_day.
+    """
+    local = moment.astimezone(zone(timezone_name))
+    weekday = (local.weekday() + 1) % 7  # datetime counts from Monday
+    return weekday * MINUTES_PER_DAY + local.hour * 60 + local.minute